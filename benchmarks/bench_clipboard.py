@@ -0,0 +1,85 @@
+"""
+BENCHMARK: Zwischenablage nach Strg+C - feste Wartezeit vs. adaptives Lesen
+
+Simuliert Programme, deren Strg+C nach 5 bis 400 ms in der Zwischenablage
+landet (Fake-Zwischenablage, kein echtes Strg+C). Verglichen werden die
+frühere feste Wartezeit (200 ms, dann lesen) und ClipboardCapture
+(Änderung prüfen mit wachsendem Abstand, max. 1000 ms). Gezeigt werden
+Wartezeit und ob der NEUE Text gelesen wurde.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_clipboard.py
+"""
+
+import os
+import sys
+import time
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.clipboard import ClipboardBackend, ClipboardCapture
+
+COPY_LATENCIES_MS = [5, 20, 50, 150, 400]
+FIXED_DELAY = 0.2
+REPEAT = 5
+
+
+class SlowCopyClipboard(ClipboardBackend):
+    """Zwischenablage im Speicher, neuer Inhalt erscheint verzögert"""
+
+    def __init__(self):
+        self.text = "alter Inhalt"
+
+    def paste(self):
+        return self.text
+
+    def copy(self, text):
+        self.text = text
+
+    def copy_later(self, text, delay):
+        threading.Timer(delay, self.copy, args=(text,)).start()
+
+
+def fixed_delay(latency):
+    clipboard = SlowCopyClipboard()
+    start = time.perf_counter()
+    clipboard.copy_later("markierter Text", latency)
+    time.sleep(FIXED_DELAY)
+    text = clipboard.paste()
+    elapsed = time.perf_counter() - start
+    time.sleep(max(0.0, latency - elapsed) + 0.01)   # Timer auslaufen lassen
+    return elapsed, text == "markierter Text"
+
+
+def adaptive(latency):
+    clipboard = SlowCopyClipboard()
+    capture = ClipboardCapture(clipboard, timeout=1.0)
+    content = capture.capture(lambda: clipboard.copy_later("markierter Text", latency))
+    return content.waited, content.text == "markierter Text"
+
+
+def main():
+    print("=" * 64)
+    print(f"BENCHMARK: Zwischenablage nach Strg+C ({REPEAT} Wiederholungen)")
+    print("=" * 64)
+    print(f"{'Strg+C dauert':>14} {'fest 200ms':>12} {'richtig':>8} {'adaptiv':>10} {'richtig':>8}")
+    print("-" * 64)
+
+    for latency_ms in COPY_LATENCIES_MS:
+        latency = latency_ms / 1000
+        fixed = [fixed_delay(latency) for _ in range(REPEAT)]
+        adapt = [adaptive(latency) for _ in range(REPEAT)]
+        fixed_ms = sum(t for t, _ in fixed) / REPEAT * 1000
+        adapt_ms = sum(t for t, _ in adapt) / REPEAT * 1000
+        print(
+            f"{latency_ms:>12}ms {fixed_ms:>10.0f}ms {sum(ok for _, ok in fixed):>6}/{REPEAT} "
+            f"{adapt_ms:>8.0f}ms {sum(ok for _, ok in adapt):>6}/{REPEAT}"
+        )
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+BENCHMARK: Konfliktauflösung bei dichten Zahlen-Treffern (paarweise vs. Sweep-Line)
+
+Synthetischer "Kontoauszug": Zeilen voller Ziffernfolgen, auf die Telefon-,
+IBAN-, Kreditkarten-, Steuer-ID-, SV-Nummer- und Datums-Patterns gleichzeitig
+und überlappend anschlagen. Die Kandidaten kommen aus der Fused Pattern
+Engine (ohne Score-Filter). Gemessen wird nur die Konfliktauflösung:
+Presidio's paarweiser Vergleich (AnonymizerEngine, O(n²)) gegen
+spans.resolve_conflicts (Sortieren + Sweep-Line). Der Faktor zwischen zwei
+Größen zeigt das Wachstum: ~4x bei vierfacher Länge = linear, ~16x = quadratisch.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_conflicts.py
+    python benchmarks/bench_conflicts.py --sizes 100,400,1600
+"""
+
+import os
+import sys
+import copy
+import time
+import random
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities import RecognizerResult
+
+from src.pattern_engine import FusedPatternEngine
+from src.patterns import ENTITY_PRIORITY
+from src.spans import Span, resolve_conflicts
+
+
+def dense_number_text(lines: int, seed: int = 1) -> str:
+    """Zeilen wie in Kontoauszügen / Grundbuchauszügen: fast nur Ziffern"""
+    rng = random.Random(seed)
+
+    def digits(count):
+        return "".join(rng.choice("0123456789") for _ in range(count))
+
+    rows = []
+    for _ in range(lines):
+        rows.append(
+            f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.2024 DE{digits(2)} {digits(4)} {digits(4)} "
+            f"{digits(4)} {digits(4)} {digits(2)} 0{digits(3)} {digits(7)} {digits(2)}/{digits(3)}/{digits(5)} "
+            f"{digits(2)} {digits(6)} A {digits(3)} {digits(4)} {digits(4)} {digits(4)} {digits(4)} {digits(11)}"
+        )
+    return "\n".join(rows)
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Konfliktauflösung: paarweise vs. Sweep-Line")
+    parser.add_argument("--sizes", default="50,200,800", help="Zeilen pro Dokument (kommagetrennt)")
+    args = parser.parse_args()
+
+    engine = AnonymizerEngine()
+    pattern_engine = FusedPatternEngine()
+
+    print("=" * 70)
+    print("BENCHMARK: Konfliktauflösung bei dichten Zahlen-Treffern")
+    print("=" * 70)
+    print(f"{'Zeilen':>7} {'Kandidaten':>11} | {'paarweise':>11} {'Faktor':>7} | {'Sweep-Line':>11} {'Faktor':>7}")
+    print("-" * 70)
+
+    previous = None
+    for lines in (int(size) for size in args.sizes.split(",")):
+        text = dense_number_text(lines)
+        candidates = [
+            RecognizerResult(r.entity_type, r.start, r.end, r.score) for r in pattern_engine.analyze(text)
+        ]
+
+        pairwise, _ = timed(
+            lambda: engine._remove_conflicts_and_get_text_manipulation_data(copy.deepcopy(candidates), None)
+        )
+        spans = [Span(r.entity_type, r.start, r.end, r.score) for r in candidates]
+        sweep, resolved = timed(lambda: resolve_conflicts(text, spans, ENTITY_PRIORITY))
+        assert all(a.end <= b.start for a, b in zip(resolved, resolved[1:])), "Überlappung übrig!"
+
+        if previous is None:
+            factors = ("", "")
+        else:
+            factors = (f"{pairwise / previous[0]:.1f}x", f"{sweep / previous[1]:.1f}x")
+        print(
+            f"{lines:>7} {len(candidates):>11} | {pairwise * 1000:>9.1f}ms {factors[0]:>7} | "
+            f"{sweep * 1000:>9.1f}ms {factors[1]:>7}"
+        )
+        previous = (pairwise, sweep)
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+BENCHMARK: Fused Pattern Engine vs. Presidio-Registry (fast-Modus)
+
+Vergleicht AnalyzerEngine.analyze (~15 PatternRecognizer) mit
+FusedPatternEngine.analyze auf test_notarschreiben.txt in mehreren Größen
+und prüft, dass beide exakt dieselben Treffer liefern.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_fused_engine.py
+"""
+
+import os
+import sys
+import time
+import logging
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.anonymizer import TextAnonymizer, DummyNlpEngine
+from src.pattern_engine import FusedPatternEngine
+from src.patterns import DEFAULT_ENTITIES
+from presidio_analyzer import AnalyzerEngine
+
+REPEAT = 5
+SIZES = [1, 10, 25]  # Vielfache von test_notarschreiben.txt (~7 KB)
+
+
+def measure(func, repeat=REPEAT):
+    """Führt func mehrfach aus und gibt (Median-Zeit, letztes Ergebnis) zurück"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def as_keys(results):
+    return sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        base_text = f.read()
+
+    anonymizer = TextAnonymizer()
+    presidio = AnalyzerEngine(
+        registry=anonymizer._create_registry(),
+        nlp_engine=DummyNlpEngine(),
+        supported_languages=["en"]
+    )
+    fused = FusedPatternEngine()
+
+    print("=" * 70)
+    print("BENCHMARK: Presidio-Registry vs. Fused Pattern Engine")
+    print("=" * 70)
+    print(f"{'Größe':>10} {'Presidio':>12} {'Fused':>12} {'Speedup':>9} {'Treffer':>9} {'gleich':>7}")
+    print("-" * 70)
+
+    for multiplier in SIZES:
+        text = base_text * multiplier
+
+        presidio_time, presidio_results = measure(
+            lambda: presidio.analyze(text=text, language="de", entities=DEFAULT_ENTITIES)
+        )
+        fused_time, fused_results = measure(
+            lambda: fused.analyze(text=text, entities=DEFAULT_ENTITIES)
+        )
+
+        same = as_keys(presidio_results) == as_keys(fused_results)
+        print(
+            f"{len(text) // 1024:>8} KB {presidio_time * 1000:>10.1f}ms {fused_time * 1000:>10.1f}ms "
+            f"{presidio_time / fused_time:>8.1f}x {len(fused_results):>9} {'ja' if same else 'NEIN':>7}"
+        )
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
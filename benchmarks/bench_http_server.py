@@ -0,0 +1,104 @@
+"""
+BENCHMARK: HTTP-Dienst mit Micro-Batching vs. eine Anfrage nach der anderen
+
+Startet den HTTP-Dienst im Prozess (freier Port) und schickt mit 50
+gleichzeitigen Clients Anfragen an POST /anonymize. Verglichen werden
+max_batch_size = 1 (keine Bündelung) und Micro-Batches mit 32 Texten und
+0 ms (nur bereits wartende Anfragen) bzw. 10 ms Wartezeit.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_http_server.py [Modus]   # fast (Standard), balanced, accurate
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+import http.client
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.anonymizer import TextAnonymizer
+from src.http_server import create_server
+
+CLIENTS = 50
+REQUESTS_PER_CLIENT = 20
+SETTINGS = [("einzeln", 1, 0), ("Batch 0 ms", 32, 0), ("Batch 10 ms", 32, 10)]
+
+
+def client(port, texts, errors):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+    for text in texts:
+        body = json.dumps({"text": text}).encode("utf-8")
+        connection.request("POST", "/anonymize", body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            errors.append(response.status)
+    connection.close()
+
+
+def run(anonymizer, texts, max_batch_size, max_wait_ms):
+    server = create_server(anonymizer, port=0)
+    server.batcher.max_batch_size = max_batch_size
+    server.batcher.max_wait = max_wait_ms / 1000
+    server.batcher.queue.maxsize = CLIENTS * 2
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    errors = []
+    threads = [
+        threading.Thread(target=client, args=(port, texts[i::CLIENTS], errors))
+        for i in range(CLIENTS)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    stats = server.stats()
+    server.shutdown()
+    server.server_close()
+    server.batcher.stop()
+    return elapsed, stats, errors
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    mode = sys.argv[1] if len(sys.argv) > 1 else "fast"
+
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        paragraphs = [p for p in f.read().split("\n\n") if p.strip()]
+
+    total = CLIENTS * REQUESTS_PER_CLIENT
+    # Unterschiedliche Texte, damit der Ergebnis-Cache nicht greift
+    texts = [f"{paragraphs[i % len(paragraphs)]} (Vorgang {i})" for i in range(total)]
+
+    anonymizer = TextAnonymizer()
+    anonymizer.recognition_mode = mode
+    anonymizer.initialize()
+
+    print("=" * 78)
+    print(f"BENCHMARK: HTTP-Dienst, {CLIENTS} Clients, {total} Anfragen, Modus {mode} ({anonymizer.active_engine})")
+    print("=" * 78)
+    print(f"{'':>12} {'Anfr./s':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'Ø Batch':>8} {'Fehler':>7}")
+    print("-" * 78)
+
+    for label, max_batch_size, max_wait_ms in SETTINGS:
+        elapsed, stats, errors = run(anonymizer, texts, max_batch_size, max_wait_ms)
+        latency = stats["latency"]
+        print(
+            f"{label:>12} {total / elapsed:>9.0f} {latency['p50_ms']:>7.1f}ms {latency['p90_ms']:>7.1f}ms "
+            f"{latency['p99_ms']:>7.1f}ms {stats['avg_batch_size']:>8.1f} {len(errors):>7}"
+        )
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
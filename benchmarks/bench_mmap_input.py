@@ -0,0 +1,104 @@
+"""
+BENCHMARK: Spitzen-Arbeitsspeicher bei großen Dateien - read() vs. mmap-Fenster
+
+Erzeugt eine große Textdatei (Standard 10 MB, Argument in MB) aus
+test_notarschreiben.txt und anonymisiert sie in je einem eigenen Prozess:
+
+    read   Datei komplett mit read() einlesen, dann anonymize_stream(text)
+    mmap   anonymize_file(..., use_mmap=True) - Eingabe fensterweise per mmap
+
+Gemessen werden Laufzeit und Spitzen-RSS des Prozesses (ru_maxrss, nur
+Linux/macOS). Geprüft wird, dass beide Ausgaben identisch sind.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_mmap_input.py [MB]
+"""
+
+import os
+import sys
+import time
+import logging
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: Bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def child(mode, source, target):
+    """Läuft im eigenen Prozess, damit ru_maxrss nur diesen Modus misst"""
+    from src import cli
+
+    logging.basicConfig(level=logging.WARNING)
+    anonymizer = cli._create_anonymizer()
+    baseline = peak_rss_mb()
+
+    start = time.perf_counter()
+    if mode == "mmap":
+        cli.anonymize_file(anonymizer, source, target, use_mmap=True)
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            text = f.read()
+        with open(target, "w", encoding="utf-8") as f:
+            for piece in anonymizer.anonymize_stream(text):
+                f.write(piece)
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.3f} {baseline:.1f} {peak_rss_mb():.1f}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(*sys.argv[2:5])
+        return
+
+    try:
+        import resource  # noqa: F401
+    except ImportError:
+        print("übersprungen - ru_maxrss ist unter Windows nicht verfügbar")
+        return
+
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        base = f.read()
+
+    workdir = tempfile.mkdtemp()
+    source = os.path.join(workdir, "korpus.txt")
+    with open(source, "w", encoding="utf-8") as f:
+        written = 0
+        while written < size_mb * 1024 * 1024:
+            f.write(base)
+            written += len(base.encode("utf-8"))
+
+    print("=" * 70)
+    print(f"BENCHMARK: {written / (1024 * 1024):.0f} MB Datei, read() vs. mmap-Fenster")
+    print("=" * 70)
+    print(f"{'':>6} {'Zeit':>8} {'MB/s':>7} {'RSS Start':>10} {'RSS Spitze':>11} {'Zuwachs':>9}")
+    print("-" * 70)
+
+    outputs = {}
+    for mode in ("read", "mmap"):
+        target = os.path.join(workdir, f"ausgabe_{mode}.txt")
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", mode, source, target],
+            capture_output=True, text=True, check=True
+        )
+        elapsed, baseline, peak = (float(value) for value in result.stdout.split()[-3:])
+        print(
+            f"{mode:>6} {elapsed:>7.1f}s {written / (1024 * 1024) / elapsed:>7.2f} "
+            f"{baseline:>8.0f}MB {peak:>9.0f}MB {peak - baseline:>7.0f}MB"
+        )
+        with open(target, "rb") as f:
+            outputs[mode] = f.read()
+
+    print(f"\nAusgabe gleich: {'ja' if outputs['read'] == outputs['mmap'] else 'NEIN'}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""
+BENCHMARK-SUITE: Alle Erkennungs-Modi × Dokumentgrößen, reproduzierbar
+
+Pro Modus (fast, balanced, accurate) wird ein TextAnonymizer im Prozess
+erstellt - config.toml wird NICHT verändert. Ergebnis- und Absatz-Cache sind
+aus, damit jede Wiederholung komplett analysiert. Pro Dokumentgröße (1 KB,
+10 KB, 100 KB, 1 MB aus test_notarschreiben.txt) laufen Aufwärm-Durchläufe
+und N gemessene Wiederholungen (time.perf_counter).
+
+Ausgabe pro Modus und Größe: min/median/p95-Latenz, Zeichen/s (Median),
+Spitzen-Speicher (tracemalloc, separater Durchlauf) und Anzahl Entities.
+Die Ergebnisse werden als JSON geschrieben (inkl. Git-Commit, Versionen,
+Plattform), ein früherer Lauf kann mit --compare gegenübergestellt werden.
+Modi ohne installiertes spaCy-Modell werden übersprungen.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_modes.py
+    python benchmarks/bench_modes.py --modes fast --sizes 1KB,10KB --repeat 20
+    python benchmarks/bench_modes.py --json neu.json --compare alt.json
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.anonymizer import TextAnonymizer
+from src.model_registry import get_model_registry, _current_rss
+from src.patterns import DEFAULT_ENTITIES
+
+MODES = ["fast", "balanced", "accurate"]
+MODE_MODELS = {"balanced": "de_core_news_sm", "accurate": "de_core_news_lg"}
+SIZES = {"1KB": 1024, "10KB": 10 * 1024, "100KB": 100 * 1024, "1MB": 1024 * 1024}
+
+
+def make_document(base: str, size: int) -> str:
+    """Wiederholt den Basistext bis `size` Zeichen und schneidet an einem Leerzeichen"""
+    text = base * (size // len(base) + 1)
+    cut = text.rfind(" ", 0, size)
+    return text[:cut if cut > 0 else size]
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def create_anonymizer(mode: str) -> TextAnonymizer:
+    """Anonymizer für einen Modus, ohne Caches (jede Wiederholung analysiert komplett)"""
+    anonymizer = TextAnonymizer(language="de")
+    anonymizer.recognition_mode = mode
+    anonymizer.result_cache.max_entries = 0
+    anonymizer.use_incremental = False
+    if not anonymizer.initialize():
+        raise RuntimeError(f"Modus {mode} konnte nicht initialisiert werden")
+    return anonymizer
+
+
+def count_entities(anonymizer: TextAnonymizer, text: str) -> int:
+    """Entities nach Whitelist- und Score-Filter"""
+    text_normalized = anonymizer._normalize_multiline_names(text)
+    return len(anonymizer._detect(text_normalized, DEFAULT_ENTITIES))
+
+
+def run_bucket(anonymizer: TextAnonymizer, text: str, warmup: int, repeat: int) -> dict:
+    """Aufwärmen, N gemessene Wiederholungen, dann ein Speicher-Durchlauf"""
+    for _ in range(warmup):
+        anonymizer.anonymize(text)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        anonymizer.anonymize(text)
+        times.append(time.perf_counter() - start)
+
+    # Eigener Durchlauf: tracemalloc verlangsamt und würde die Zeiten verfälschen
+    tracemalloc.start()
+    anonymizer.anonymize(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "chars": len(text),
+        "repeat": repeat,
+        "min_ms": round(min(times) * 1000, 3),
+        "median_ms": round(median * 1000, 3),
+        "p95_ms": round(percentile(times, 95) * 1000, 3),
+        "chars_per_sec": round(len(text) / median) if median else None,
+        "peak_alloc_mb": round(peak / (1024 * 1024), 2),
+        "entities": count_entities(anonymizer, text),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def package_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def environment(args) -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "presidio_analyzer": package_version("presidio-analyzer"),
+        "presidio_anonymizer": package_version("presidio-anonymizer"),
+        "spacy": package_version("spacy"),
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+    }
+
+
+def print_compare(results: dict, previous: dict):
+    """Median-Latenz aktueller Lauf vs. früherer Lauf (gleicher Modus + Größe)"""
+    print(f"\nVergleich mit {previous['environment'].get('git_commit')} ({previous['environment'].get('timestamp')})")
+    print(f"{'Modus':>10} {'Größe':>7} {'vorher':>11} {'jetzt':>11} {'Faktor':>8}")
+    for mode, buckets in results["modes"].items():
+        for size, bucket in buckets.get("sizes", {}).items():
+            old = previous.get("modes", {}).get(mode, {}).get("sizes", {}).get(size)
+            if not old:
+                continue
+            print(
+                f"{mode:>10} {size:>7} {old['median_ms']:>9.1f}ms {bucket['median_ms']:>9.1f}ms "
+                f"{old['median_ms'] / bucket['median_ms']:>7.2f}x"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark-Suite für alle Erkennungs-Modi")
+    parser.add_argument("--modes", default=",".join(MODES), help="Kommagetrennt (Standard: alle)")
+    parser.add_argument("--sizes", default=",".join(SIZES), help="Kommagetrennt aus " + ", ".join(SIZES))
+    parser.add_argument("--warmup", type=int, default=1, help="Aufwärm-Durchläufe pro Größe")
+    parser.add_argument("--repeat", type=int, default=5, help="Gemessene Wiederholungen pro Größe")
+    parser.add_argument("--json", default=os.path.join(ROOT, "benchmarks", "results_modes.json"),
+                        help="Ausgabedatei (JSON)")
+    parser.add_argument("--compare", help="Früherer JSON-Lauf zum Vergleich")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        base = f.read()
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    documents = {size: make_document(base, SIZES[size]) for size in sizes}
+    registry = get_model_registry()
+    results = {"environment": environment(args), "modes": {}}
+
+    print("=" * 86)
+    print(f"BENCHMARK-SUITE: {args.warmup} Aufwärm- + {args.repeat} Messdurchläufe pro Größe")
+    print("=" * 86)
+
+    for mode in [mode.strip() for mode in args.modes.split(",") if mode.strip()]:
+        model = MODE_MODELS.get(mode)
+        if model and not registry.is_available(model):
+            print(f"\n{mode}: übersprungen - Modell nicht installiert (python -m spacy download {model})")
+            results["modes"][mode] = {"skipped": f"{model} nicht installiert"}
+            continue
+
+        rss_before = _current_rss()
+        start = time.perf_counter()
+        anonymizer = create_anonymizer(mode)
+        init_time = time.perf_counter() - start
+        rss_after = _current_rss()
+
+        mode_result = {
+            "engine": anonymizer.active_engine,
+            "init_seconds": round(init_time, 3),
+            "init_rss_mb": round((rss_after - rss_before) / (1024 * 1024), 1) if rss_before and rss_after else None,
+            "sizes": {},
+        }
+        results["modes"][mode] = mode_result
+
+        print(f"\n{mode} ({anonymizer.active_engine}, Init {init_time:.2f}s)")
+        print(f"{'Größe':>7} {'min':>11} {'median':>11} {'p95':>11} {'Zeichen/s':>12} {'Speicher':>10} {'Entities':>9}")
+        print("-" * 86)
+        for size in sizes:
+            bucket = run_bucket(anonymizer, documents[size], args.warmup, args.repeat)
+            mode_result["sizes"][size] = bucket
+            print(
+                f"{size:>7} {bucket['min_ms']:>9.1f}ms {bucket['median_ms']:>9.1f}ms {bucket['p95_ms']:>9.1f}ms "
+                f"{bucket['chars_per_sec']:>12,} {bucket['peak_alloc_mb']:>8.1f}MB {bucket['entities']:>9}"
+            )
+
+    with open(args.json, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\nErgebnisse gespeichert: {args.json}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print_compare(results, json.load(f))
+    print()
+
+
+if __name__ == '__main__':
+    main()
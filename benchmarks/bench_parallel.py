@@ -0,0 +1,71 @@
+"""
+BENCHMARK: Parallel-Modus - Speedup gegenüber einem einzelnen Prozess
+
+Vervielfacht test_notarschreiben.txt auf die angegebene Größe und
+anonymisiert einmal im Prozess (TextAnonymizer.anonymize) und dann mit
+ParallelAnonymizer für jede Worker-Anzahl. Der Prozess-Pool wird vor der
+Messung einmal gestartet (Worker-Initialisierung zählt nicht mit). Die
+Ausgaben werden auf Gleichheit mit dem Einzelprozess geprüft.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_parallel.py
+    python benchmarks/bench_parallel.py --chars 2000000 --workers 2,4,8,16
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.anonymizer import TextAnonymizer
+from src.parallel import ParallelAnonymizer
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel-Modus: Speedup gegenüber einem Prozess")
+    parser.add_argument("--chars", type=int, default=1000000, help="Textgröße in Zeichen")
+    parser.add_argument("--workers", default=f"2,4,{os.cpu_count() or 1}", help="Worker-Anzahlen (kommagetrennt)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        block = f.read()
+    text = (block * (args.chars // len(block) + 1))[:args.chars]
+
+    anonymizer = TextAnonymizer()
+    anonymizer.use_incremental = False
+    anonymizer.initialize()
+
+    print("=" * 60)
+    print(f"BENCHMARK: Parallel-Modus ({len(text)} Zeichen, {os.cpu_count()} Kerne)")
+    print("=" * 60)
+
+    single, expected = timed(anonymizer.anonymize, text)
+    print(f"{'Worker':>7} {'Zeit':>10} {'Speedup':>9}")
+    print("-" * 60)
+    print(f"{1:>7} {single:>9.2f}s {'1.0x':>9}")
+
+    for workers in sorted({int(w) for w in args.workers.split(",") if int(w) > 1}):
+        with ParallelAnonymizer(anonymizer, workers=workers) as parallel:
+            parallel.min_chars = 0
+            parallel.anonymize(block)  # Pool starten und Worker initialisieren
+            elapsed, actual = timed(parallel.anonymize, text)
+        assert actual == expected, "Ausgabe unterschiedlich!"
+        print(f"{workers:>7} {elapsed:>9.2f}s {single / elapsed:>8.1f}x")
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
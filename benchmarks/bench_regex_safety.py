@@ -0,0 +1,83 @@
+"""
+BENCHMARK: Worst-Case-Laufzeit aller Patterns bei präparierten Eingaben (ReDoS)
+
+Jedes Pattern aus PATTERN_RULES wird (mit denselben Flags wie im Betrieb)
+gegen Eingaben laufen gelassen, die Backtracking provozieren: lange
+Wiederholungen kurzer Bausteine ("a.", "a@", "Ab ", "1 ", ...), jeweils auch
+hinter einem Auslöser ("Herr ", "Dr. ", "a@", ...). Pro Eingabegröße wird
+die langsamste Eingabe gezeigt. Der Faktor zwischen zwei Größen zeigt das
+Wachstum: ~4x bei vierfacher Länge = linear, ~16x = quadratisch.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_regex_safety.py
+    python benchmarks/bench_regex_safety.py --sizes 4000,16000,64000
+"""
+
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import regex
+
+from src.patterns import PATTERN_RULES
+from src.pattern_engine import REGEX_FLAGS
+
+TRIGGERS = ["", "Herr ", "Dr. ", ", Herr ", "a@", "Az. ", "Grundbuch von ", "DE", "https://", "+49 ", "0"]
+FRAGMENTS = [
+    "a", "a.", "a@", "a-", ".a|", "a@a.", "Ab ", "Abc ", "Ab-Cd ", "Abc Ab ",
+    "1", "1 ", "0 ", "1.", "1/", "1-", "01 ", "A ", "Az ", "Ab\n", "str. ", "/a",
+    "01-", "0171/", "012 ", "0-1 ", "12 ", "+49-1",
+]
+
+
+def adversarial_inputs(size: int):
+    """(Beschreibung, Text) - Auslöser + Baustein bis `size` Zeichen + "!" als Abbruch"""
+    for trigger in TRIGGERS:
+        for fragment in FRAGMENTS:
+            body = fragment * max(1, (size - len(trigger)) // len(fragment))
+            yield f"{trigger!r}+{fragment!r}*n", trigger + body + "!"
+
+
+def worst_case(compiled, size: int):
+    """Langsamste Eingabe dieser Größe: (Sekunden, Beschreibung)"""
+    worst = (0.0, "")
+    for label, text in adversarial_inputs(size):
+        start = time.perf_counter()
+        for _ in compiled.finditer(text):
+            pass
+        elapsed = time.perf_counter() - start
+        if elapsed > worst[0]:
+            worst = (elapsed, label)
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worst-Case-Laufzeit aller Patterns")
+    parser.add_argument("--sizes", default="4000,16000,64000", help="Eingabelängen (kommagetrennt)")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    print("=" * 96)
+    print(f"BENCHMARK: Worst-Case pro Pattern, {len(TRIGGERS) * len(FRAGMENTS)} Eingaben pro Größe")
+    print("=" * 96)
+    header = "".join(f"{size:>10}" for size in sizes)
+    print(f"{'Pattern':<28}{header} {'Faktor':>7}  langsamste Eingabe")
+    print("-" * 96)
+
+    for entity_type, rules in PATTERN_RULES.items():
+        for rule in rules:
+            compiled = regex.compile(rule.regex, flags=REGEX_FLAGS)
+            results = [worst_case(compiled, size) for size in sizes]
+            times = "".join(f"{seconds * 1000:>8.1f}ms" for seconds, _ in results)
+            factor = results[-1][0] / results[-2][0] if len(results) > 1 and results[-2][0] else 0
+            print(f"{rule.name:<28}{times} {factor:>6.1f}x  {results[-1][1]}")
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
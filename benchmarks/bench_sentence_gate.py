@@ -0,0 +1,126 @@
+"""
+BENCHMARK: NER auf dem ganzen Text vs. nur auf Sätzen mit Namens-Hinweis
+
+Lädt das Modell für balanced (de_core_news_sm) und accurate (de_core_news_lg)
+und lässt die NER einmal über den ganzen Text laufen (SpacyNlpEngine) und
+einmal nur über die Sätze aus sentence_gate.name_candidate_windows
+(SentenceGatedNlpEngine). Auf test_notarschreiben.txt werden verglichen:
+spaCy-Tokens pro Dokument, Zeit pro Dokument und der Recall der gefilterten
+NER gegen die NER auf dem ganzen Text (pro Entity-Typ, gleiche Offsets) -
+plus die Treffer, die im anonymisierten Text trotzdem abgedeckt sind
+(Patterns, siehe ner_sentence_gate in config.toml).
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_sentence_gate.py
+"""
+
+import os
+import sys
+import time
+import logging
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
+
+from src.anonymizer import TextAnonymizer
+from src.model_registry import get_model_registry
+from src.nlp_engines import SentenceGatedNlpEngine
+from src.sentence_gate import name_candidate_windows
+
+REPEAT = 5
+MODES = [("balanced", "de_core_news_sm"), ("accurate", "de_core_news_lg")]
+
+
+def measure(func, repeat=REPEAT):
+    """Führt func mehrfach aus und gibt (Median-Zeit, letztes Ergebnis) zurück"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def make_engine(engine_class, model_name, nlp):
+    engine = engine_class(models=[{"lang_code": "de", "model_name": model_name}])
+    engine.nlp = {"de": nlp}
+    return engine
+
+
+def anonymize_gated(mode, text):
+    """Anonymisiert den Text im Modus mit Satz-Filter (NER + Patterns)"""
+    anonymizer = TextAnonymizer()
+    anonymizer.recognition_mode = mode
+    anonymizer.use_sentence_gate = True
+    anonymizer.use_incremental = False
+    anonymizer.initialize()
+    return anonymizer.anonymize(text)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    registry = get_model_registry()
+    windows = name_candidate_windows(text)
+
+    print("=" * 78)
+    print("BENCHMARK: NER ganzer Text vs. Satz-Filter (test_notarschreiben.txt)")
+    print("=" * 78)
+    print(f"Satz-Filter: {len(windows)} Bereiche, {sum(end - start for start, end in windows)} "
+          f"von {len(text)} Zeichen")
+
+    for mode, model_name in MODES:
+        print(f"\n{model_name}")
+        print("-" * 78)
+
+        if not registry.is_available(model_name):
+            print(f"  übersprungen - Modell nicht installiert (python -m spacy download {model_name})")
+            continue
+
+        nlp = registry.load(model_name, components=["tok2vec", "ner"])
+        full_engine = make_engine(SpacyNlpEngine, model_name, nlp)
+        gated_engine = make_engine(SentenceGatedNlpEngine, model_name, nlp)
+
+        full_tokens = len(nlp.make_doc(text))
+        gated_tokens = sum(len(nlp.make_doc(text[start:end])) for start, end in windows)
+
+        full_time, full_artifacts = measure(lambda: full_engine.process_text(text, "de"))
+        gated_time, gated_artifacts = measure(lambda: gated_engine.process_text(text, "de"))
+
+        full = {(e.start_char, e.end_char, e.label_) for e in full_artifacts.entities}
+        gated = {(e.start_char, e.end_char, e.label_) for e in gated_artifacts.entities}
+
+        print(f"{'':>12} {'Tokens':>8} {'NER/Dok.':>10}")
+        print(f"{'ganzer Text':>12} {full_tokens:>8} {full_time * 1000:>8.1f}ms")
+        print(f"{'Satz-Filter':>12} {gated_tokens:>8} {gated_time * 1000:>8.1f}ms")
+        print(f"\n  Tokens: -{100 * (1 - gated_tokens / full_tokens):.0f}%, Speedup NER: {full_time / gated_time:.1f}x")
+
+        print(f"\n  {'Entity':<14} {'ganzer Text':>12} {'Satz-Filter':>12} {'Recall':>8}")
+        for label in sorted({e[2] for e in full}):
+            expected = {e for e in full if e[2] == label}
+            found = expected & gated
+            print(f"  {label:<14} {len(expected):>12} {len(found):>12} {100 * len(found) / len(expected):>7.0f}%")
+        extra = gated - full
+        if extra:
+            print(f"  zusätzlich nur mit Satz-Filter: {len(extra)}")
+
+        missed = sorted(full - gated)
+        if missed:
+            anonymized = anonymize_gated(mode, text)
+            print(f"\n  Verpasst (trotzdem anonymisiert im Modus '{mode}' = durch Patterns abgedeckt):")
+            for start, end, label in missed:
+                entity = text[start:end]
+                print(f"    {label:<10} {entity!r:<40} {'NEIN' if entity in anonymized else 'ja'}")
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+BENCHMARK: Volle spaCy-Pipeline vs. nur NER-Komponenten ([advanced] spacy_components)
+
+Lädt das Modell für balanced (de_core_news_sm) und accurate (de_core_news_lg)
+einmal mit allen Komponenten und einmal nur mit tok2vec + ner und vergleicht
+Ladezeit, zusätzlichen Arbeitsspeicher (RSS) und Latenz pro Dokument auf
+test_notarschreiben.txt. Geprüft wird, dass NER-Treffer und anonymisierter
+Text identisch sind.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_spacy_components.py
+"""
+
+import os
+import sys
+import time
+import logging
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.anonymizer import TextAnonymizer
+from src.model_registry import get_model_registry
+
+REPEAT = 5
+MODES = [("balanced", "de_core_news_sm"), ("accurate", "de_core_news_lg")]
+TRIMMED = ["tok2vec", "ner"]
+
+
+def measure(func, repeat=REPEAT):
+    """Führt func mehrfach aus und gibt (Median-Zeit, letztes Ergebnis) zurück"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def run(mode, components, text):
+    """Initialisiert einen Anonymizer mit den Komponenten und misst pro Dokument"""
+    anonymizer = TextAnonymizer()
+    anonymizer.recognition_mode = mode
+    anonymizer.spacy_components = components
+    # Ohne Caches, jede Wiederholung analysiert komplett
+    anonymizer.use_incremental = False
+    anonymizer.result_cache.max_entries = 0
+    anonymizer.initialize()
+
+    nlp = anonymizer.analyzer.nlp_engine.nlp["de"]
+    load_info = get_model_registry().report()[-1]
+
+    nlp_time, doc = measure(lambda: nlp(text))
+    total_time, anonymized = measure(lambda: anonymizer.anonymize(text))
+    entities = [(ent.start_char, ent.end_char, ent.label_) for ent in doc.ents]
+
+    return {
+        "pipes": nlp.pipe_names,
+        "load_time": load_info.load_time,
+        "rss_delta": load_info.rss_delta,
+        "nlp_time": nlp_time,
+        "total_time": total_time,
+        "entities": entities,
+        "anonymized": anonymized,
+    }
+
+
+def format_mb(value):
+    return f"{value / (1024 * 1024):.0f} MB" if value is not None else "?"
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    registry = get_model_registry()
+
+    print("=" * 78)
+    print("BENCHMARK: spaCy alle Komponenten vs. nur NER")
+    print("=" * 78)
+
+    for mode, model_name in MODES:
+        print(f"\nModus '{mode}' ({model_name})")
+        print("-" * 78)
+
+        if not registry.is_available(model_name):
+            print(f"  übersprungen - Modell nicht installiert (python -m spacy download {model_name})")
+            continue
+
+        # Getrimmt zuerst, damit der RSS-Zuwachs nicht vom vollen Modell profitiert
+        trimmed = run(mode, TRIMMED, text)
+        full = run(mode, [], text)
+
+        print(f"{'':>10} {'Komponenten':<52} {'Laden':>6} {'RSS':>7}")
+        for label, result in (("voll", full), ("nur NER", trimmed)):
+            print(
+                f"{label:>10} {', '.join(result['pipes']):<52} "
+                f"{result['load_time']:>5.1f}s {format_mb(result['rss_delta']):>7}"
+            )
+
+        print(f"\n{'':>10} {'spaCy/Dok.':>12} {'anonymize/Dok.':>16}")
+        for label, result in (("voll", full), ("nur NER", trimmed)):
+            print(f"{label:>10} {result['nlp_time'] * 1000:>10.1f}ms {result['total_time'] * 1000:>14.1f}ms")
+
+        print(
+            f"\n  Speedup spaCy: {full['nlp_time'] / trimmed['nlp_time']:.1f}x, "
+            f"NER-Treffer gleich: {'ja' if full['entities'] == trimmed['entities'] else 'NEIN'}, "
+            f"Ausgabe gleich: {'ja' if full['anonymized'] == trimmed['anonymized'] else 'NEIN'}"
+        )
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
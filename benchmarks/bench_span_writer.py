@@ -0,0 +1,105 @@
+"""
+BENCHMARK: Ersetzung der Treffer - Presidio's Replace-Schleife vs. Span-Writer
+
+Dokumente mit vielen Treffern (Namen, Telefon, E-Mail, IBAN, Datum) werden
+mit der Fused Pattern Engine analysiert. Gemessen wird dann nur die
+Ersetzung: AnonymizerEngine.anonymize (kopiert den Text einmal pro Treffer)
+gegen spans.anonymize_spans (ein ''.join). Gezeigt wird die Zeit gesamt
+(Konflikte + Ersetzung, siehe auch bench_conflicts.py) und nur für das
+Zusammensetzen des Texts - dort bekommen beide dieselben aufgelösten Treffer
+und die Ausgaben werden auf Gleichheit geprüft.
+
+Aufruf (aus dem Projektordner):
+    python benchmarks/bench_span_writer.py
+    python benchmarks/bench_span_writer.py --repeats 100,500,2000
+"""
+
+import os
+import sys
+import copy
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities import OperatorConfig, RecognizerResult
+from presidio_anonymizer.operators import OperatorType
+
+from src.operators import ENTITY_OPERATORS, apply_operator
+from src.presidio_operators import PRESIDIO_OPERATORS
+from src.pattern_engine import FusedPatternEngine
+from src.patterns import ENTITY_PRIORITY
+from src.spans import Span, anonymize_spans, splice
+
+BLOCK = (
+    "Herr Dr. Klaus Weber, Musterstraße 12, 10115 Berlin, Tel. 030 555-1234, "
+    "klaus.weber@kanzlei.de, IBAN DE89 3704 0044 0532 0130 00, am 15.03.2024.\n"
+)
+
+
+def presidio_engine():
+    engine = AnonymizerEngine()
+    for operator in PRESIDIO_OPERATORS:
+        engine.add_anonymizer(operator)
+    return engine
+
+
+def operator_configs():
+    return {entity_type: OperatorConfig(name, dict(params)) for entity_type, (name, params) in ENTITY_OPERATORS.items()}
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Presidio's Replace-Schleife vs. Span-Writer")
+    parser.add_argument("--repeats", default="50,200,800", help="Wiederholungen des Textblocks (kommagetrennt)")
+    args = parser.parse_args()
+
+    engine = presidio_engine()
+    pattern_engine = FusedPatternEngine()
+
+    print("=" * 78)
+    print("BENCHMARK: Ersetzung der Treffer (Presidio vs. Span-Writer)")
+    print("=" * 78)
+    print(f"{'Treffer':>8} {'Zeichen':>9} | {'gesamt Presidio':>16} {'Writer':>9} | {'nur Text Presidio':>18} {'Writer':>9}")
+    print("-" * 78)
+
+    for repeats in (int(r) for r in args.repeats.split(",")):
+        text = BLOCK * repeats
+        results = [RecognizerResult(r.entity_type, r.start, r.end, r.score) for r in pattern_engine.analyze(text)]
+
+        presidio_total, _ = timed(
+            lambda: engine.anonymize(text=text, analyzer_results=copy.deepcopy(results), operators=operator_configs())
+        )
+        writer_total, _ = timed(
+            lambda: anonymize_spans(
+                text, [Span(r.entity_type, r.start, r.end, r.score) for r in results], apply_operator, ENTITY_PRIORITY
+            )
+        )
+
+        # Nur das Zusammensetzen: beide bekommen die von Presidio aufgelösten Treffer
+        presidio_results = engine._remove_conflicts_and_get_text_manipulation_data(copy.deepcopy(results), None)
+        presidio_results = engine._merge_entities_with_whitespace_between(text, presidio_results)
+        resolved = [Span(r.entity_type, r.start, r.end, r.score) for r in presidio_results]
+        presidio_text, expected = timed(
+            lambda: engine._operate(text, presidio_results, operator_configs(), OperatorType.Anonymize).text
+        )
+        writer_text, actual = timed(splice, text, resolved, apply_operator)
+        assert actual == expected, "Ausgabe unterschiedlich!"
+
+        print(
+            f"{len(results):>8} {len(text):>9} | {presidio_total * 1000:>14.1f}ms {writer_total * 1000:>7.1f}ms | "
+            f"{presidio_text * 1000:>16.1f}ms {writer_text * 1000:>7.1f}ms"
+        )
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -13,12 +13,48 @@ ANLEITUNG:
 5. Fertig!
 """
 
+import os
 import re
+import sys
+
+# Im Projektordner (oder mit src/patterns.py, operators.py, spans.py,
+# whitelist.py und lite.py im selben Ordner): Lite-Engine mit denselben
+# Patterns und Operatoren wie die App. Sonst (Code in Colab eingefügt):
+# die Mini-Version unten mit Platzhaltern wie <EMAIL>.
+try:
+    _here = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:0] = [os.path.join(_here, "..", ".."), _here]
+except NameError:  # In eine Colab-Zelle kopiert: kein __file__
+    pass
+
+try:
+    try:
+        from src.lite import LiteAnonymizer
+    except ImportError:
+        from lite import LiteAnonymizer
+    _lite = LiteAnonymizer()
+    ENGINE = "Lite-Engine (Patterns der App)"
+except ImportError:
+    _lite = None
+    ENGINE = "Mini-Version (Platzhalter)"
+
 
 def anonymize_text(text):
     """
     Anonymisiert persönliche Daten im Text
 
+    Mit der Lite-Engine wie die App (z.B. "max@firma.de" → "m***@f***.de"),
+    sonst mit der Mini-Version unten.
+    """
+    if _lite is not None:
+        return _lite.anonymize(text)
+    return anonymize_minimal(text)
+
+
+def anonymize_minimal(text):
+    """
+    Mini-Version zum Kopieren (ohne Projektdateien)
+
     Erkannte Typen:
     - E-Mail: user@example.com → <EMAIL>
     - Telefon: +49 123 456789 → <TELEFON>
@@ -95,14 +131,25 @@ def show_examples():
     print("🔒 TEXT ANONYMISIERER - DEMO")
     print("=" * 70)
     print()
+    print(f"Engine: {ENGINE}")
+    print()
     print("Erkannte Daten-Typen:")
-    print("  📧 E-Mail → <EMAIL>")
-    print("  📞 Telefon → <TELEFON>")
-    print("  🏠 Adresse → <ADRESSE>")
-    print("  👤 Person → <PERSON>")
-    print("  📅 Datum → <DATUM>")
-    print("  💳 IBAN → <IBAN>")
-    print("  🌐 IP/URL → <IP-ADRESSE>, <URL>")
+    if _lite is not None:
+        print("  📧 E-Mail → m***@f***.de")
+        print("  📞 Telefon → 030 123***")
+        print("  🏠 Adresse → M.straße 123")
+        print("  👤 Person → Herr M.")
+        print("  📅 Datum → XX.03.2024")
+        print("  💳 IBAN → DE89 37** ****")
+        print("  🌐 IP/URL → 192.168.***.***, https://***.***")
+    else:
+        print("  📧 E-Mail → <EMAIL>")
+        print("  📞 Telefon → <TELEFON>")
+        print("  🏠 Adresse → <ADRESSE>")
+        print("  👤 Person → <PERSON>")
+        print("  📅 Datum → <DATUM>")
+        print("  💳 IBAN → <IBAN>")
+        print("  🌐 IP/URL → <IP-ADRESSE>, <URL>")
     print()
     print("=" * 70)
     print()
@@ -3,39 +3,20 @@ Interaktive Test-Version für Google Colab / Replit
 Du kannst eigenen Text eingeben und sofort das anonymisierte Ergebnis sehen!
 """
 
-import re
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
 
-def anonymize_text(text):
-    """
-    Anonymisiert Text mit Regex-Patterns
-    """
-    # E-Mail Adressen
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '<EMAIL>', text)
-
-    # Telefonnummern (verschiedene Formate)
-    text = re.sub(r'\+?\d{1,4}[\s\-]?\(?\d{1,4}\)?[\s\-]?\d{1,4}[\s\-]?\d{1,9}', '<TELEFON>', text)
-
-    # IBAN
-    text = re.sub(r'\b[A-Z]{2}\d{2}\s?(\d{4}\s?){4}\d{2}\b', '<IBAN>', text)
-
-    # Datum (verschiedene Formate)
-    text = re.sub(r'\b\d{1,2}\.\d{1,2}\.\d{4}\b', '<DATUM>', text)
-    text = re.sub(r'\b\d{4}-\d{2}-\d{2}\b', '<DATUM>', text)
+from src.lite import LiteAnonymizer
 
-    # IP-Adressen
-    text = re.sub(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', '<IP-ADRESSE>', text)
+_anonymizer = LiteAnonymizer()
 
-    # URLs
-    text = re.sub(r'https?://[^\s]+', '<URL>', text)
-    text = re.sub(r'www\.[^\s]+', '<URL>', text)
 
-    # Namen (Herr/Frau + evtl. Titel + Name)
-    text = re.sub(r'\b(Herr|Frau)\s+(Dr\.\s+)?[A-Z][a-z]+\s+[A-Z][a-z]+\b', r'\1 <PERSON>', text)
-
-    # Adressen (Straße + Nummer)
-    text = re.sub(r'\b[A-ZÄÖÜ][a-zäöüß]+straße\s+\d+[a-z]?\b', '<ADRESSE>', text)
-
-    return text
+def anonymize_text(text):
+    """
+    Anonymisiert Text mit der Lite-Engine (gleiche Patterns wie die App)
+    """
+    return _anonymizer.anonymize(text)
 
 
 def main():
@@ -46,14 +27,14 @@ def main():
     print("Füge deinen Text ein und drücke Enter.")
     print("Zum Beenden: leere Zeile oder 'exit' eingeben")
     print()
-    print("Erkannte Typen:")
-    print("  📧 E-Mail → <EMAIL>")
-    print("  📞 Telefon → <TELEFON>")
-    print("  🏠 Adresse → <ADRESSE>")
-    print("  👤 Person → <PERSON>")
-    print("  📅 Datum → <DATUM>")
-    print("  💳 IBAN → <IBAN>")
-    print("  🌐 IP/URL → <IP-ADRESSE>, <URL>")
+    print("Erkannte Typen (Beispiele):")
+    print("  📧 E-Mail → m***@f***.de")
+    print("  📞 Telefon → 030 123***")
+    print("  🏠 Adresse → M.straße 123")
+    print("  👤 Person → Herr M.")
+    print("  📅 Datum → XX.03.2024")
+    print("  💳 IBAN → DE89 37** ****")
+    print("  🌐 IP/URL → 192.168.***.***, https://***.***")
     print()
     print("=" * 70)
     print()
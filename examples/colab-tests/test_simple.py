@@ -1,43 +1,23 @@
 """
-Einfacher Test der zeigt wie die Anonymisierung funktionieren würde
-(Ohne tatsächlich Presidio zu laden - für Demo-Zwecke)
+Einfacher Test der zeigt wie die Anonymisierung funktioniert
+(Ohne Presidio - nutzt die Lite-Engine mit denselben Patterns wie die App)
 """
 
-import re
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
 
-def simple_anonymize(text):
-    """
-    Einfache Regex-basierte Anonymisierung zu Demonstrationszwecken
-    (Die echte Presidio-Version ist viel genauer!)
-    """
-
-    # E-Mail Adressen
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '<EMAIL>', text)
-
-    # Telefonnummern (verschiedene Formate)
-    text = re.sub(r'\+?\d{1,4}[\s\-]?\(?\d{1,4}\)?[\s\-]?\d{1,4}[\s\-]?\d{1,9}', '<TELEFON>', text)
-
-    # IBAN
-    text = re.sub(r'\b[A-Z]{2}\d{2}\s?(\d{4}\s?){4}\d{2}\b', '<IBAN>', text)
+from src.lite import LiteAnonymizer
 
-    # Datum (verschiedene Formate)
-    text = re.sub(r'\b\d{1,2}\.\d{1,2}\.\d{4}\b', '<DATUM>', text)
-    text = re.sub(r'\b\d{4}-\d{2}-\d{2}\b', '<DATUM>', text)
+_anonymizer = LiteAnonymizer()
 
-    # IP-Adressen
-    text = re.sub(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', '<IP-ADRESSE>', text)
 
-    # URLs
-    text = re.sub(r'https?://[^\s]+', '<URL>', text)
-    text = re.sub(r'www\.[^\s]+', '<URL>', text)
-
-    # Einfache Namen (Herr/Frau + Titel + Name)
-    text = re.sub(r'\b(Herr|Frau)\s+(Dr\.\s+)?[A-Z][a-z]+\s+[A-Z][a-z]+\b', r'\1 <PERSON>', text)
-
-    # Adressen (Straße + Nummer)
-    text = re.sub(r'\b[A-ZÄÖÜ][a-zäöüß]+straße\s+\d+[a-z]?\b', '<ADRESSE>', text)
-
-    return text
+def simple_anonymize(text):
+    """
+    Regex-basierte Anonymisierung (Lite-Engine: gleiche Patterns und
+    Operatoren wie der fast-Modus der App)
+    """
+    return _anonymizer.anonymize(text)
 
 
 # Test-Texte
@@ -62,12 +42,12 @@ Seine IP-Adresse war 192.168.1.100 und er hat die Webseite www.example.com besuc
 
 def main():
     print("=" * 70)
-    print("ANONYMISIERUNGS-DEMO (Vereinfachte Version)")
+    print("ANONYMISIERUNGS-DEMO (Lite-Engine)")
     print("=" * 70)
     print()
-    print("⚠️  HINWEIS: Dies ist eine vereinfachte Demo mit Regex.")
-    print("   Die echte Windows-App nutzt Microsoft Presidio und ist")
-    print("   deutlich genauer!")
+    print("⚠️  HINWEIS: Dies ist eine Demo nur mit Regex (wie der fast-Modus).")
+    print("   Die Windows-App kann zusätzlich Microsoft Presidio + spaCy")
+    print("   nutzen (balanced/accurate) und erkennt dann mehr Namen!")
     print()
 
     # Teste jeden Text
@@ -5,6 +5,7 @@ Drücke Strg+Alt+A um Text aus der Zwischenablage zu anonymisieren.
 """
 
 import sys
+import time
 import logging
 import threading
 import ctypes
@@ -67,10 +68,14 @@ class TextAnonymizerApp:
     """Hauptanwendung"""
 
     def __init__(self):
+        self.start_time = time.time()
         self.anonymizer = get_anonymizer()
         self.hotkey_handler = None
         self.tray_icon = None
         self.should_quit = False
+        # spaCy im Hintergrund laden, Hotkey sofort mit Patterns bedienen
+        config = self.anonymizer.config
+        self.background_warm_up = config.is_background_warm_up_enabled() if config else True
 
     def initialize(self):
         """Initialisiert die Anwendung"""
@@ -87,7 +92,7 @@ class TextAnonymizerApp:
         # Initialisiere Presidio
         logger.info("Initialisiere Presidio (kann beim ersten Start etwas dauern)...")
         try:
-            if not self.anonymizer.initialize():
+            if not self.anonymizer.initialize(progressive=self.background_warm_up):
                 logger.error("=" * 60)
                 logger.error("FEHLER: Presidio konnte nicht initialisiert werden!")
                 logger.error("=" * 60)
@@ -113,7 +118,8 @@ class TextAnonymizerApp:
 
         # Erstelle Tray Icon
         self.tray_icon = TrayIcon(
-            on_quit_callback=self.quit
+            on_quit_callback=self.quit,
+            engine_name=self.anonymizer.active_engine
         )
 
         # Erstelle Hotkey Handler mit Status-Callback
@@ -155,8 +161,12 @@ class TextAnonymizerApp:
             logger.info("=" * 60)
             logger.info("Anonymify läuft!")
             logger.info("Drücke Strg+Alt+A um Text zu anonymisieren")
+            logger.info(f"Zeit bis Hotkey bereit: {time.time() - self.start_time:.1f}s (Engine: {self.anonymizer.active_engine})")
             logger.info("=" * 60)
 
+            # spaCy-Modell im Hintergrund laden (nur balanced/accurate)
+            self.anonymizer.start_warm_up(on_engine_change=self._on_engine_change)
+
             # Starte Tray Icon (blockiert bis Beenden)
             self.tray_icon.start()
 
@@ -167,6 +177,12 @@ class TextAnonymizerApp:
         finally:
             self.cleanup()
 
+    def _on_engine_change(self, engine_name: str):
+        """Wird aufgerufen sobald das spaCy-Modell geladen und aktiv ist"""
+        logger.info(f"Zeit bis volles Modell: {time.time() - self.start_time:.1f}s (Engine: {engine_name})")
+        if self.tray_icon:
+            self.tray_icon.set_engine(engine_name)
+
     def quit(self):
         """Beendet die Anwendung"""
         logger.info("Beende Anwendung...")
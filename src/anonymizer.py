@@ -3,439 +3,63 @@ Text Anonymisierung mit Microsoft Presidio
 ERWEITERTE VERSION mit deutschen Mustern für Anwälte + Whitelist + ML-Modi
 """
 
-from presidio_analyzer import AnalyzerEngine, PatternRecognizer, Pattern, RecognizerRegistry, RecognizerResult
-from presidio_analyzer.nlp_engine import NlpEngine, SpacyNlpEngine
-from presidio_anonymizer import AnonymizerEngine
-from presidio_anonymizer.entities import OperatorConfig
-from presidio_anonymizer.operators import Operator, OperatorType
-from typing import List, Optional, Dict
+from typing import TYPE_CHECKING, Callable, List, Optional, Dict, Iterable, Iterator, TextIO, Tuple, Union
 import logging
 import time
 import re
+import sys
+import threading
+from bisect import bisect_right
+
+try:
+    from .patterns import PATTERN_RULES, DEFAULT_ENTITIES, ENTITY_PRIORITY, MULTILINE_NAME_BREAK
+    from .operators import OPERATORS, apply_operator
+    from .spans import RawMatch, Span, anonymize_spans
+    from .pattern_engine import FusedPatternEngine, remove_duplicates
+    from .whitelist import WhitelistIndex
+    from .result_cache import ResultCache
+    from .model_registry import get_model_registry
+    from .timing import TimingReport, activate, stage
+except ImportError:
+    from patterns import PATTERN_RULES, DEFAULT_ENTITIES, ENTITY_PRIORITY, MULTILINE_NAME_BREAK
+    from operators import OPERATORS, apply_operator
+    from spans import RawMatch, Span, anonymize_spans
+    from pattern_engine import FusedPatternEngine, remove_duplicates
+    from whitelist import WhitelistIndex
+    from result_cache import ResultCache
+    from model_registry import get_model_registry
+    from timing import TimingReport, activate, stage
+
+# presidio_analyzer (und damit spaCy) wird erst importiert, wenn der
+# Presidio-Pfad gebraucht wird - siehe _nlp_engines()
+if TYPE_CHECKING:
+    from presidio_analyzer import RecognizerRegistry
+    from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine
 
 logger = logging.getLogger(__name__)
 
+# Absatzgrenze: Leerzeile (evtl. mit Leerzeichen) - für den Absatz-Cache
+_PARAGRAPH_RE = re.compile(r'\n[ \t]*\n\s*')
 
-# Custom Operator: Ersetzt Namen durch ersten Buchstaben + Punkt
-class FirstLetterOperator(Operator):
-    """Anonymisiert Namen zu 'X.' (erster Buchstabe + Punkt)"""
+# Zeilenumbruch + Einrückung nach einem Nachnamen (siehe _normalize_multiline_names)
+_MULTILINE_NAME_RE = re.compile(MULTILINE_NAME_BREAK)
 
-    def operate(self, text: str, params: Dict = None) -> str:
-        """
-        Ersetzt Namen durch Titel + ersten Buchstaben vom Nachnamen + Punkt
-
-        Titel bleiben ERHALTEN für bessere Lesbarkeit:
-        "Max Mustermann" → "M."
-        "Dr. Anna Schmidt" → "Dr. S."
-        "Herr Müller" → "Herr M."
-        "Herr Dr. Klaus Meier" → "Herr Dr. M."
-        """
-        if not text or not text.strip():
-            return text
-
-        text = text.strip()
-
-        # Extrahiere Titel am Anfang (können mehrere sein)
-        # Pattern: Herr, Frau, Dr., Prof., Hr., Fr., Herrn
-        title_match = re.match(r'^((Herr|Frau|Dr\.|Prof\.|Hr\.|Fr\.|Herrn)\s+)+', text)
-
-        if title_match:
-            # Titel gefunden
-            titles = title_match.group(0).strip()  # z.B. "Herr Dr."
-            rest = text[title_match.end():].strip()  # z.B. "Klaus Meier"
-
-            # Finde letztes Wort (Nachname)
-            words = rest.split()
-            if words:
-                last_name = words[-1]  # "Meier"
-                first_letter = last_name[0].upper()
-                return f"{titles} {first_letter}."
-            else:
-                # Kein Name nach Titel? Nimm ersten Buchstaben vom Titel
-                return f"{titles[0].upper()}."
-
-        else:
-            # Kein Titel: Nimm letztes Wort (Nachname)
-            words = text.split()
-            if len(words) >= 2:
-                # "Max Mustermann" → "M." (vom Nachnamen "Mustermann")
-                last_name = words[-1]
-                return f"{last_name[0].upper()}."
-            else:
-                # Nur ein Wort
-                return f"{text[0].upper()}."
-
-    def validate(self, params: Dict = None) -> None:
-        """Validierung (nicht benötigt)"""
-        pass
-
-    def operator_name(self) -> str:
-        """Name des Operators"""
-        return "first_letter"
-
-    def operator_type(self) -> OperatorType:
-        """Typ des Operators"""
-        return OperatorType.Anonymize
-
-
-# Custom Operator: Ersetzt Straßennamen durch ersten Buchstaben + Suffix
-class StreetFirstLetterOperator(Operator):
-    """Anonymisiert Straßen zu 'X.straße 123'"""
-
-    def operate(self, text: str, params: Dict = None) -> str:
-        """
-        Ersetzt Straßennamen durch ersten Buchstaben + Suffix + Hausnummer
-
-        "Musterstraße 123" → "M.straße 123"
-        "Hauptstr. 45a" → "H.str. 45a"
-        "Berliner Allee 10" → "B. Allee 10"
-        """
-        if not text or not text.strip():
-            return text
-
-        text = text.strip()
-
-        # Pattern: Wortanfang + suffix (straße/str./weg/platz/allee) + Nummer
-        # z.B. "Musterstraße 123", "Hauptstr. 45"
-        match = re.match(r'^([A-ZÄÖÜ][a-zäöüß]+)(straße|str\.|weg|platz|allee)(\s+\d+[a-zA-Z]?)$', text)
-
-        if match:
-            street_name = match.group(1)  # "Muster"
-            suffix = match.group(2)       # "straße"
-            number = match.group(3)       # " 123"
-
-            first_letter = street_name[0].upper()
-            return f"{first_letter}.{suffix}{number}"
-
-        # Fallback: Nur ersten Buchstaben
-        return f"{text[0].upper()}."
-
-    def validate(self, params: Dict = None) -> None:
-        pass
-
-    def operator_name(self) -> str:
-        return "street_first_letter"
-
-    def operator_type(self) -> OperatorType:
-        return OperatorType.Anonymize
-
-
-# Custom Operator: Maskiert E-Mail (behält Domain-Typ)
-class EmailMaskOperator(Operator):
-    """Maskiert E-Mail aber behält erste Buchstaben für Lesbarkeit"""
-
-    def operate(self, text: str, params: Dict = None) -> str:
-        """
-        LESBAR: Zeigt erste Buchstaben, maskiert Rest
-        "max.mueller@firma.de" → "m***@f***.de"
-        "kontakt@anwaltskanzlei-mueller.de" → "k***@a***.de"
-        """
-        if not text or '@' not in text:
-            return "***@***.***"
-
-        local, domain = text.split('@', 1)
-
-        # Lokaler Teil: Erster Buchstabe + ***
-        if len(local) >= 1:
-            local_masked = local[0] + '***'
-        else:
-            local_masked = '***'
-
-        # Domain: Erster Buchstabe + *** + TLD
-        domain_parts = domain.split('.')
-        if len(domain_parts) >= 2:
-            domain_name = domain_parts[0]
-            tld = '.'.join(domain_parts[1:])  # Alles nach erstem Punkt
-            if len(domain_name) >= 1:
-                domain_masked = domain_name[0] + '***'
-            else:
-                domain_masked = '***'
-            return f"{local_masked}@{domain_masked}.{tld}"
-
-        return f"{local_masked}@***.***"
-
-    def validate(self, params: Dict = None) -> None:
-        pass
-
-    def operator_name(self) -> str:
-        return "email_mask"
-
-    def operator_type(self) -> OperatorType:
-        return OperatorType.Anonymize
-
-
-# Custom Operator: Maskiert Telefon (behält Vorwahl)
-class PhoneMaskOperator(Operator):
-    """Maskiert Telefon aber behält Vorwahl"""
-
-    def operate(self, text: str, params: Dict = None) -> str:
-        """
-        LESBAR: Zeigt erste paar Ziffern, maskiert Rest
-        "030 12345678" → "030 123***"
-        "+49 30 123456" → "+49 30 123***"
-        "0171 9876543" → "0171 987***"
-        """
-        if not text or not text.strip():
-            return "0***"
-
-        text = text.strip()
-
-        # Versuche internationale Format: +49 30 ...
-        match = re.match(r'^(\+\d{1,3})[\s\-/]?(\d{2,4})[\s\-/](.+)$', text)
-        if match:
-            country = match.group(1)  # "+49"
-            area = match.group(2)      # "30"
-            rest = match.group(3)      # Rest der Nummer
-
-            # Extrahiere nur Ziffern aus Rest
-            digits = ''.join(c for c in rest if c.isdigit())
-            if len(digits) >= 3:
-                visible = digits[:3]  # Erste 3 Ziffern zeigen
-                masked = '***'
-            else:
-                visible = digits
-                masked = '***'
-            return f"{country} {area} {visible}{masked}"
-
-        # Nationales Format: 030 ...
-        match = re.match(r'^(0\d{1,4})[\s\-/](.+)$', text)
-        if match:
-            prefix = match.group(1)  # "030"
-            rest = match.group(2)     # "12345678" oder "555-1234"
-
-            # Extrahiere nur Ziffern aus Rest
-            digits = ''.join(c for c in rest if c.isdigit())
-            if len(digits) >= 3:
-                visible = digits[:3]  # Erste 3 Ziffern zeigen
-                masked = '***'
-            else:
-                visible = digits
-                masked = '***'
-            return f"{prefix} {visible}{masked}"
-
-        # Fallback: Nur Ziffern ohne Vorwahl
-        digits = ''.join(c for c in text if c.isdigit())
-        if len(digits) >= 3:
-            return digits[:3] + '***'
-
-        return "0***"
-
-    def validate(self, params: Dict = None) -> None:
-        pass
-
-    def operator_name(self) -> str:
-        return "phone_mask"
-
-    def operator_type(self) -> OperatorType:
-        return OperatorType.Anonymize
-
-
-# Custom Operator: Maskiert IBAN (behält Ländercode)
-class IbanMaskOperator(Operator):
-    """Maskiert IBAN aber behält Ländercode und erste Ziffern"""
-
-    def operate(self, text: str, params: Dict = None) -> str:
-        """
-        LESBAR: Zeigt Ländercode + erste 2 Ziffern
-        "DE89 3704 0044 0532 0130 00" → "DE89 37** ****"
-        "DE12345678901234567890" → "DE12 34** ****"
-        """
-        if not text or not text.strip():
-            return "DE** ****"
-
-        # Entferne Leerzeichen für Verarbeitung
-        text_no_spaces = text.replace(' ', '').strip()
-
-        # Ländercode (erste 2 Zeichen) + Prüfziffer (2 Zeichen) + erste 2 Ziffern der Bank
-        if len(text_no_spaces) >= 6:
-            country = text_no_spaces[:2].upper()  # "DE"
-            check = text_no_spaces[2:4]           # "89"
-            bank = text_no_spaces[4:6]            # "37"
-            return f"{country}{check} {bank}** ****"
-        elif len(text_no_spaces) >= 4:
-            country = text_no_spaces[:2].upper()
-            check = text_no_spaces[2:4]
-            return f"{country}{check} ** ****"
-        elif len(text_no_spaces) >= 2:
-            country = text_no_spaces[:2].upper()
-            return f"{country}** **** ****"
-
-        return "DE** ****"
-
-    def validate(self, params: Dict = None) -> None:
-        pass
-
-    def operator_name(self) -> str:
-        return "iban_mask"
-
-    def operator_type(self) -> OperatorType:
-        return OperatorType.Anonymize
-
-
-# Custom Operator: Maskiert Datum (behält Monat/Jahr)
-class DateMaskOperator(Operator):
-    """Maskiert Datum aber behält Monat/Jahr"""
 
-    def operate(self, text: str, params: Dict = None) -> str:
-        """
-        "15. März 2024" → "XX. März 2024"
-        "15.03.2024" → "XX.03.2024"
-        """
-        if not text or not text.strip():
-            return "XX.XX.XXXX"
-
-        text = text.strip()
-
-        # Pattern: "15. März 2024"
-        match = re.match(r'^(\d{1,2})(\.\s*[A-Za-zä]+\s+\d{4})$', text)
-        if match:
-            rest = match.group(2)
-            return f"XX{rest}"
-
-        # Pattern: "15.03.2024"
-        match = re.match(r'^(\d{1,2})(\.\d{2}\.\d{4})$', text)
-        if match:
-            rest = match.group(2)
-            return f"XX{rest}"
-
-        # Pattern: "2024-03-15" (ISO)
-        match = re.match(r'^(\d{4})-(\d{2})-(\d{2})$', text)
-        if match:
-            year = match.group(1)
-            month = match.group(2)
-            return f"{year}-{month}-XX"
-
-        # Fallback
-        return "XX.XX.XXXX"
-
-    def validate(self, params: Dict = None) -> None:
-        pass
-
-    def operator_name(self) -> str:
-        return "date_mask"
-
-    def operator_type(self) -> OperatorType:
-        return OperatorType.Anonymize
-
-
-# Custom Operator: Maskiert Aktenzeichen (behält Jahr)
-class CaseNumberMaskOperator(Operator):
-    """Maskiert Aktenzeichen aber behält Jahr"""
-
-    def operate(self, text: str, params: Dict = None) -> str:
-        """
-        "123 C 456/2024" → "*** C ***/2024"
-        "Az.: 12 Js 345/24" → "Az.: ** Js ***/24"
-        """
-        if not text or not text.strip():
-            return "*** *** ***"
-
-        text = text.strip()
-
-        # Pattern: "123 C 456/2024" oder "12 Js 345/24"
-        # Behalte Buchstaben und Jahr
-        match = re.match(r'^(Az\.?:?\s*)?(\d+)\s+([A-Z][a-z]?)\s+(\d+)/(\d{2,4})$', text)
-
-        if match:
-            prefix = match.group(1) or ""
-            letter = match.group(3)  # "C" oder "Js"
-            year = match.group(5)    # "2024" oder "24"
-
-            return f"{prefix}*** {letter} ***/{year}"
-
-        # Fallback
-        return "*** *** ***"
-
-    def validate(self, params: Dict = None) -> None:
-        pass
-
-    def operator_name(self) -> str:
-        return "case_number_mask"
-
-    def operator_type(self) -> OperatorType:
-        return OperatorType.Anonymize
-
-
-# Custom Operator: Ersetzt Ortsnamen durch ersten Buchstaben
-class LocationFirstLetterOperator(Operator):
-    """Anonymisiert Orte lesbar mit ersten Ziffern der PLZ"""
-
-    def operate(self, text: str, params: Dict = None) -> str:
-        """
-        LESBAR: Zeigt erste 3 Ziffern der PLZ + Stadtanfang
-
-        "12345 Musterstadt" → "123** M."
-        "80539 München" → "805** M."
-        "Berlin" → "B."
-        """
-        if not text or not text.strip():
-            return text
-
-        text = text.strip()
-
-        # Pattern: PLZ + Stadt (z.B. "12345 Musterstadt", "80539 München")
-        # Erweitert für Umlaute und mehrere Wörter
-        match = re.match(r'^(\d{5})\s+(.+)$', text)
-
-        if match:
-            plz = match.group(1)      # "80539"
-            city = match.group(2)     # "München"
+def _nlp_engines():
+    """Importiert die Presidio-Analyzer-Bausteine bei Bedarf (lädt spaCy)"""
+    try:
+        from . import nlp_engines
+    except ImportError:
+        import nlp_engines
+    return nlp_engines
 
-            # Zeige erste 3 Ziffern der PLZ, maskiere Rest
-            plz_visible = plz[:3]
-            plz_masked = '**'
 
-            # Erster Buchstabe der Stadt
-            first_letter = city[0].upper()
-            return f"{plz_visible}{plz_masked} {first_letter}."
-
-        # Kein PLZ: Nur Stadt
-        # z.B. "Berlin" → "B."
-        # Aber NICHT wenn es mit Ziffer anfängt!
-        if text and not text[0].isdigit():
-            return f"{text[0].upper()}."
-
-        return "***"
-
-    def validate(self, params: Dict = None) -> None:
-        pass
-
-    def operator_name(self) -> str:
-        return "location_first_letter"
-
-    def operator_type(self) -> OperatorType:
-        return OperatorType.Anonymize
-
-
-# Dummy NLP Engine (braucht kein spaCy!)
-class DummyNlpEngine(NlpEngine):
-    def process_text(self, text, language):
-        from presidio_analyzer.nlp_engine import NlpArtifacts
-        return NlpArtifacts([], [], [], [], None, language)
-
-    def process_batch(self, texts, language, **kwargs):
-        return [self.process_text(text, language) for text in texts]
-
-    def is_loaded(self):
-        return True
-
-    def is_loaded_from_file(self):
-        return False
-
-    def load(self):
-        pass
-
-    def get_supported_languages(self):
-        return ["de", "en"]
-
-    def get_supported_entities(self):
-        return []
-
-    def is_stopword(self, word, language):
-        return False
-
-    def is_punct(self, word, language):
-        return False
+def __getattr__(name: str):
+    # DummyNlpEngine / TimedPatternRecognizer bleiben importierbar
+    # (from src.anonymizer import DummyNlpEngine), werden aber erst dann geladen
+    if name in ("DummyNlpEngine", "TimedPatternRecognizer"):
+        return getattr(_nlp_engines(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class TextAnonymizer:
@@ -450,7 +74,9 @@ class TextAnonymizer:
         """
         self.language = language
         self.analyzer = None
-        self.anonymizer = None
+        self.pattern_engine = None
+        self.active_engine = None
+        self.warm_up_pending = False
 
         # Lade Config und Whitelist
         try:
@@ -466,6 +92,15 @@ class TextAnonymizer:
             self.recognition_mode = self.config.get_recognition_mode()
             self.person_threshold = self.config.get_person_score_threshold()
             self.other_threshold = self.config.get_other_score_threshold()
+            self.use_fused_engine = self.config.is_fused_pattern_engine_enabled()
+            self.stream_window_chars = self.config.get_stream_window_chars()
+            self.stream_overlap_chars = self.config.get_stream_overlap_chars()
+            cache_entries = self.config.get_result_cache_entries()
+            cache_bytes = self.config.get_result_cache_max_mb() * 1024 * 1024
+            self.use_incremental = self.config.is_incremental_enabled()
+            paragraph_entries = self.config.get_paragraph_cache_entries()
+            self.spacy_components = self.config.get_spacy_components()
+            self.use_sentence_gate = self.config.is_ner_sentence_gate_enabled()
             logger.info(f"Whitelist geladen: {len(self.whitelist)} Einträge")
             logger.info(f"Erkennungs-Modus: {self.recognition_mode}")
             logger.info(f"Score-Thresholds: Namen={self.person_threshold}, Andere={self.other_threshold}")
@@ -476,237 +111,42 @@ class TextAnonymizer:
             self.recognition_mode = 'fast'
             self.person_threshold = 0.7
             self.other_threshold = 0.6
-
-    def _create_registry(self) -> RecognizerRegistry:
-        """Erstellt Registry mit allen erweiterten Recognizers"""
-        registry = RecognizerRegistry()
-
-        # E-Mail
-        email_pattern = Pattern(
-            name="email",
-            regex=r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            score=0.9
-        )
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="EMAIL_ADDRESS",
-            patterns=[email_pattern],
-            supported_language="de"
-        ))
-
-        # Telefon (deutsche Formate)
-        # WICHTIG: Muss auch "030 555-1234" matchen (mit Bindestrich in der Nummer)
-        phone_patterns = [
-            # Mobilfunk: 0171 1234567 oder 0171-123-4567
-            Pattern(name="phone_mobile", regex=r"0\d{3,4}[\s\-/]?\d{3,4}[\s\-/]?\d{3,4}", score=0.8),
-            # International: +49 30 123456 oder +49-30-123456
-            Pattern(name="phone_intl", regex=r"\+49[\s\-/]?\d{2,4}[\s\-/]?\d{3,9}", score=0.8),
-            # Festnetz: 030 12345678 oder 030 555-1234 (mit Bindestrich!)
-            Pattern(name="phone_landline", regex=r"0\d{2,5}[\s\-/]?(\d{3,4}[\s\-/]?)?\d{4,8}", score=0.7),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="PHONE_NUMBER",
-            patterns=phone_patterns,
-            supported_language="de"
-        ))
-
-        # Namen (deutsche Vor- und Nachnamen)
-        # SEHR RESTRIKTIV: Nur mit Titeln, mindestens 2+3 Zeichen!
-        name_patterns = [
-            # Mit Anrede + akadem. Titeln (sehr sicher) - ALLE KOMBINATIONEN!
-            # z.B. "Herr Prof. Dr. Klaus-Dieter Schneider", "Frau Dr. med. Anna-Maria Müller-Hoffmann"
-            # Vornamen: min 2 Zeichen ([A-ZÄÖÜ][a-zäöüß]{1,}  =  mind. 2 Zeichen gesamt)
-            # Nachname: min 3 Zeichen ([A-ZÄÖÜ][a-zäöüß]{2,} = mind. 3 Zeichen gesamt)
-            Pattern(
-                name="name_with_title_complex",
-                regex=r"\b(Herr|Frau|Hr\.|Fr\.|Herrn)\s+(Prof\.\s+)?(Dr\.\s+)?(med\.\s+)?(Prof\.\s+)?(Dr\.\s+)?([A-ZÄÖÜ][a-zäöüß]{1,}(-[A-ZÄÖÜ][a-zäöüß]+)?\s+)*[A-ZÄÖÜ][a-zäöüß]{2,}(-[A-ZÄÖÜ][a-zäöüß]+)?",
-                score=0.95
-            ),
-            # Mit akademischem Titel (ohne Anrede) - MINDESTENS Dr. oder Prof. MUSS dabei sein!
-            # z.B. "Dr. Heinrich Weber", "Prof. Dr. Müller"
-            # WICHTIG: (Prof\.|Dr\.|med\.) ist NICHT optional → mindestens einer MUSS da sein!
-            Pattern(
-                name="name_with_dr",
-                regex=r"\b(Prof\.\s+|Dr\.\s+|Prof\.\s+Dr\.\s+|Dr\.\s+med\.\s+)([A-ZÄÖÜ][a-zäöüß]{1,}(-[A-ZÄÖÜ][a-zäöüß]+)?\s+)*[A-ZÄÖÜ][a-zäöüß]{2,}(-[A-ZÄÖÜ][a-zäöüß]+)?",
-                score=0.9
-            ),
-            # Nach Komma mit Titel
-            # z.B. "namens meiner Mandantin, Frau Dr. Anna-Maria Weber"
-            Pattern(
-                name="name_after_comma_title",
-                regex=r",\s+(Herr|Frau|Hr\.|Fr\.|Herrn)\s+(Dr\.\s+)?(med\.\s+)?([A-ZÄÖÜ][a-zäöüß]{2,}(-[A-ZÄÖÜ][a-zäöüß]+)?\s+)*[A-ZÄÖÜ][a-zäöüß]{3,}(-[A-ZÄÖÜ][a-zäöüß]+)?",
-                score=0.95
-            ),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="PERSON",
-            patterns=name_patterns,
-            supported_language="de"
-        ))
-
-        # Straßenadressen
-        street_patterns = [
-            Pattern(name="street_strasse", regex=r"\b[A-ZÄÖÜ][a-zäöüß]+straße\s+\d+[a-zA-Z]?", score=0.85),
-            Pattern(name="street_str", regex=r"\b[A-ZÄÖÜ][a-zäöüß]+str\.\s+\d+[a-zA-Z]?", score=0.85),
-            Pattern(name="street_weg", regex=r"\b[A-ZÄÖÜ][a-zäöüß]+weg\s+\d+[a-zA-Z]?", score=0.85),
-            Pattern(name="street_platz", regex=r"\b[A-ZÄÖÜ][a-zäöüß]+platz\s+\d+[a-zA-Z]?", score=0.85),
-            Pattern(name="street_allee", regex=r"\b[A-ZÄÖÜ][a-zäöüß]+allee\s+\d+[a-zA-Z]?", score=0.85),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="STREET_ADDRESS",
-            patterns=street_patterns,
-            supported_language="de"
-        ))
-
-        # PLZ + Stadt
-        postal_patterns = [
-            Pattern(name="plz_stadt", regex=r"\b\d{5}\s+[A-ZÄÖÜ][a-zäöüß]+(?:\s+[a-zäöüß]+)?\b", score=0.8),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="LOCATION",
-            patterns=postal_patterns,
-            supported_language="de"
-        ))
-
-        # Aktenzeichen
-        case_patterns = [
-            Pattern(name="aktenzeichen", regex=r"\b\d+\s+[A-Z]{1,3}\s+\d+/\d{2,4}\b", score=0.9),
-            Pattern(name="aktenzeichen_az", regex=r"\bAz\.?:?\s*\d+\s+[A-Z]{1,3}\s+\d+/\d{2,4}\b", score=0.95),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="CASE_NUMBER",
-            patterns=case_patterns,
-            supported_language="de"
-        ))
-
-        # IBAN
-        iban_pattern = Pattern(
-            name="iban_de",
-            regex=r"\bDE\d{2}[\s]?\d{4}[\s]?\d{4}[\s]?\d{4}[\s]?\d{4}[\s]?\d{2}\b",
-            score=0.95
-        )
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="IBAN_CODE",
-            patterns=[iban_pattern],
-            supported_language="de"
-        ))
-
-        # Kontonummer
-        account_patterns = [
-            Pattern(name="account_number", regex=r"\bKonto[-\s]?Nr\.?:?\s*\d{6,10}\b", score=0.9),
-            Pattern(name="account_number_simple", regex=r"\bKontonummer:?\s*\d{6,10}\b", score=0.9),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="ACCOUNT_NUMBER",
-            patterns=account_patterns,
-            supported_language="de"
-        ))
-
-        # Steuer-ID
-        tax_patterns = [
-            Pattern(name="steuer_id", regex=r"\b\d{11}\b", score=0.6),
-            Pattern(name="steuer_id_labeled", regex=r"\b(Steuer-ID|Steueridentifikationsnummer|St\.-Nr\.|Steuernummer|Steuer-Nr\.):?\s*\d{2,3}/\d{3}/\d{4,5}\b", score=0.95),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="TAX_ID",
-            patterns=tax_patterns,
-            supported_language="de"
-        ))
-
-        # Grundbuchnummern (Notariat)
-        grundbuch_patterns = [
-            Pattern(name="grundbuch_blatt", regex=r"\b(Grundbuch|GB)[\s\-]?(von\s+)?[A-ZÄÖÜ][a-zäöüß\-]+,?\s+(Blatt\s+)?\d{4,6}(/\d{2,4}[\-]\d{2,4})?\b", score=0.9),
-            Pattern(name="grundbuch_short", regex=r"\bGB\s+\d{4,6}/\d{2,4}[\-]\d{2,4}\b", score=0.9),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="PROPERTY_REF",
-            patterns=grundbuch_patterns,
-            supported_language="de"
-        ))
-
-        # Flurstück-Nummern (Kataster)
-        flurstueck_patterns = [
-            Pattern(name="flurstueck", regex=r"\b(Flurstück|Flur)\s+\d{1,4}(/\d{2,4})?\b", score=0.85),
-            Pattern(name="gemarkung", regex=r"\b(Gemarkung|Gmkg\.)\s+[A-ZÄÖÜ][a-zäöüß\-]+,\s+Flur\s+\d{1,4}\b", score=0.9),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="LAND_PARCEL",
-            patterns=flurstueck_patterns,
-            supported_language="de"
-        ))
-
-        # Sozialversicherungsnummer
-        sv_pattern = Pattern(
-            name="sozialversicherungsnummer",
-            regex=r"\b\d{2}\s?\d{6}\s?[A-Z]\s?\d{3}\b",
-            score=0.8
-        )
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="SOCIAL_SECURITY_NUMBER",
-            patterns=[sv_pattern],
-            supported_language="de"
-        ))
-
-        # Personalausweisnummer
-        id_patterns = [
-            Pattern(name="perso_nummer", regex=r"\b[A-Z]\d{9}\b", score=0.7),
-            Pattern(name="perso_labeled", regex=r"\b(Personalausweis|Ausweis-Nr\.|PA):?\s*[A-Z0-9]{9,10}\b", score=0.9),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="ID_NUMBER",
-            patterns=id_patterns,
-            supported_language="de"
-        ))
-
-        # Datum
-        date_patterns = [
-            Pattern(name="date_de_dot", regex=r"\b\d{1,2}\.\d{1,2}\.\d{4}\b", score=0.7),
-            Pattern(name="date_de_slash", regex=r"\b\d{1,2}/\d{1,2}/\d{4}\b", score=0.7),
-            Pattern(name="date_iso", regex=r"\b\d{4}-\d{2}-\d{2}\b", score=0.7),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="DATE_TIME",
-            patterns=date_patterns,
-            supported_language="de"
-        ))
-
-        # Kreditkarte
-        credit_card_pattern = Pattern(
-            name="credit_card",
-            regex=r"\b\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}\b",
-            score=0.8
-        )
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="CREDIT_CARD",
-            patterns=[credit_card_pattern],
-            supported_language="de"
-        ))
-
-        # IP-Adresse
-        ip_pattern = Pattern(
-            name="ip_address",
-            regex=r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b",
-            score=0.8
+            self.use_fused_engine = True
+            self.stream_window_chars = 65536
+            self.stream_overlap_chars = 1024
+            cache_entries = 128
+            cache_bytes = 32 * 1024 * 1024
+            self.use_incremental = True
+            paragraph_entries = 4096
+            self.spacy_components = ['tok2vec', 'ner']
+            self.use_sentence_gate = False
+
+        # Whitelist einmalig in einen Index umbauen (Wörter + Phrasen-Automat)
+        self.whitelist_index = WhitelistIndex(self.whitelist)
+
+        # Ergebnis-Cache (Schlüssel = Digest aus Text + Konfiguration)
+        self.result_cache = ResultCache(max_entries=cache_entries, max_bytes=cache_bytes)
+
+        # Absatz-Cache (Digest eines Absatzes → Analyse-Treffer relativ zum Absatz)
+        self.paragraph_cache = ResultCache(max_entries=paragraph_entries, max_bytes=cache_bytes)
+
+    def is_initialized(self) -> bool:
+        """Prüft ob die Analyse (Pattern Engine oder Presidio) bereit ist"""
+        return self.pattern_engine is not None or self.analyzer is not None
+
+    def _config_fingerprint(self) -> str:
+        """Effektive Konfiguration, die das Ergebnis beeinflusst (für den Ergebnis-Cache)"""
+        return (
+            f"{self.recognition_mode}|{self.active_engine}|{self.person_threshold}|"
+            f"{self.other_threshold}|{self.use_sentence_gate}|{self.whitelist_index.digest}|"
+            f"{','.join(self.spacy_components)}|{self.use_incremental}|{self.use_fused_engine}"
         )
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="IP_ADDRESS",
-            patterns=[ip_pattern],
-            supported_language="de"
-        ))
-
-        # URL
-        url_patterns = [
-            Pattern(name="url_http", regex=r"https?://[^\s]+", score=0.9),
-            Pattern(name="url_www", regex=r"www\.[^\s]+", score=0.8),
-        ]
-        registry.add_recognizer(PatternRecognizer(
-            supported_entity="URL",
-            patterns=url_patterns,
-            supported_language="de"
-        ))
 
-        return registry
+    def _create_registry(self) -> "RecognizerRegistry":
+        """Erstellt Registry mit allen erweiterten Recognizers (aus PATTERN_RULES)"""
+        return _nlp_engines().create_registry()
 
-    def _filter_whitelist(self, text: str, analyzer_results: List[RecognizerResult]) -> List[RecognizerResult]:
+    def _filter_whitelist(self, text: str, analyzer_results: List[Span]) -> List[Span]:
         """
         Filtert erkannte Entities und entfernt die, die auf der Whitelist stehen
 
@@ -720,54 +160,30 @@ class TextAnonymizer:
         Returns:
             Gefilterte Liste ohne Whitelist-Einträge
         """
-        if not self.whitelist:
+        if not self.whitelist_index:
             return analyzer_results
 
+        with stage("whitelist"):
+            return self._filter_whitelist_index(text, analyzer_results)
+
+    def _filter_whitelist_index(self, text: str, analyzer_results: List[Span]) -> List[Span]:
+        """Whitelist-Filter über den WhitelistIndex (siehe _filter_whitelist)"""
         filtered_results = []
         removed_count = 0
 
-        # Entity-Typen die IMMER anonymisiert werden (keine Whitelist-Filterung)
-        always_anonymize = {
-            "EMAIL_ADDRESS", "PHONE_NUMBER", "IBAN_CODE", "CREDIT_CARD",
-            "IP_ADDRESS", "URL", "TAX_ID", "SOCIAL_SECURITY_NUMBER",
-            "ID_NUMBER", "ACCOUNT_NUMBER", "DATE_TIME",
-            "PROPERTY_REF", "LAND_PARCEL"  # Grundbuch + Flurstück
-        }
-
+        # E-Mail, Telefon, IBAN, etc. werden nie gefiltert, Wort-Treffer nur
+        # für PERSON, LOCATION, STREET_ADDRESS (siehe WhitelistIndex.match)
+        # WICHTIG: Nur ganze Wörter matchen, nicht Substrings!
+        # z.B. "Bundestag" matched, aber "im" matched NICHT in "Maximilian"
         for result in analyzer_results:
-            # IMMER anonymisieren für bestimmte Typen
-            if result.entity_type in always_anonymize:
-                filtered_results.append(result)
-                continue
-
-            # Extrahiere den erkannten Text
             detected_text = text[result.start:result.end]
-
-            # Prüfe ob auf Whitelist (case-insensitive)
-            if detected_text.lower() in self.whitelist:
-                logger.debug(f"Whitelist-Match: '{detected_text}' wird NICHT anonymisiert")
+            whitelisted_term = self.whitelist_index.match(result.entity_type, detected_text)
+            if whitelisted_term is not None:
+                logger.debug(f"Whitelist-Match: '{detected_text}' ('{whitelisted_term}') wird NICHT anonymisiert")
                 removed_count += 1
                 continue
 
-            # Prüfe ob ein GANZES WORT aus der Whitelist enthalten ist
-            # NUR für PERSON, LOCATION, STREET_ADDRESS
-            # WICHTIG: Nur ganze Wörter matchen, nicht Substrings!
-            # z.B. "Bundestag" matched, aber "im" matched NICHT in "Maximilian"
-            is_whitelisted = False
-            if result.entity_type in ["PERSON", "LOCATION", "STREET_ADDRESS"]:
-                # Extrahiere Wörter aus dem erkannten Text (case-insensitive)
-                detected_words = set(re.findall(r'\b\w+\b', detected_text.lower()))
-
-                for whitelisted_term in self.whitelist:
-                    # Prüfe ob der Whitelist-Term als ganzes Wort vorkommt
-                    if whitelisted_term in detected_words:
-                        logger.debug(f"Whitelist-Word-Match: '{detected_text}' enthält Wort '{whitelisted_term}'")
-                        removed_count += 1
-                        is_whitelisted = True
-                        break
-
-            if not is_whitelisted:
-                filtered_results.append(result)
+            filtered_results.append(result)
 
         if removed_count > 0:
             logger.info(f"Whitelist: {removed_count} Entities ausgeschlossen")
@@ -779,26 +195,34 @@ class TextAnonymizer:
         if self.recognition_mode == 'fast':
             # Dummy Engine: Nur Pattern-Matching (schnell)
             logger.info("Verwende Dummy NLP Engine (nur Patterns, schnell)")
-            return DummyNlpEngine()
+            return _nlp_engines().DummyNlpEngine()
 
         elif self.recognition_mode in ['balanced', 'accurate']:
             # Versuche spaCy zu laden
             try:
                 logger.info(f"Versuche spaCy zu laden für Modus '{self.recognition_mode}'...")
 
+                registry = get_model_registry()
+
                 # Lade deutsches Modell
                 model_name = "de_core_news_sm"  # Klein für balanced
                 if self.recognition_mode == 'accurate':
-                    # Versuche großes Modell für accurate
-                    try:
-                        import spacy
-                        spacy.load("de_core_news_lg")
+                    # Großes Modell für accurate - Verfügbarkeit nur über Paket-Metadaten prüfen,
+                    # das Modell selbst wird genau einmal geladen (Registry)
+                    if registry.is_available("de_core_news_lg"):
                         model_name = "de_core_news_lg"
                         logger.info("Verwende großes spaCy-Modell (genauer, langsamer)")
-                    except:
+                    else:
                         logger.warning("Großes Modell nicht gefunden, nutze kleines Modell")
 
-                nlp_engine = SpacyNlpEngine(models=[{"lang_code": "de", "model_name": model_name}])
+                # Geteiltes Modell aus der Registry an die Engine übergeben
+                # (Presidio lädt es dann nicht noch einmal)
+                from presidio_analyzer.nlp_engine import SpacyNlpEngine
+                # Satz-Filter: spaCy nur auf Sätzen mit Namens-Hinweis ([advanced] ner_sentence_gate)
+                engine_class = _nlp_engines().SentenceGatedNlpEngine if self.use_sentence_gate else SpacyNlpEngine
+                nlp_engine = engine_class(models=[{"lang_code": "de", "model_name": model_name}])
+                # Nur die Komponenten laden, die für NER gebraucht werden ([advanced] spacy_components)
+                nlp_engine.nlp = {"de": registry.load(model_name, components=self.spacy_components)}
                 logger.info(f"spaCy NLP Engine geladen: {model_name}")
                 return nlp_engine
 
@@ -808,52 +232,139 @@ class TextAnonymizer:
                 logger.warning("Installiere spaCy für bessere Erkennung:")
                 logger.warning("  pip install spacy")
                 logger.warning("  python -m spacy download de_core_news_sm")
-                return DummyNlpEngine()
+                return _nlp_engines().DummyNlpEngine()
 
         else:
             logger.warning(f"Unbekannter Modus '{self.recognition_mode}', nutze 'fast'")
-            return DummyNlpEngine()
+            return _nlp_engines().DummyNlpEngine()
 
-    def initialize(self):
-        """Initialisiert Presidio Engines (kann etwas dauern beim ersten Start)"""
+    def _engine_name(self, nlp_engine: "NlpEngine") -> str:
+        """Anzeigename der NLP-Engine (für Log und Tray Icon)"""
+        from presidio_analyzer.nlp_engine import SpacyNlpEngine
+        if isinstance(nlp_engine, SpacyNlpEngine):
+            return f"spaCy ({nlp_engine.models[0]['model_name']})"
+        return "Patterns"
+
+    def initialize(self, progressive: bool = False):
+        """
+        Initialisiert Presidio Engines (kann etwas dauern beim ersten Start)
+
+        Args:
+            progressive: Im balanced/accurate-Modus sofort nur mit Patterns starten,
+                         spaCy wird danach per start_warm_up im Hintergrund geladen
+        """
         try:
             logger.info("Initialisiere Presidio Analyzer...")
             logger.info(f"Modus: {self.recognition_mode}")
             start_time = time.time()
 
-            # Erstelle Registry mit allen Patterns
-            registry = self._create_registry()
+            self.warm_up_pending = progressive and self.recognition_mode != 'fast'
+
+            if self.use_fused_engine and (self.recognition_mode == 'fast' or self.warm_up_pending):
+                # Ohne NLP (fast-Modus bzw. bis spaCy im Hintergrund geladen ist)
+                # übernimmt die Fused Pattern Engine die Analyse: ein Engine-Lauf
+                # statt ~15 Recognizer + Presidio-Nachbearbeitung. presidio_analyzer
+                # und spaCy werden dafür gar nicht erst importiert.
+                if self.warm_up_pending:
+                    logger.info("Starte nur mit Patterns, spaCy folgt im Hintergrund")
+                self.analyzer = None
+                self.pattern_engine = FusedPatternEngine()
+                self.active_engine = "Patterns"
+            else:
+                # Erstelle Registry mit allen Patterns
+                registry = self._create_registry()
+
+                # Erstelle NLP Engine basierend auf Modus
+                if self.warm_up_pending:
+                    logger.info("Starte mit Dummy NLP Engine (nur Patterns), spaCy folgt im Hintergrund")
+                    nlp_engine = _nlp_engines().DummyNlpEngine()
+                else:
+                    nlp_engine = self._create_nlp_engine()
+
+                # Erstelle Analyzer
+                # Sprache muss konsistent mit Registry sein (alle Recognizers nutzen "en")
+                from presidio_analyzer import AnalyzerEngine
+                self.analyzer = AnalyzerEngine(
+                    registry=registry,
+                    nlp_engine=nlp_engine,
+                    supported_languages=["en"]  # Patterns funktionieren auch für deutsche Texte
+                )
+
+                # Fused Pattern Engine auch hier, wenn spaCy nicht verfügbar war
+                if self.use_fused_engine and isinstance(nlp_engine, _nlp_engines().DummyNlpEngine):
+                    self.pattern_engine = FusedPatternEngine()
+                else:
+                    self.pattern_engine = None
+                self.active_engine = self._engine_name(nlp_engine)
+
+            elapsed = time.time() - start_time
+            logger.info(f"Presidio erfolgreich initialisiert! ({elapsed:.1f}s, Engine: {self.active_engine})")
+            return True
+        except Exception as e:
+            logger.error(f"Fehler beim Initialisieren von Presidio: {e}", exc_info=True)
+            return False
+
+    def start_warm_up(self, on_engine_change: Optional[Callable[[str], None]] = None) -> Optional[threading.Thread]:
+        """
+        Lädt die konfigurierte spaCy-Engine im Hintergrund (nach initialize(progressive=True))
+
+        Bis das Modell geladen ist, laufen Anfragen über die Pattern-Engine.
+        Danach wird der Analyzer ausgetauscht: erst self.analyzer, dann
+        self.pattern_engine = None - jede Analyse sieht dadurch entweder
+        die alte oder die neue Engine, nie eine halbe.
 
-            # Erstelle NLP Engine basierend auf Modus
+        Args:
+            on_engine_change: Wird mit dem Namen der neuen Engine aufgerufen (z.B. Tray Icon)
+
+        Returns:
+            Der Lade-Thread oder None (nichts zu laden)
+        """
+        if not self.warm_up_pending:
+            return None
+
+        thread = threading.Thread(
+            target=self._warm_up,
+            args=(on_engine_change,),
+            name="spacy-warm-up",
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _warm_up(self, on_engine_change: Optional[Callable[[str], None]]):
+        """Lade-Thread: erstellt den vollständigen Analyzer und tauscht ihn aus"""
+        start_time = time.time()
+        logger.info(f"Lade spaCy im Hintergrund (Modus: {self.recognition_mode})...")
+
+        try:
             nlp_engine = self._create_nlp_engine()
+            if isinstance(nlp_engine, _nlp_engines().DummyNlpEngine):
+                logger.warning("spaCy nicht verfügbar - bleibe bei Patterns")
+                return
 
-            # Erstelle Analyzer
-            # Sprache muss konsistent mit Registry sein (alle Recognizers nutzen "en")
-            self.analyzer = AnalyzerEngine(
-                registry=registry,
+            from presidio_analyzer import AnalyzerEngine
+            analyzer = AnalyzerEngine(
+                registry=self._create_registry(),
                 nlp_engine=nlp_engine,
-                supported_languages=["en"]  # Patterns funktionieren auch für deutsche Texte
+                supported_languages=["en"]
             )
+        except Exception as e:
+            logger.error(f"spaCy konnte im Hintergrund nicht geladen werden: {e}", exc_info=True)
+            logger.warning("Bleibe bei Patterns")
+            return
+        finally:
+            self.warm_up_pending = False
 
-            logger.info("Initialisiere Presidio Anonymizer...")
-            self.anonymizer = AnonymizerEngine()
+        # Austausch (Reihenfolge wichtig, siehe start_warm_up)
+        self.analyzer = analyzer
+        self.pattern_engine = None
+        self.active_engine = self._engine_name(nlp_engine)
 
-            # Registriere Custom Operators (Klassen, nicht Instanzen!)
-            self.anonymizer.add_anonymizer(FirstLetterOperator)
-            self.anonymizer.add_anonymizer(StreetFirstLetterOperator)
-            self.anonymizer.add_anonymizer(LocationFirstLetterOperator)
-            self.anonymizer.add_anonymizer(EmailMaskOperator)
-            self.anonymizer.add_anonymizer(PhoneMaskOperator)
-            self.anonymizer.add_anonymizer(IbanMaskOperator)
-            self.anonymizer.add_anonymizer(DateMaskOperator)
-            self.anonymizer.add_anonymizer(CaseNumberMaskOperator)
+        elapsed = time.time() - start_time
+        logger.info(f"Engine gewechselt: {self.active_engine} (geladen in {elapsed:.1f}s)")
 
-            elapsed = time.time() - start_time
-            logger.info(f"Presidio erfolgreich initialisiert! ({elapsed:.1f}s)")
-            return True
-        except Exception as e:
-            logger.error(f"Fehler beim Initialisieren von Presidio: {e}", exc_info=True)
-            return False
+        if on_engine_change:
+            on_engine_change(self.active_engine)
 
     def _normalize_multiline_names(self, text: str) -> str:
         """
@@ -871,15 +382,210 @@ class TextAnonymizer:
         # Aber: Wir wollen nur Namen-Zeilen normalisieren, nicht alles!
         # Lösung: Ersetze "\n   " (Newline + 3+ Leerzeichen) mit einem Leerzeichen
         # NUR wenn davor ein Nachname steht (erkennbar an Großbuchstabe-Kleinbuchstaben)
-        normalized = re.sub(
-            r'([A-ZÄÖÜ][a-zäöüß]+(-[A-ZÄÖÜ][a-zäöüß]+)?)\n\s{2,}',
-            r'\1 ',
-            text
-        )
+        with stage("normalize"):
+            normalized = _MULTILINE_NAME_RE.sub(r'\1 ', text)
 
         return normalized
 
-    def anonymize(self, text: str, entities_to_anonymize: Optional[List[str]] = None) -> str:
+    def _analyze(self, text_normalized: str, entities: List[str],
+                 nlp_artifacts: Optional["NlpArtifacts"] = None) -> List[Span]:
+        """
+        Erkennt PII im (normalisierten) Text - Fused Pattern Engine oder Presidio
+
+        Args:
+            nlp_artifacts: Bereits berechnete NLP-Ergebnisse (z.B. aus nlp.pipe),
+                           None = NLP-Engine läuft auf dem Text
+        """
+        pattern_engine = self.pattern_engine
+        if pattern_engine is not None:
+            # fast-Modus: Fused Pattern Engine (gleiche Treffer wie Presidio)
+            with stage("analyze"):
+                return pattern_engine.analyze(
+                    text=text_normalized,
+                    entities=entities
+                )
+
+        analyzer = self.analyzer
+        if nlp_artifacts is None:
+            # NLP getrennt messbar (AnalyzerEngine würde process_text sonst selbst aufrufen)
+            with stage("nlp"):
+                nlp_artifacts = analyzer.nlp_engine.process_text(text_normalized, "de")
+
+        with stage("analyze"):
+            return analyzer.analyze(
+                text=text_normalized,  # Nutze normalisierten Text für Analyse
+                language="de",  # Deutsch für deutsche Texte!
+                entities=entities,
+                nlp_artifacts=nlp_artifacts
+            )
+
+    def _filter_scores(self, analyzer_results: List[Span]) -> List[Span]:
+        """
+        Filtert nach Confidence-Score (konfigurierbar via config.toml)
+
+        Thresholds aus Config: person_threshold, other_threshold
+        """
+        with stage("score_filter"):
+            return [
+                r for r in analyzer_results
+                if (r.entity_type == "PERSON" and r.score >= self.person_threshold) or
+                   (r.entity_type != "PERSON" and r.score >= self.other_threshold)
+            ]
+
+    def _detect(self, text_normalized: str, entities: List[str],
+                nlp_artifacts: Optional["NlpArtifacts"] = None) -> List[Span]:
+        """Analyse + Whitelist-Filter + Score-Filter (ohne Logging pro Stufe)"""
+        analyzer_results = self._analyze(text_normalized, entities, nlp_artifacts)
+        analyzer_results = self._filter_whitelist(text_normalized, analyzer_results)
+        return self._filter_scores(analyzer_results)
+
+    def _split_paragraphs(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Teilt Text an Leerzeilen in Absätze
+
+        Returns:
+            Liste von (offset, absatz) - die Leerzeile gehört zum vorherigen Absatz,
+            zusammengesetzt ergibt sich wieder der Text
+        """
+        paragraphs = []
+        paragraph_start = 0
+        for match in _PARAGRAPH_RE.finditer(text):
+            paragraphs.append((paragraph_start, text[paragraph_start:match.end()]))
+            paragraph_start = match.end()
+        if paragraph_start < len(text):
+            paragraphs.append((paragraph_start, text[paragraph_start:]))
+        return paragraphs
+
+    def _detect_incremental(self, text_normalized: str, paragraphs: List[Tuple[int, str]],
+                            entities: List[str]) -> Tuple[List[Span], int]:
+        """
+        Wie _detect, aber pro Absatz mit Cache: nur neue/geänderte Absätze werden analysiert
+
+        Gecacht werden die Roh-Treffer, die im Absatz beginnen (relativ zum
+        Absatz, Schlüssel = Digest aus Absatz + Anfang des nächsten Absatzes bis
+        stream_overlap_chars + Konfiguration), und ob ein Treffer aus einem
+        früheren Absatz in ihn hineinreichte. Dann fehlen ihm eigene Treffer,
+        die der Vorgänger verdeckt hat - solche Einträge werden nicht
+        wiederverwendet, der Absatz wird neu analysiert (der Schlüssel enthält
+        den Vorgänger nicht). Ist kein Absatz im Cache (z.B. beim
+        ersten Hotkey-Druck), läuft die normale Analyse auf dem Gesamttext und
+        füllt den Cache. Sonst werden nur die fehlenden Absätze analysiert (mit
+        dem Kontext dahinter). Reicht ein Treffer über die Grenze eines solchen
+        Absatzes, hängt sein Ergebnis vom Nachbarn ab - dann wird ebenfalls der
+        Gesamttext analysiert. Duplikat-Entfernung, Whitelist- und Score-Filter
+        laufen danach auf dem Gesamttext.
+
+        Returns:
+            (Treffer im Gesamttext, Anzahl wiederverwendeter Absätze)
+        """
+        cache = self.paragraph_cache
+        cache.validate(self._config_fingerprint())
+        overlap = self.stream_overlap_chars
+
+        # Roh-Treffer relativ zum Absatz, None = muss analysiert werden
+        keys = []
+        windows = []
+        found: List[Optional[Tuple[RawMatch, ...]]] = []
+        for i, (offset, paragraph) in enumerate(paragraphs):
+            context = ""
+            if i + 1 < len(paragraphs):
+                context = paragraphs[i + 1][1]
+                if len(context) > overlap:
+                    # Nur bis zum letzten Leerraum, damit kein Wort abgeschnitten wird
+                    cut = overlap
+                    while cut > 0 and not context[cut].isspace():
+                        cut -= 1
+                    context = context[:cut]
+
+            windows.append(paragraph + context)
+            keys.append(cache.make_key(windows[-1], cache.fingerprint, entities))
+            cached = cache.get(keys[-1])
+            # (hineingereicht, Treffer) - hineingereicht: eigene Treffer evtl. verdeckt
+            found.append(None if cached is None or cached[0] else cached[1])
+
+        missing = [i for i, cached in enumerate(found) if cached is None]
+        if len(missing) == len(paragraphs) or not self._analyze_paragraphs(
+            paragraphs, windows, found, missing, entities
+        ):
+            # Normale Analyse auf dem Gesamttext, Treffer pro Absatz (nach Start) verteilen
+            offsets = [offset for offset, _ in paragraphs]
+            per_paragraph: List[List[RawMatch]] = [[] for _ in paragraphs]
+            crossed_into = [False] * len(paragraphs)
+            for r in self._analyze(text_normalized, entities):
+                i = bisect_right(offsets, r.start) - 1
+                per_paragraph[i].append((r.score, r.start - offsets[i], r.end - offsets[i], r.entity_type))
+                for j in range(i + 1, bisect_right(offsets, r.end - 1)):
+                    crossed_into[j] = True
+            found = [tuple(matches) for matches in per_paragraph]
+            missing = range(len(paragraphs))
+        else:
+            # Einzeln analysiert und kein Treffer über eine Grenze (sonst Gesamttext)
+            crossed_into = [False] * len(paragraphs)
+
+        for i in missing:
+            cache.put(keys[i], (crossed_into[i], found[i]), size=sys.getsizeof(found[i]) + 100 * len(found[i]))
+
+        raw = [
+            (score, start + offset, end + offset, entity_type)
+            for (offset, _), matches in zip(paragraphs, found)
+            for score, start, end, entity_type in matches
+        ]
+        analyzer_results = [
+            Span(entity_type, start, end, score)
+            for score, start, end, entity_type in remove_duplicates(raw)
+        ]
+        analyzer_results = self._filter_whitelist(text_normalized, analyzer_results)
+        return self._filter_scores(analyzer_results), len(paragraphs) - len(missing)
+
+    def _analyze_paragraphs(self, paragraphs: List[Tuple[int, str]], windows: List[str],
+                            found: List[Optional[Tuple[RawMatch, ...]]], missing: List[int],
+                            entities: List[str]) -> bool:
+        """
+        Analysiert die fehlenden Absätze einzeln (Fenster = Absatz + Kontext)
+
+        Trägt die Roh-Treffer, die im Absatz beginnen, in `found` ein.
+
+        Returns:
+            False wenn ein Treffer über die Grenze eines analysierten Absatzes
+            reicht (Ergebnis wäre nicht dasselbe wie auf dem Gesamttext)
+        """
+        if self.pattern_engine is not None:
+            artifacts = (None for _ in missing)
+        else:
+            artifacts = self._process_batch([windows[i] for i in missing], 50, 1)
+
+        for i, nlp_artifacts in zip(missing, artifacts):
+            paragraph = paragraphs[i][1]
+            found[i] = tuple(
+                (r.score, r.start, r.end, r.entity_type)
+                for r in self._analyze(windows[i], entities, nlp_artifacts)
+                if r.start < len(paragraph)
+            )
+
+        def crosses_end(i):
+            return any(end > len(paragraphs[i][1]) for _, _, end, _ in found[i])
+
+        # Treffer aus dem Absatz in den nächsten bzw. aus dem vorherigen hinein
+        return not any(crosses_end(i) or (i > 0 and crosses_end(i - 1)) for i in missing)
+
+    def _apply_operators(self, text_normalized: str, analyzer_results: List[Span]) -> str:
+        """
+        Ersetzt die erkannten PII im Text durch die Custom Operators
+
+        Namen werden zu "X." (erster Buchstabe + Punkt), andere werden maskiert.
+        Operator pro Entity-Typ aus der gemeinsamen Tabelle (src/operators.py).
+
+        Statt AnonymizerEngine.anonymize: die Operatoren werden direkt
+        aufgerufen, Überschneidungen per Sweep-Line mit festen Vorrang-Regeln
+        aufgelöst (Score, Länge, patterns.ENTITY_PRIORITY) und der Text in
+        einem Durchlauf zusammengesetzt (siehe spans.anonymize_spans).
+        """
+        with stage("operators"):
+            spans = [Span(r.entity_type, r.start, r.end, r.score) for r in analyzer_results]
+            return anonymize_spans(text_normalized, spans, apply_operator, ENTITY_PRIORITY)
+
+    def anonymize(self, text: str, entities_to_anonymize: Optional[List[str]] = None,
+                  timing: Optional[TimingReport] = None) -> str:
         """
         Anonymisiert den gegebenen Text
 
@@ -887,52 +593,58 @@ class TextAnonymizer:
             text: Der zu anonymisierende Text
             entities_to_anonymize: Liste von Entity-Typen die anonymisiert werden sollen.
                                    None = alle unterstützten Entities (siehe DEFAULT_ENTITIES)
+            timing: Optional - sammelt Zeiten pro Stufe und Recognizer (summiert über Aufrufe)
 
         Returns:
             Anonymisierter Text
         """
+        if timing is None:
+            return self._anonymize(text, entities_to_anonymize)
+
+        with activate(timing):
+            start_time = time.perf_counter()
+            anonymized_text = self._anonymize(text, entities_to_anonymize)
+            timing.total_seconds += time.perf_counter() - start_time
+        timing.calls += 1
+        timing.chars += len(text or "")
+        return anonymized_text
+
+    def anonymize_with_timing(self, text: str,
+                              entities_to_anonymize: Optional[List[str]] = None) -> Tuple[str, TimingReport]:
+        """
+        Anonymisiert den Text und gibt zusätzlich die Zeitmessung zurück
+
+        Returns:
+            (anonymisierter Text, TimingReport)
+        """
+        timing = TimingReport()
+        return self.anonymize(text, entities_to_anonymize, timing=timing), timing
+
+    def _anonymize(self, text: str, entities_to_anonymize: Optional[List[str]]) -> str:
+        """Anonymisierung ohne Zeitmessung-Rahmen (siehe anonymize)"""
         if not text or not text.strip():
             return text
 
         # Default: Alle unterstützten Entity-Typen
         if entities_to_anonymize is None:
-            entities_to_anonymize = [
-                # Persönliche Daten
-                "PERSON",                    # Namen (mit Pattern + spaCy)
-                "EMAIL_ADDRESS",             # E-Mails
-                "PHONE_NUMBER",              # Telefonnummern
-                "DATE_TIME",                 # Geburtsdaten, Termine
-
-                # Adressen & Orte
-                "STREET_ADDRESS",            # Straßen (Musterstraße 123)
-                "LOCATION",                  # PLZ + Städte (12345 Berlin)
-
-                # Finanz-Daten
-                "IBAN_CODE",                 # IBAN
-                "CREDIT_CARD",               # Kreditkarten
-                "ACCOUNT_NUMBER",            # Kontonummern
-
-                # Identifikation
-                "TAX_ID",                    # Steuer-ID / Steuernummer
-                "SOCIAL_SECURITY_NUMBER",    # Sozialversicherungsnummer
-                "ID_NUMBER",                 # Ausweis-/Personalausweisnummer
-
-                # Juristische Daten
-                "CASE_NUMBER",               # Aktenzeichen (123 C 456/2024)
-                "PROPERTY_REF",              # Grundbuchnummern
-                "LAND_PARCEL",               # Flurstücknummern
-
-                # Internet
-                "IP_ADDRESS",                # IP-Adressen
-                "URL",                       # URLs/Webseiten
-            ]
+            entities_to_anonymize = DEFAULT_ENTITIES
             logger.info(f"Verwende Standard-Entities: {len(entities_to_anonymize)} Typen")
 
-        if not self.analyzer or not self.anonymizer:
+        if not self.is_initialized():
             logger.warning("Presidio nicht initialisiert, initialisiere jetzt...")
             if not self.initialize():
                 return "FEHLER: Presidio konnte nicht initialisiert werden!"
 
+        # Ergebnis-Cache: gleicher Text + gleiche Konfiguration → gleiches Ergebnis
+        cache_key = None
+        if self.result_cache.enabled:
+            self.result_cache.validate(self._config_fingerprint())
+            cache_key = self.result_cache.make_key(text, self.result_cache.fingerprint, entities_to_anonymize)
+            cached_text = self.result_cache.get(cache_key)
+            if cached_text is not None:
+                logger.info(f"Ergebnis aus Cache ({self.result_cache.stats()})")
+                return cached_text
+
         try:
             # Normalisiere mehrzeilige Namen VORHER
             text_normalized = self._normalize_multiline_names(text)
@@ -940,67 +652,280 @@ class TextAnonymizer:
             # Analysiere Text und erkenne PII (nutze normalisierten Text!)
             logger.info(f"Analysiere Text ({len(text)} Zeichen)...")
             start_analyze = time.time()
-            analyzer_results = self.analyzer.analyze(
-                text=text_normalized,  # Nutze normalisierten Text für Analyse
-                language="de",  # Deutsch für deutsche Texte!
-                entities=entities_to_anonymize
-            )
-            analyze_time = time.time() - start_analyze
 
-            logger.info(f"{len(analyzer_results)} PII-Entities gefunden (Analyse: {analyze_time:.2f}s)")
+            paragraphs = None
+            if self.use_incremental and self.paragraph_cache.enabled:
+                paragraphs = self._split_paragraphs(text_normalized)
+
+            if paragraphs and len(paragraphs) > 1:
+                # Inkrementell: unveränderte Absätze aus dem Absatz-Cache
+                analyzer_results, reused = self._detect_incremental(
+                    text_normalized, paragraphs, entities_to_anonymize
+                )
+                analyze_time = time.time() - start_analyze
+                logger.info(
+                    f"{len(analyzer_results)} PII-Entities nach Whitelist- und Score-Filter "
+                    f"({reused}/{len(paragraphs)} Absätze aus Cache, Analyse: {analyze_time:.2f}s)"
+                )
+            else:
+                analyzer_results = self._analyze(text_normalized, entities_to_anonymize)
+                analyze_time = time.time() - start_analyze
+
+                logger.info(f"{len(analyzer_results)} PII-Entities gefunden (Analyse: {analyze_time:.2f}s)")
 
-            # Filtere Whitelist-Einträge (nutze normalisierten Text!)
-            analyzer_results = self._filter_whitelist(text_normalized, analyzer_results)
-            logger.info(f"{len(analyzer_results)} PII-Entities nach Whitelist-Filter")
+                # Filtere Whitelist-Einträge (nutze normalisierten Text!)
+                analyzer_results = self._filter_whitelist(text_normalized, analyzer_results)
+                logger.info(f"{len(analyzer_results)} PII-Entities nach Whitelist-Filter")
 
-            # Filtere nach Confidence-Score (konfigurierbar via config.toml)
-            # Thresholds aus Config: person_threshold, other_threshold
-            analyzer_results = [
-                r for r in analyzer_results
-                if (r.entity_type == "PERSON" and r.score >= self.person_threshold) or
-                   (r.entity_type != "PERSON" and r.score >= self.other_threshold)
-            ]
-            logger.info(f"{len(analyzer_results)} PII-Entities nach Score-Filter (>={self.person_threshold} für Namen, >={self.other_threshold} für andere)")
+                # Filtere nach Confidence-Score
+                analyzer_results = self._filter_scores(analyzer_results)
+                logger.info(f"{len(analyzer_results)} PII-Entities nach Score-Filter (>={self.person_threshold} für Namen, >={self.other_threshold} für andere)")
 
             # Anonymisiere erkannte PII (nutze normalisierten Text!)
-            # Namen werden zu "X." (erster Buchstabe + Punkt)
-            # Andere werden komplett ersetzt
             start_anonymize = time.time()
-            anonymized_result = self.anonymizer.anonymize(
-                text=text_normalized,  # Nutze normalisierten Text!
-                analyzer_results=analyzer_results,
-                operators={
-                    "DEFAULT": OperatorConfig("replace", {"new_value": "***"}),
-                    # LESBAR: Erste Buchstaben bleiben sichtbar für Kontext
-                    "PERSON": OperatorConfig("first_letter"),  # "Herr Müller" → "Herr M."
-                    "STREET_ADDRESS": OperatorConfig("street_first_letter"),  # "Musterstr. 123" → "M.str. 123"
-                    "LOCATION": OperatorConfig("location_first_letter"),  # "12345 Berlin" → "XXXXX B."
-                    "EMAIL_ADDRESS": OperatorConfig("email_mask"),  # "max@firma.de" → "m***@f***.de"
-                    "PHONE_NUMBER": OperatorConfig("phone_mask"),  # "030 12345678" → "030 123***"
-                    "DATE_TIME": OperatorConfig("date_mask"),  # "15.03.2024" → "XX.03.2024"
-                    "IBAN_CODE": OperatorConfig("iban_mask"),  # "DE89 3704..." → "DE89 37** ****"
-                    "CASE_NUMBER": OperatorConfig("case_number_mask"),  # "123 C 456/2024" → "*** C ***/2024"
-                    "CREDIT_CARD": OperatorConfig("replace", {"new_value": "**** **** **** ****"}),
-                    "IP_ADDRESS": OperatorConfig("replace", {"new_value": "192.168.***.***"}),  # Behält erste 2 Oktette
-                    "URL": OperatorConfig("replace", {"new_value": "https://***.***"}),
-                    "TAX_ID": OperatorConfig("replace", {"new_value": "***/***/****"}),
-                    "SOCIAL_SECURITY_NUMBER": OperatorConfig("replace", {"new_value": "****** ****"}),
-                    "ID_NUMBER": OperatorConfig("replace", {"new_value": "***"}),
-                    "ACCOUNT_NUMBER": OperatorConfig("replace", {"new_value": "Konto ***"}),
-                    "PROPERTY_REF": OperatorConfig("replace", {"new_value": "GB ***"}),  # Grundbuch
-                    "LAND_PARCEL": OperatorConfig("replace", {"new_value": "Flurstück ***"}),  # Flurstück
-                }
-            )
+            anonymized_text = self._apply_operators(text_normalized, analyzer_results)
             anonymize_time = time.time() - start_anonymize
 
             total_time = analyze_time + anonymize_time
             logger.info(f"Text erfolgreich anonymisiert (Anonymisierung: {anonymize_time:.2f}s, Gesamt: {total_time:.2f}s)")
-            return anonymized_result.text
+
+            if cache_key is not None:
+                self.result_cache.put(cache_key, anonymized_text)
+                logger.info(f"Ergebnis-Cache: {self.result_cache.stats()}")
+            return anonymized_text
 
         except Exception as e:
             logger.error(f"Fehler beim Anonymisieren: {e}", exc_info=True)
             return f"FEHLER beim Anonymisieren: {str(e)}\n\n(Originaltext wurde NICHT anonymisiert)"
 
+    def _process_batch(self, texts: List[str], batch_size: int, n_process: int) -> Iterator["NlpArtifacts"]:
+        """
+        Führt die NLP-Pipeline für viele Texte gebündelt aus
+
+        spaCy: nlp.pipe (Batching, optional mehrere Prozesse), sonst NlpEngine.process_batch
+        """
+        from presidio_analyzer.nlp_engine import SpacyNlpEngine
+        nlp_engine = self.analyzer.nlp_engine
+
+        if isinstance(nlp_engine, _nlp_engines().SentenceGatedNlpEngine):
+            # Satz-Filter: nlp.pipe nur über die Namens-Kandidaten aller Texte
+            yield from nlp_engine.process_gated(texts, "de", batch_size=batch_size, n_process=n_process)
+        elif isinstance(nlp_engine, SpacyNlpEngine):
+            nlp = nlp_engine.get_nlp("de")
+            for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+                yield nlp_engine._doc_to_nlp_artifact(doc, "de")
+        else:
+            yield from nlp_engine.process_batch(texts, "de")
+
+    def anonymize_batch(self, texts: Iterable[str], entities_to_anonymize: Optional[List[str]] = None,
+                        batch_size: int = 50, n_process: int = 1) -> List[str]:
+        """
+        Anonymisiert viele Texte auf einmal (z.B. tausende E-Mails aus einem Akten-Export)
+
+        Im balanced/accurate-Modus läuft spaCy dabei gebündelt über nlp.pipe statt
+        einmal pro Text. Registry und Operators werden wiederverwendet.
+
+        Args:
+            texts: Die zu anonymisierenden Texte
+            entities_to_anonymize: Entity-Typen (None = DEFAULT_ENTITIES)
+            batch_size: Anzahl Texte pro spaCy-Batch
+            n_process: Anzahl spaCy-Prozesse (nur balanced/accurate)
+
+        Returns:
+            Anonymisierte Texte in derselben Reihenfolge wie die Eingabe
+        """
+        texts = list(texts)
+        if entities_to_anonymize is None:
+            entities_to_anonymize = DEFAULT_ENTITIES
+
+        if not self.is_initialized():
+            logger.warning("Presidio nicht initialisiert, initialisiere jetzt...")
+            if not self.initialize():
+                raise RuntimeError("Presidio konnte nicht initialisiert werden!")
+
+        start_time = time.time()
+        results = list(texts)
+
+        # Leere Texte bleiben unverändert (wie bei anonymize)
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        normalized = [self._normalize_multiline_names(texts[i]) for i in indices]
+
+        if self.pattern_engine is not None:
+            # fast-Modus: keine NLP-Artefakte nötig
+            artifacts = (None for _ in normalized)
+        else:
+            artifacts = self._process_batch(normalized, batch_size, n_process)
+
+        entity_count = 0
+        for i, text_normalized, nlp_artifacts in zip(indices, normalized, artifacts):
+            analyzer_results = self._detect(text_normalized, entities_to_anonymize, nlp_artifacts)
+            entity_count += len(analyzer_results)
+            results[i] = self._apply_operators(text_normalized, analyzer_results)
+
+        elapsed = time.time() - start_time
+        logger.info(f"Batch anonymisiert: {len(texts)} Texte, {entity_count} Entities ({elapsed:.2f}s)")
+        return results
+
+    def _find_stream_cut(self, text: str, limit: int, results: List[Span]) -> int:
+        """
+        Bestimmt die Schnittstelle für ein Stream-Fenster
+
+        Geschnitten wird an einem Wortanfang (Leerraum davor, kein Leerraum danach)
+        bei oder vor `limit`, damit Wortgrenzen und die Namens-Normalisierung im
+        nächsten Fenster gleich bleiben. Liegt ein Treffer über der Schnittstelle,
+        wird vor den Treffer geschnitten - er wird im nächsten Fenster komplett erkannt.
+        Ebenso, wenn vor und hinter der Schnittstelle Treffer stehen, zwischen
+        denen nur Leerzeichen (oder nichts) liegen: merge_whitespace bzw. die
+        Konfliktauflösung verbinden solche Nachbarn, das muss im selben Fenster
+        passieren wie bei anonymize().
+
+        Returns:
+            Position im Text (0 < cut <= limit) oder 0 wenn nicht sinnvoll schneidbar
+        """
+        cut = limit
+        while cut > 0 and not (text[cut - 1].isspace() and not text[cut].isspace()):
+            cut -= 1
+        if cut == 0:
+            # Kein Wortanfang im Fenster (z.B. riesiger Block ohne Leerzeichen)
+            cut = limit
+
+        # Treffer über der Schnittstelle oder nur durch Leerzeichen getrennte
+        # Nachbarn beiderseits → vor den vorderen Treffer schneiden (bis stabil)
+        moved = True
+        while moved:
+            moved = False
+            left = cut
+            while left > 0 and text[left - 1] == ' ':
+                left -= 1
+            right = cut
+            while right < len(text) and text[right] == ' ':
+                right += 1
+            linked = any(cut <= r.start <= right for r in results)
+            for r in results:
+                if r.start < cut < r.end or (linked and r.start < cut and left <= r.end <= cut):
+                    cut = r.start
+                    moved = True
+                    break
+
+        return cut
+
+    @staticmethod
+    def _raw_offset(raw: str, position: int) -> int:
+        """
+        Rechnet eine Position im normalisierten Text auf den Original-Text zurück
+
+        _normalize_multiline_names ersetzt "Name\\n   " durch "Name " - davor und
+        dahinter verschieben sich die Positionen um die entfernten Zeichen.
+        """
+        delta = 0
+        for match in _MULTILINE_NAME_RE.finditer(raw):
+            normalized_start = match.start() - delta
+            if position <= normalized_start:
+                break
+            replaced = len(match.group(1)) + 1
+            if position < normalized_start + replaced:
+                return match.start() + (position - normalized_start)
+            delta += (match.end() - match.start()) - replaced
+        return position + delta
+
+    @staticmethod
+    def _count_entities(results: List[Span], entity_counts: Dict[str, int]):
+        """Zählt Treffer pro Entity-Typ (überlappende Treffer zählen nur einmal)"""
+        covered_end = -1
+        for r in sorted(results, key=lambda r: (r.start, -r.end)):
+            if r.start >= covered_end:
+                entity_counts[r.entity_type] = entity_counts.get(r.entity_type, 0) + 1
+                covered_end = r.end
+            else:
+                covered_end = max(covered_end, r.end)
+
+    def anonymize_stream(self, source: Union[Iterable[str], TextIO],
+                         entities_to_anonymize: Optional[List[str]] = None,
+                         entity_counts: Optional[Dict[str, int]] = None) -> Iterator[str]:
+        """
+        Anonymisiert sehr große Texte in überlappenden Fenstern (Generator)
+
+        Der Speicherbedarf bleibt durch Fenstergröße + Überlappung begrenzt, egal
+        wie groß die Eingabe ist. Die Überlappung muss mindestens so groß sein wie
+        der längste mögliche Treffer ([advanced] stream_overlap_chars), damit
+        Entities über Fenstergrenzen hinweg vollständig erkannt werden.
+
+        Args:
+            source: Iterable von Text-Stücken oder eine geöffnete Textdatei
+            entities_to_anonymize: Entity-Typen (None = DEFAULT_ENTITIES)
+            entity_counts: Optional - wird um die Anzahl ersetzter Entities pro Typ erhöht
+
+        Zusammengesetzt ergibt sich in aller Regel dasselbe wie anonymize() auf
+        dem Gesamttext. Garantiert ist nur, dass an einer Schnittstelle kein
+        Treffer verloren geht (siehe _find_stream_cut): ein Fenster beginnt
+        ohne den Text davor, einzelne Patterns können dort zusätzlich treffen
+        (z.B. "Prof. Hauptstr" als Name, wenn ihn vorher ein längerer, später
+        verworfener Treffer verdeckt hätte) - dann wird eher mehr ersetzt.
+
+        Yields:
+            Anonymisierte Text-Stücke
+        """
+        if entities_to_anonymize is None:
+            entities_to_anonymize = DEFAULT_ENTITIES
+
+        if not self.is_initialized():
+            logger.warning("Presidio nicht initialisiert, initialisiere jetzt...")
+            if not self.initialize():
+                raise RuntimeError("Presidio konnte nicht initialisiert werden!")
+
+        window = self.stream_window_chars
+        overlap = self.stream_overlap_chars
+
+        # Dateien und große Strings in Fenster-Stücken lesen
+        if hasattr(source, 'read'):
+            pieces = iter(lambda: source.read(window), '')
+        elif isinstance(source, str):
+            pieces = (source[i:i + window] for i in range(0, len(source), window))
+        else:
+            # Auch riesige Stücke eines Iterables (z.B. sys.stdin.read()) fensterweise
+            pieces = (piece[i:i + window] for piece in source for i in range(0, len(piece), window))
+
+        buffer = ""
+        windows = 0
+        total_chars = 0
+        start_time = time.time()
+
+        for piece in pieces:
+            buffer += piece
+            total_chars += len(piece)
+
+            while len(buffer) >= window + overlap:
+                text_normalized = self._normalize_multiline_names(buffer)
+                results = self._detect(text_normalized, entities_to_anonymize)
+
+                # Alles hinter der Schnittstelle wird im nächsten Fenster neu analysiert
+                limit = min(window, len(text_normalized) - overlap)
+                cut = self._find_stream_cut(text_normalized, limit, results)
+                if cut == 0:
+                    # Treffer am Fensteranfang ist länger als das Fenster: komplett ausgeben
+                    cut = max(r.end for r in results if r.start == 0)
+
+                head_results = [r for r in results if r.end <= cut]
+                if entity_counts is not None:
+                    self._count_entities(head_results, entity_counts)
+                yield self._apply_operators(text_normalized[:cut], head_results)
+
+                # Original-Rest behalten: die Normalisierung im nächsten Fenster
+                # sieht dann denselben Text wie anonymize() (auch Leerraum am Ende)
+                buffer = buffer[self._raw_offset(buffer, cut):]
+                windows += 1
+
+        if buffer:
+            text_normalized = self._normalize_multiline_names(buffer)
+            results = self._detect(text_normalized, entities_to_anonymize)
+            if entity_counts is not None:
+                self._count_entities(results, entity_counts)
+            yield self._apply_operators(text_normalized, results)
+            windows += 1
+
+        elapsed = time.time() - start_time
+        logger.info(f"Stream anonymisiert: {total_chars} Zeichen in {windows} Fenstern ({elapsed:.2f}s)")
+
 
 # Singleton Instance
 _anonymizer_instance = None
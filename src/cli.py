@@ -0,0 +1,324 @@
+"""
+Kommandozeile: ganze Ordner/Akten-Archive anonymisieren
+
+Aufruf:
+    python -m src.cli anonymize EINGABE... -o AUSGABEORDNER [--workers N] [--mmap | --parallel]
+
+EINGABE sind Dateien oder Ordner. Ordner werden rekursiv nach .txt, .md und
+.eml durchsucht, die Ordnerstruktur wird im Ausgabeordner nachgebildet.
+
+- Mehrere Worker-Prozesse (Standard: [advanced] parallel_workers), jeder mit
+  einem eigenen, einmal initialisierten TextAnonymizer
+- Mit --parallel werden die Dateien nacheinander bearbeitet und jede große
+  Datei (ab parallel_min_chars) auf die Worker verteilt (ParallelAnonymizer) -
+  für wenige sehr große Dateien. Die Datei liegt dabei ganz im Speicher.
+- Jede Datei wird per anonymize_stream in Fenstern gelesen und geschrieben
+  (begrenzter Speicher, auch bei sehr großen Dateien); mit --mmap wird die
+  Eingabe zusätzlich per mmap fensterweise eingeblendet statt gelesen
+- Kodierung (UTF-8, UTF-8 mit BOM, UTF-16, Windows-1252) und Zeilenenden
+  bleiben erhalten
+- Atomares Schreiben: erst in eine temporäre Datei, dann umbenennen - ein
+  Abbruch hinterlässt nie halb anonymisierte Dateien
+- Am Ende: Dateien/s, MB/s und Anzahl ersetzter Entities pro Typ
+"""
+
+import os
+import sys
+import time
+import io
+import mmap
+import codecs
+import shutil
+import logging
+import argparse
+import tempfile
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    from .anonymizer import TextAnonymizer
+    from .config_loader import get_config
+    from .parallel import ParallelAnonymizer
+except ImportError:
+    from anonymizer import TextAnonymizer
+    from config_loader import get_config
+    from parallel import ParallelAnonymizer
+
+logger = logging.getLogger(__name__)
+
+# Dateitypen, die beim Durchsuchen von Ordnern anonymisiert werden
+FILE_EXTENSIONS = ('.txt', '.md', '.eml')
+# Bytes, die zur Erkennung von Kodierung und Zeilenenden gelesen werden
+SNIFF_BYTES = 64 * 1024
+
+# Anonymizer im Worker-Prozess (wird im Initializer erstellt)
+_worker_anonymizer: Optional[TextAnonymizer] = None
+
+
+class FileResult(NamedTuple):
+    """Ergebnis einer anonymisierten Datei"""
+    source: str
+    target: str
+    size: int                     # Bytes der Eingabe
+    entity_counts: Dict[str, int]
+    error: Optional[str]
+
+
+def detect_encoding(sample: bytes) -> Tuple[str, Optional[str]]:
+    """
+    Erkennt Kodierung und Zeilenende anhand der ersten Bytes einer Datei
+
+    Returns:
+        (kodierung, zeilenende) - zeilenende None = keine Zeilenumbrüche gefunden
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        encoding = 'utf-8-sig'
+    elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = 'utf-16'
+    else:
+        try:
+            # Inkrementell: ein am Ende der Probe abgeschnittenes Zeichen ist kein Fehler
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            encoding = 'utf-8'
+        except UnicodeDecodeError:
+            encoding = 'cp1252'
+
+    if encoding == 'utf-16':
+        sample = sample.decode('utf-16', errors='ignore').encode('utf-8')
+    if b'\r\n' in sample:
+        newline = '\r\n'
+    elif b'\n' in sample:
+        newline = '\n'
+    elif b'\r' in sample:
+        newline = '\r'
+    else:
+        newline = None
+    return encoding, newline
+
+
+def _sniff(path: str) -> Tuple[str, Optional[str]]:
+    """Kodierung und Zeilenende einer Datei (aus den ersten SNIFF_BYTES)"""
+    with open(path, 'rb') as f:
+        return detect_encoding(f.read(SNIFF_BYTES))
+
+
+def read_mapped(path: str, encoding: str, window_bytes: int) -> Iterator[str]:
+    """
+    Liest eine Datei per mmap in ausgerichteten Fenstern und dekodiert sie schrittweise
+
+    Pro Fenster wird nur ein Ausschnitt der Datei eingeblendet (Offset ein
+    Vielfaches von mmap.ALLOCATIONGRANULARITY) und danach wieder freigegeben -
+    der Arbeitsspeicher bleibt proportional zur Fenstergröße, nicht zur
+    Dateigröße. Über Fenstergrenzen geteilte Multibyte-Zeichen und \r\n hält
+    der inkrementelle Decoder zurück.
+
+    Yields:
+        Text-Stücke (Zeilenenden vereinheitlicht wie beim Öffnen im Textmodus)
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(errors='surrogateescape'), translate=True
+    )
+    granularity = mmap.ALLOCATIONGRANULARITY
+    window_bytes = max(granularity, window_bytes // granularity * granularity)
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as f:
+        for offset in range(0, size, window_bytes):
+            length = min(window_bytes, size - offset)
+            with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as view:
+                text = decoder.decode(view[:])
+            if text:
+                yield text
+
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def anonymize_file(anonymizer: TextAnonymizer, source: str, target: str, use_mmap: bool = False,
+                   parallel: Optional[ParallelAnonymizer] = None) -> Dict[str, int]:
+    """
+    Anonymisiert eine Datei und schreibt das Ergebnis atomar nach target
+
+    Nicht dekodierbare Bytes werden per surrogateescape durchgereicht und beim
+    Schreiben unverändert wiederhergestellt.
+
+    Args:
+        anonymizer: Initialisierter TextAnonymizer
+        source: Eingabedatei
+        target: Ausgabedatei
+        use_mmap: Eingabe per mmap in Fenstern lesen (für Dateien im GB-Bereich)
+        parallel: Datei ganz lesen und auf mehrere Prozesse verteilt anonymisieren
+
+    Returns:
+        Anzahl ersetzter Entities pro Typ
+    """
+    entity_counts: Dict[str, int] = {}
+    encoding, newline = _sniff(source)
+
+    target_dir = os.path.dirname(os.path.abspath(target))
+    os.makedirs(target_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=target_dir, prefix='.' + os.path.basename(target) + '.', suffix='.tmp')
+    try:
+        with contextlib.ExitStack() as stack:
+            target_file = stack.enter_context(
+                open(fd, 'w', encoding=encoding, errors='surrogateescape', newline=newline or '\n')
+            )
+            if use_mmap:
+                pieces = read_mapped(source, encoding, anonymizer.stream_window_chars)
+            else:
+                pieces = stack.enter_context(
+                    open(source, 'r', encoding=encoding, errors='surrogateescape', newline=None)
+                )
+            if parallel is not None:
+                target_file.write(parallel.anonymize(''.join(pieces), entity_counts=entity_counts))
+            else:
+                for piece in anonymizer.anonymize_stream(pieces, entity_counts=entity_counts):
+                    target_file.write(piece)
+        # mkstemp legt 0600 an → Rechte der Quelldatei übernehmen
+        shutil.copymode(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return entity_counts
+
+
+def _create_anonymizer() -> TextAnonymizer:
+    """Anonymizer für Massenverarbeitung (ohne Ergebnis-/Absatz-Cache)"""
+    anonymizer = TextAnonymizer(language="de")
+    anonymizer.result_cache.max_entries = 0
+    anonymizer.use_incremental = False
+    if not anonymizer.initialize():
+        raise RuntimeError("Presidio konnte nicht initialisiert werden!")
+    return anonymizer
+
+
+def _init_worker():
+    """Initializer: Erstellt pro Worker-Prozess einen TextAnonymizer"""
+    global _worker_anonymizer
+    _worker_anonymizer = _create_anonymizer()
+
+
+def _process_file(job: Tuple[str, str, bool], parallel: Optional[ParallelAnonymizer] = None) -> FileResult:
+    """Anonymisiert eine Datei im Worker (Fehler werden zurückgegeben, nicht geworfen)"""
+    source, target, use_mmap = job
+    size = os.path.getsize(source)
+    try:
+        entity_counts = anonymize_file(_worker_anonymizer, source, target, use_mmap, parallel)
+        return FileResult(source, target, size, entity_counts, None)
+    except Exception as e:
+        logger.error(f"Fehler bei {source}: {e}", exc_info=True)
+        return FileResult(source, target, size, {}, str(e))
+
+
+def collect_files(inputs: List[str], output_dir: str) -> Iterator[Tuple[str, str]]:
+    """
+    Sammelt (eingabe, ausgabe)-Paare
+
+    Dateien landen direkt im Ausgabeordner, Ordner werden rekursiv mit ihrer
+    relativen Struktur abgebildet. Der Ausgabeordner selbst wird übersprungen.
+    """
+    output_dir = os.path.abspath(output_dir)
+    for path in inputs:
+        if os.path.isfile(path):
+            yield path, os.path.join(output_dir, os.path.basename(path))
+            continue
+        if not os.path.isdir(path):
+            logger.warning(f"Eingabe nicht gefunden: {path}")
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if os.path.abspath(os.path.join(root, d)) != output_dir)
+            for name in sorted(files):
+                if name.lower().endswith(FILE_EXTENSIONS):
+                    source = os.path.join(root, name)
+                    yield source, os.path.join(output_dir, os.path.relpath(source, path))
+
+
+def anonymize_paths(inputs: List[str], output_dir: str, workers: Optional[int] = None,
+                    use_mmap: bool = False, parallel: bool = False) -> List[FileResult]:
+    """
+    Anonymisiert alle Dateien der Eingaben nach output_dir
+
+    Args:
+        inputs: Dateien und/oder Ordner
+        output_dir: Zielordner
+        workers: Anzahl Worker-Prozesse (Standard: [advanced] parallel_workers, 1 = ohne Pool)
+        use_mmap: Eingaben per mmap in Fenstern lesen (siehe read_mapped)
+        parallel: Dateien nacheinander, jede auf die Worker verteilt (ParallelAnonymizer)
+
+    Returns:
+        Ergebnis pro Datei (in Eingabe-Reihenfolge)
+    """
+    jobs = [(source, target, use_mmap) for source, target in collect_files(inputs, output_dir)]
+    if workers is None:
+        workers = get_config().get_parallel_workers()
+
+    if parallel:
+        if _worker_anonymizer is None:
+            _init_worker()
+        with ParallelAnonymizer(_worker_anonymizer, workers=max(1, workers)) as parallel_anonymizer:
+            return [_process_file(job, parallel_anonymizer) for job in jobs]
+
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1:
+        if _worker_anonymizer is None:
+            _init_worker()
+        return [_process_file(job) for job in jobs]
+
+    logger.info(f"Starte {workers} Worker-Prozesse für {len(jobs)} Dateien...")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        # Kleine Pakete: wenig IPC-Overhead, trotzdem gleichmäßige Auslastung
+        chunksize = max(1, min(16, len(jobs) // (workers * 8)))
+        return list(executor.map(_process_file, jobs, chunksize=chunksize))
+
+
+def _print_report(results: List[FileResult], elapsed: float):
+    total_bytes = sum(result.size for result in results)
+    failed = [result for result in results if result.error]
+    entity_counts: Dict[str, int] = {}
+    for result in results:
+        for entity_type, count in result.entity_counts.items():
+            entity_counts[entity_type] = entity_counts.get(entity_type, 0) + count
+
+    elapsed = max(elapsed, 1e-9)
+    print(f"{len(results) - len(failed)}/{len(results)} Dateien anonymisiert in {elapsed:.1f}s")
+    print(f"  {len(results) / elapsed:.1f} Dateien/s, {total_bytes / (1024 * 1024) / elapsed:.2f} MB/s")
+    if entity_counts:
+        print("  Ersetzte Entities:")
+        for entity_type, count in sorted(entity_counts.items(), key=lambda item: (-item[1], item[0])):
+            print(f"    {entity_type:<20} {count:>8}")
+    for result in failed:
+        print(f"  FEHLER {result.source}: {result.error}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Kommandozeile"""
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Anonymify Kommandozeile")
+    commands = parser.add_subparsers(dest="command", required=True)
+    anonymize_parser = commands.add_parser("anonymize", help="Dateien und Ordner anonymisieren")
+    anonymize_parser.add_argument("inputs", nargs="+", help="Dateien oder Ordner (.txt, .md, .eml)")
+    anonymize_parser.add_argument("-o", "--output", required=True, help="Ausgabeordner")
+    anonymize_parser.add_argument("-w", "--workers", type=int, help="Worker-Prozesse (Standard: [advanced] parallel_workers)")
+    read_mode = anonymize_parser.add_mutually_exclusive_group()
+    read_mode.add_argument("--mmap", action="store_true", help="Dateien per mmap in Fenstern lesen (sehr große Dateien)")
+    read_mode.add_argument("--parallel", action="store_true",
+                           help="Jede große Datei auf die Worker verteilen (wenige sehr große Dateien)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    start_time = time.perf_counter()
+    results = anonymize_paths(args.inputs, args.output, args.workers, args.mmap, args.parallel)
+    _print_report(results, time.perf_counter() - start_time)
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
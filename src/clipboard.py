@@ -0,0 +1,148 @@
+"""
+Zwischenablage nach Strg+C adaptiv lesen (statt fester Wartezeit)
+
+Vor dem Strg+C wird ein Merkmal der Zwischenablage gemerkt - unter Windows
+die Clipboard-Sequenznummer, sonst ein Digest des Inhalts. Danach wird mit
+kurzem, wachsendem Abstand (5ms, 7.5ms, 11ms, ... max. 25ms) geprüft, ob sich
+das Merkmal geändert hat. Der neue Inhalt wird sofort gelesen, sobald er da
+ist - spätestens nach der maximalen Wartezeit (clipboard_timeout_ms).
+
+Ohne Sequenznummer (Linux/macOS) ist "derselbe Text erneut kopiert" nicht
+von "noch nicht da" zu unterscheiden - dort gilt höchstens die frühere feste
+Wartezeit (clipboard_delay_ms, 200ms), damit das nicht länger dauert als vorher.
+
+Das Backend ist austauschbar (SystemClipboard = pyperclip, in Tests eine
+Fake-Zwischenablage).
+"""
+
+import sys
+import time
+import hashlib
+import logging
+from typing import Callable, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ClipboardBackend:
+    """Schnittstelle zur Zwischenablage"""
+
+    def paste(self) -> str:
+        raise NotImplementedError
+
+    def copy(self, text: str):
+        raise NotImplementedError
+
+    def sequence_number(self) -> Optional[int]:
+        """Änderungszähler des Systems (None = nicht verfügbar, Inhalt wird verglichen)"""
+        return None
+
+
+class SystemClipboard(ClipboardBackend):
+    """System-Zwischenablage über pyperclip (+ Sequenznummer unter Windows)"""
+
+    def __init__(self):
+        import pyperclip
+        self._pyperclip = pyperclip
+        self._get_sequence_number = None
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                self._get_sequence_number = ctypes.windll.user32.GetClipboardSequenceNumber
+            except (ImportError, AttributeError, OSError) as e:
+                logger.debug(f"Clipboard-Sequenznummer nicht verfügbar: {e}")
+
+    def paste(self) -> str:
+        return self._pyperclip.paste()
+
+    def copy(self, text: str):
+        self._pyperclip.copy(text)
+
+    def sequence_number(self) -> Optional[int]:
+        if self._get_sequence_number is None:
+            return None
+        return self._get_sequence_number()
+
+
+class ClipboardContent(NamedTuple):
+    """Ergebnis von ClipboardCapture.capture"""
+    text: str
+    changed: bool    # False = Wartezeit abgelaufen, bisheriger Inhalt
+    waited: float    # Sekunden vom Strg+C bis zum Lesen
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+class ClipboardCapture:
+    """Löst das Kopieren aus und wartet nur so lange, bis neuer Inhalt da ist"""
+
+    def __init__(self, backend: Optional[ClipboardBackend] = None, timeout: float = 1.0,
+                 initial_interval: float = 0.005, max_interval: float = 0.025,
+                 fallback_timeout: Optional[float] = None):
+        """
+        Args:
+            backend: Zwischenablage (Standard: SystemClipboard)
+            timeout: Maximale Wartezeit nach dem Kopieren in Sekunden
+            fallback_timeout: Maximale Wartezeit ohne Sequenznummer (None = wie timeout)
+            initial_interval: Erster Prüfabstand in Sekunden (wächst um 50% pro Prüfung)
+            max_interval: Größter Prüfabstand in Sekunden
+        """
+        self.backend = backend if backend is not None else SystemClipboard()
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.fallback_timeout = fallback_timeout
+
+    def _read_marker(self) -> Tuple[object, Optional[str]]:
+        """Merkmal des aktuellen Inhalts: Sequenznummer, sonst Digest (+ Inhalt)"""
+        sequence_number = self.backend.sequence_number()
+        if sequence_number is not None:
+            return sequence_number, None
+        text = self.backend.paste()
+        return _digest(text), text
+
+    def capture(self, send_copy: Callable[[], None]) -> ClipboardContent:
+        """
+        Führt send_copy aus (z.B. Strg+C senden) und liest den neuen Inhalt
+
+        Leerer Inhalt und Lesefehler (Quell-Programm hält die Zwischenablage
+        noch offen) gelten als "noch nicht fertig" - es wird weiter gewartet.
+
+        Returns:
+            ClipboardContent - nach Ablauf der Wartezeit mit dem bisherigen
+            Inhalt (changed=False), z.B. wenn derselbe Text erneut kopiert wurde
+        """
+        before, before_text = self._read_marker()
+        timeout = self.timeout
+        if before_text is not None and self.fallback_timeout is not None:
+            # Nur Inhalt vergleichbar: unveränderter Text sieht aus wie "noch nicht da"
+            timeout = min(timeout, self.fallback_timeout)
+
+        start = time.monotonic()
+        deadline = start + timeout
+        send_copy()
+
+        interval = self.initial_interval
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * 1.5, self.max_interval)
+
+            try:
+                marker, text = self._read_marker()
+                if marker == before:
+                    continue
+                if text is None:
+                    text = self.backend.paste()
+            except Exception as e:
+                logger.debug(f"Zwischenablage noch nicht lesbar: {e}")
+                continue
+
+            if text:
+                return ClipboardContent(text, True, time.monotonic() - start)
+
+        return ClipboardContent(self.backend.paste(), False, time.monotonic() - start)
@@ -5,6 +5,7 @@ Lädt Einstellungen aus config.toml
 """
 
 import os
+import copy
 import logging
 from typing import Dict, List, Any
 
@@ -62,14 +63,36 @@ class Config:
             'icon_color_ready': '#4CAF50',
             'icon_color_working': '#FFC107',
             'icon_color_error': '#F44336',
+            'clipboard_timeout_ms': 1000,
             'clipboard_delay_ms': 200,
             'error_reset_seconds': 3,
+            'fused_pattern_engine': True,
+            'stream_window_chars': 65536,
+            'stream_overlap_chars': 1024,
+            'parallel_workers': 0,
+            'parallel_min_chars': 200000,
+            'result_cache_entries': 128,
+            'result_cache_max_mb': 32,
+            'incremental_paragraphs': True,
+            'paragraph_cache_entries': 4096,
+            'background_warm_up': True,
+            'spacy_components': ['tok2vec', 'ner'],
+            'ner_sentence_gate': False,
+            'daemon_address': '',
+            'daemon_group': '',
+            'http_host': '127.0.0.1',
+            'http_port': 8765,
+            'http_max_batch_size': 32,
+            'http_max_wait_ms': 10,
+            'http_queue_size': 256,
         }
     }
 
     def __init__(self, config_path: str = 'config.toml'):
         self.config_path = config_path
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        # [advanced] wie in der Datei (ohne Defaults) - für umbenannte Optionen
+        self._loaded_advanced: Dict = {}
         self.load()
 
     def load(self):
@@ -88,6 +111,7 @@ class Config:
                 loaded_config = self._parse_toml_simple(self.config_path)
 
             # Merge mit Default Config
+            self._loaded_advanced = loaded_config.get('advanced', {})
             self._merge_config(loaded_config)
             logger.info(f"Konfiguration geladen: {self.config_path}")
 
@@ -192,9 +216,21 @@ class Config:
             'error': self.config['advanced']['icon_color_error'],
         }
 
+    def get_clipboard_timeout(self) -> float:
+        """
+        Gibt die maximale Wartezeit auf neuen Clipboard-Inhalt nach Strg+C in Sekunden zurück
+
+        Alte config.toml kennen nur clipboard_delay_ms (feste Wartezeit) - ohne
+        clipboard_timeout_ms gilt deren Wert weiter.
+        """
+        loaded = self._loaded_advanced
+        if 'clipboard_timeout_ms' not in loaded and 'clipboard_delay_ms' in loaded:
+            return loaded['clipboard_delay_ms'] / 1000.0
+        return self.config['advanced'].get('clipboard_timeout_ms', 1000) / 1000.0
+
     def get_clipboard_delay(self) -> float:
-        """Gibt Clipboard-Verzögerung in Sekunden zurück"""
-        return self.config['advanced']['clipboard_delay_ms'] / 1000.0
+        """Gibt die maximale Wartezeit ohne Clipboard-Sequenznummer (Linux/macOS) in Sekunden zurück"""
+        return self.config['advanced'].get('clipboard_delay_ms', 200) / 1000.0
 
     def get_error_reset_time(self) -> int:
         """Gibt Error-Reset Zeit in Sekunden zurück"""
@@ -204,6 +240,76 @@ class Config:
         """Gibt Log-Level zurück"""
         return self.config['advanced']['log_level']
 
+    def is_fused_pattern_engine_enabled(self) -> bool:
+        """Prüft ob die Fused Pattern Engine im fast-Modus genutzt wird"""
+        return self.config['advanced'].get('fused_pattern_engine', True)
+
+    def get_stream_window_chars(self) -> int:
+        """Gibt die Fenstergröße für anonymize_stream in Zeichen zurück"""
+        return self.config['advanced'].get('stream_window_chars', 65536)
+
+    def get_stream_overlap_chars(self) -> int:
+        """Gibt die Überlappung der Stream-Fenster in Zeichen zurück (>= längster Treffer)"""
+        return self.config['advanced'].get('stream_overlap_chars', 1024)
+
+    def get_parallel_workers(self) -> int:
+        """Gibt die Anzahl Worker-Prozesse für den Parallel-Modus zurück (0 = alle CPU-Kerne)"""
+        workers = self.config['advanced'].get('parallel_workers', 0)
+        if not workers or workers < 1:
+            workers = os.cpu_count() or 1
+        return workers
+
+    def get_parallel_min_chars(self) -> int:
+        """Gibt die Mindest-Textlänge zurück, ab der parallel anonymisiert wird"""
+        return self.config['advanced'].get('parallel_min_chars', 200000)
+
+    def get_result_cache_entries(self) -> int:
+        """Gibt die maximale Anzahl Einträge im Ergebnis-Cache zurück (0 = aus)"""
+        return self.config['advanced'].get('result_cache_entries', 128)
+
+    def get_result_cache_max_mb(self) -> int:
+        """Gibt die maximale Größe des Ergebnis-Caches in MB zurück"""
+        return self.config['advanced'].get('result_cache_max_mb', 32)
+
+    def is_incremental_enabled(self) -> bool:
+        """Prüft ob unveränderte Absätze beim erneuten Anonymisieren wiederverwendet werden"""
+        return self.config['advanced'].get('incremental_paragraphs', True)
+
+    def get_paragraph_cache_entries(self) -> int:
+        """Gibt die maximale Anzahl gecachter Absätze zurück (0 = aus)"""
+        return self.config['advanced'].get('paragraph_cache_entries', 4096)
+
+    def is_background_warm_up_enabled(self) -> bool:
+        """Prüft ob spaCy beim Start im Hintergrund geladen wird (Hotkey sofort aktiv)"""
+        return self.config['advanced'].get('background_warm_up', True)
+
+    def get_spacy_components(self) -> List[str]:
+        """Gibt die spaCy-Komponenten zurück, die geladen werden (leer = alle)"""
+        return self.config['advanced'].get('spacy_components', ['tok2vec', 'ner'])
+
+    def is_ner_sentence_gate_enabled(self) -> bool:
+        """Prüft ob spaCy nur auf Sätze mit Namens-Hinweis läuft (balanced/accurate)"""
+        return self.config['advanced'].get('ner_sentence_gate', False)
+
+    def get_daemon_address(self) -> str:
+        """Gibt Socket-Pfad bzw. Pipe-Name des Daemons zurück (leer = Standard)"""
+        return self.config['advanced'].get('daemon_address', '')
+
+    def get_daemon_group(self) -> str:
+        """Gibt die Unix-Gruppe eines gemeinsamen Daemons zurück (leer = ein Daemon pro Benutzer)"""
+        return self.config['advanced'].get('daemon_group', '')
+
+    def get_http_server_settings(self) -> Dict[str, Any]:
+        """Gibt die Einstellungen des HTTP-Dienstes zurück (python -m src.http_server)"""
+        advanced = self.config['advanced']
+        return {
+            'host': advanced.get('http_host', '127.0.0.1'),
+            'port': advanced.get('http_port', 8765),
+            'max_batch_size': advanced.get('http_max_batch_size', 32),
+            'max_wait_ms': advanced.get('http_max_wait_ms', 10),
+            'queue_size': advanced.get('http_queue_size', 256),
+        }
+
     def get_recognition_mode(self) -> str:
         """Gibt Erkennungs-Modus zurück (fast/balanced/accurate)"""
         return self.config['anonymization'].get('recognition_mode', 'fast')
@@ -0,0 +1,509 @@
+"""
+Anonymify-Daemon: ein warmer Anonymizer für viele Prozesse
+
+Der Daemon hält einen initialisierten TextAnonymizer (Registry, Patterns,
+spaCy-Modell) im Speicher und beantwortet Anfragen über einen lokalen
+Socket - Unix Domain Socket (Linux/macOS) bzw. Named Pipe (Windows).
+Andere Prozesse (Skripte, Batch-Jobs) sparen damit Startzeit und
+Arbeitsspeicher.
+
+Die Texte sind Klartext-Mandantendaten. Standard: jeder Benutzer hat seinen
+eigenen Daemon. Der Socket liegt in einem nur für ihn zugänglichen
+Verzeichnis ($XDG_RUNTIME_DIR bzw. anonymify-<uid> im Temp-Ordner, Rechte
+0700), ist selbst nur für ihn les- und schreibbar, und der Client verbindet
+sich nur mit einem Socket, der dem eigenen Benutzer gehört.
+
+Gemeinsamer Daemon (Terminal-Server, [advanced] daemon_group bzw. --group):
+alle Mitglieder einer Unix-Gruppe nutzen ein geladenes Modell. Der Socket
+liegt dann in anonymify-group-<gid> im Temp-Ordner (gehört dem Benutzer des
+Daemons, Gruppe = daemon_group, Rechte 0750), der Socket hat 0660. Unter
+Linux prüft der Daemon zusätzlich bei jeder Verbindung per SO_PEERCRED, ob
+der Prozess dem eigenen Benutzer oder einem Mitglied der Gruppe gehört. Der
+Client verbindet sich nur, wenn das Verzeichnis zur Gruppe gehört, für
+niemanden außer dem Besitzer schreibbar ist und der Socket dem Besitzer des
+Verzeichnisses gehört. Die Mitglieder der Gruppe vertrauen damit dem
+Benutzer, der den Daemon startet (am besten ein eigener Dienst-Benutzer).
+Unter Windows gibt es nur den Daemon pro Benutzer.
+
+Protokoll (multiprocessing.connection, send_bytes/recv_bytes):
+    Jede Nachricht ist ein Frame: 4 Byte Länge (big-endian, signed) + Nutzdaten.
+    Nutzdaten sind UTF-8-JSON (kein pickle):
+        Anfrage:  {"op": "anonymize", "text": "...", "entities": [...] (optional)}
+                  {"op": "anonymize_batch", "texts": [...], "entities": [...] (optional)}
+                  {"op": "ping"} / {"op": "stats"}
+        Antwort:  {"ok": true, "text": "..."} / {"ok": true, "texts": [...]}
+                  {"ok": false, "error": "..."}
+
+Aufruf:
+    python -m src.daemon serve                 # Daemon starten (Strg+C beendet)
+    python -m src.daemon --group anonymify serve   # gemeinsamer Daemon für die Gruppe
+    python -m src.daemon anonymize datei.txt   # Datei über den Daemon anonymisieren
+    echo "Herr Max Müller" | python -m src.daemon anonymize
+    python -m src.daemon ping | stats
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import struct
+import logging
+import stat
+import signal
+import getpass
+import argparse
+import tempfile
+import threading
+from multiprocessing.connection import Client, Listener
+from typing import Any, Dict, List, Optional, Tuple
+
+# Nur die Config importieren - der Client soll ohne Presidio/spaCy auskommen
+try:
+    from .config_loader import get_config
+except ImportError:
+    from config_loader import get_config
+
+logger = logging.getLogger(__name__)
+
+# Maximale Größe einer Nachricht (schützt den Daemon vor riesigen Frames)
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+def _private_dir() -> str:
+    """
+    Verzeichnis für den Socket, das nur dem aktuellen Benutzer gehört
+
+    $XDG_RUNTIME_DIR (systemd, bereits 0700), sonst anonymify-<uid> im
+    Temp-Ordner - wird mit 0700 angelegt und geprüft, damit kein anderer
+    Benutzer es vorher anlegen (und den Socket unterschieben) kann.
+
+    Raises:
+        RuntimeError: Verzeichnis gehört einem anderen Benutzer oder ist für andere zugänglich
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return runtime_dir
+
+    path = os.path.join(tempfile.gettempdir(), f"anonymify-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"Unsicheres Socket-Verzeichnis (fremder Besitzer oder Rechte): {path}")
+    return path
+
+
+def _group_id(group: str) -> int:
+    """
+    Gruppen-ID zu daemon_group
+
+    Raises:
+        RuntimeError: Gruppe unbekannt oder Windows (kein gemeinsamer Daemon)
+    """
+    if sys.platform == "win32":
+        raise RuntimeError("daemon_group wird unter Windows nicht unterstützt")
+    import grp
+    try:
+        return grp.getgrnam(group).gr_gid
+    except KeyError:
+        raise RuntimeError(f"Unbekannte Gruppe: {group}") from None
+
+
+def _shared_dir(group: str) -> str:
+    """
+    Verzeichnis für den gemeinsamen Socket einer Gruppe
+
+    anonymify-group-<gid> im Temp-Ordner: gehört dem Benutzer des Daemons,
+    Gruppe = group, Rechte 0750 (Mitglieder dürfen verbinden, aber keinen
+    eigenen Socket unterschieben). Legt es an, wenn es noch fehlt.
+
+    Raises:
+        RuntimeError: Verzeichnis gehört einem anderen Benutzer oder hat andere Rechte
+    """
+    gid = _group_id(group)
+    path = os.path.join(tempfile.gettempdir(), f"anonymify-group-{gid}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    else:
+        os.chown(path, -1, gid)
+        os.chmod(path, 0o750)
+
+    info = os.lstat(path)
+    if info.st_uid != os.getuid() or not _is_shared_dir(info, gid):
+        raise RuntimeError(f"Unsicheres Socket-Verzeichnis (fremder Besitzer oder Rechte): {path}")
+    return path
+
+
+def _is_shared_dir(info: os.stat_result, gid: int) -> bool:
+    """Verzeichnis der Gruppe, schreibbar nur für den Besitzer, für andere gesperrt"""
+    return stat.S_ISDIR(info.st_mode) and info.st_gid == gid and not info.st_mode & 0o027
+
+
+def default_address(group: str = "") -> str:
+    """
+    Standard-Adresse: eine pro Benutzer (Klartext-Daten gehen nie an fremde
+    Prozesse), mit group eine gemeinsame für alle Mitglieder der Gruppe
+    """
+    if group:
+        return os.path.join(tempfile.gettempdir(), f"anonymify-group-{_group_id(group)}", "anonymify.sock")
+    if sys.platform == "win32":
+        return rf"\\.\pipe\anonymify-{getpass.getuser()}"
+    return os.path.join(_private_dir(), "anonymify.sock")
+
+
+def _is_allowed_peer(uid: int, gid: int, group_id: Optional[int]) -> bool:
+    """Prozess (uid/gid) darf verbinden: eigener Benutzer oder Mitglied der Gruppe"""
+    if uid == os.getuid():
+        return True
+    if group_id is None:
+        return False
+    if gid == group_id:
+        return True
+    import grp
+    import pwd
+    try:
+        return pwd.getpwuid(uid).pw_name in grp.getgrgid(group_id).gr_mem
+    except KeyError:
+        return False
+
+
+def _peer_credentials(connection) -> Optional[Tuple[int, int]]:
+    """(uid, gid) des Prozesses am anderen Ende (Linux: SO_PEERCRED), sonst None"""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    with socket.socket(fileno=os.dup(connection.fileno())) as sock:
+        credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, gid = struct.unpack("3i", credentials)
+    return uid, gid
+
+
+def _family(address: str) -> str:
+    return "AF_PIPE" if address.startswith("\\\\") else "AF_UNIX"
+
+
+def _get_group(group: Optional[str] = None) -> str:
+    """Gruppe aus Parameter, sonst [advanced] daemon_group ("" = Daemon pro Benutzer)"""
+    if group is not None:
+        return group
+    try:
+        return get_config().get_daemon_group()
+    except Exception:
+        return ""
+
+
+def _get_address(address: Optional[str] = None, group: str = "") -> str:
+    """Adresse aus Parameter, sonst [advanced] daemon_address, sonst Standard"""
+    if address:
+        return address
+    try:
+        configured = get_config().get_daemon_address()
+    except Exception:
+        configured = ""
+    return configured or default_address(group)
+
+
+def _send(connection, message: Dict[str, Any]):
+    connection.send_bytes(json.dumps(message, ensure_ascii=False).encode("utf-8"))
+
+
+def _receive(connection) -> Dict[str, Any]:
+    return json.loads(connection.recv_bytes(MAX_MESSAGE_BYTES).decode("utf-8"))
+
+
+class AnonymizerDaemon:
+    """Server: nimmt Verbindungen an und beantwortet Anfragen mit einem warmen Anonymizer"""
+
+    def __init__(self, address: Optional[str] = None, anonymizer=None, group: Optional[str] = None):
+        """
+        Args:
+            address: Socket-Pfad bzw. Pipe-Name (Standard: siehe default_address)
+            anonymizer: TextAnonymizer (Standard: get_anonymizer())
+            group: Unix-Gruppe, deren Mitglieder den Daemon mitbenutzen dürfen
+                   (Standard: [advanced] daemon_group, "" = nur der eigene Benutzer)
+        """
+        if anonymizer is None:
+            try:
+                from .anonymizer import get_anonymizer
+            except ImportError:
+                from anonymizer import get_anonymizer
+            anonymizer = get_anonymizer()
+
+        self.group = _get_group(group)
+        self.group_id = _group_id(self.group) if self.group else None
+        self.address = _get_address(address, self.group)
+        self.anonymizer = anonymizer
+        self.listener = None
+        self.started_at = None
+        self.requests = 0
+        self.chars = 0
+        self.connections = 0
+        # Presidio/spaCy sind nicht für parallele Aufrufe gedacht → Anfragen nacheinander
+        self._lock = threading.Lock()
+
+    def _prepare_address(self):
+        """Entfernt eine verwaiste Socket-Datei, bricht ab wenn schon ein Daemon läuft"""
+        if _family(self.address) != "AF_UNIX" or not os.path.exists(self.address):
+            return
+        try:
+            Client(self.address, family="AF_UNIX").close()
+        except OSError:
+            logger.info(f"Entferne verwaiste Socket-Datei: {self.address}")
+            os.unlink(self.address)
+        else:
+            raise RuntimeError(f"Daemon läuft bereits: {self.address}")
+
+    def start(self):
+        """Initialisiert den Anonymizer und öffnet den Socket"""
+        config = self.anonymizer.config
+        progressive = config.is_background_warm_up_enabled() if config else True
+        if not self.anonymizer.is_initialized() and not self.anonymizer.initialize(progressive=progressive):
+            raise RuntimeError("Presidio konnte nicht initialisiert werden!")
+        self.anonymizer.start_warm_up()
+
+        if self.group and self.address == default_address(self.group):
+            # Gemeinsames Verzeichnis anlegen/prüfen (bei daemon_address: Sache des Administrators)
+            _shared_dir(self.group)
+        self._prepare_address()
+        self.listener = Listener(self.address, family=_family(self.address))
+        if _family(self.address) == "AF_UNIX":
+            if self.group:
+                # Benutzer + Gruppe dürfen verbinden
+                os.chown(self.address, -1, self.group_id)
+                os.chmod(self.address, 0o660)
+            else:
+                # Nur der eigene Benutzer darf verbinden
+                os.chmod(self.address, 0o600)
+
+        self.started_at = time.time()
+        logger.info(f"Daemon bereit: {self.address} (Engine: {self.anonymizer.active_engine})")
+
+    def serve_forever(self):
+        """Nimmt Verbindungen an (blockiert bis close() oder Strg+C)"""
+        if self.listener is None:
+            self.start()
+
+        while self.listener is not None:
+            try:
+                connection = self.listener.accept()
+            except OSError:
+                if self.listener is None:
+                    break
+                logger.warning("Verbindung konnte nicht angenommen werden", exc_info=True)
+                continue
+
+            if _family(self.address) == "AF_UNIX":
+                credentials = _peer_credentials(connection)
+                if credentials is not None and not _is_allowed_peer(*credentials, self.group_id):
+                    logger.warning(f"Verbindung von fremdem Benutzer abgelehnt (uid {credentials[0]})")
+                    connection.close()
+                    continue
+
+            self.connections += 1
+            threading.Thread(target=self._handle_connection, args=(connection,), daemon=True).start()
+
+    def close(self):
+        """Schließt den Socket"""
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.close()
+            logger.info("Daemon beendet")
+
+    def _handle_connection(self, connection):
+        """Beantwortet alle Anfragen einer Verbindung bis der Client trennt"""
+        with connection:
+            while True:
+                try:
+                    request = _receive(connection)
+                except EOFError:
+                    return
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ungültige Anfrage, trenne Verbindung: {e}")
+                    return
+
+                try:
+                    response = self.handle_request(request)
+                except Exception as e:
+                    logger.error(f"Fehler bei Anfrage: {e}", exc_info=True)
+                    response = {"ok": False, "error": str(e)}
+
+                try:
+                    _send(connection, response)
+                except OSError:
+                    return
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Führt eine Anfrage aus und gibt die Antwort zurück"""
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Anfrage muss ein JSON-Objekt sein"}
+
+        op = request.get("op")
+        entities = request.get("entities")
+        if entities is not None and not (
+            isinstance(entities, list) and all(isinstance(entity, str) for entity in entities)
+        ):
+            return {"ok": False, "error": "Feld 'entities' muss eine Liste von Strings sein"}
+
+        if op == "anonymize":
+            text = request.get("text")
+            if not isinstance(text, str):
+                return {"ok": False, "error": "Feld 'text' fehlt"}
+            with self._lock:
+                result = self.anonymizer.anonymize(text, entities)
+            self.requests += 1
+            self.chars += len(text)
+            return {"ok": True, "text": result}
+
+        if op == "anonymize_batch":
+            texts = request.get("texts")
+            if not isinstance(texts, list):
+                return {"ok": False, "error": "Feld 'texts' fehlt"}
+            if not all(isinstance(text, str) for text in texts):
+                return {"ok": False, "error": "Feld 'texts' darf nur Strings enthalten"}
+            with self._lock:
+                results = self.anonymizer.anonymize_batch(texts, entities)
+            self.requests += 1
+            self.chars += sum(len(text) for text in texts if text)
+            return {"ok": True, "texts": results}
+
+        if op == "ping":
+            return {"ok": True}
+
+        if op == "stats":
+            return {"ok": True, "stats": self.stats()}
+
+        return {"ok": False, "error": f"Unbekannte Operation: {op}"}
+
+    def stats(self) -> Dict[str, Any]:
+        """Kennzahlen des laufenden Daemons"""
+        return {
+            "address": self.address,
+            "engine": self.anonymizer.active_engine,
+            "mode": self.anonymizer.recognition_mode,
+            "uptime_seconds": round(time.time() - self.started_at, 1) if self.started_at else 0,
+            "connections": self.connections,
+            "requests": self.requests,
+            "chars": self.chars,
+            "cache": self.anonymizer.result_cache.stats(),
+        }
+
+
+class AnonymizerClient:
+    """Schlanker Client für den Daemon (ohne Presidio/spaCy im eigenen Prozess)"""
+
+    def __init__(self, address: Optional[str] = None, group: Optional[str] = None):
+        """
+        Args:
+            address: Socket-Pfad bzw. Pipe-Name (Standard: wie beim Daemon)
+            group: Gruppe eines gemeinsamen Daemons (Standard: [advanced] daemon_group)
+
+        Raises:
+            ConnectionError: Kein Daemon erreichbar
+        """
+        group = _get_group(group)
+        self.address = _get_address(address, group)
+        if _family(self.address) == "AF_UNIX" and os.path.exists(self.address):
+            # Keinen Text an einen Socket schicken, den ein anderer Benutzer angelegt hat -
+            # außer dem Besitzer des gemeinsamen Verzeichnisses der Gruppe
+            owner = os.stat(self.address).st_uid
+            if owner != os.getuid():
+                directory = os.lstat(os.path.dirname(self.address))
+                if not group or directory.st_uid != owner or not _is_shared_dir(directory, _group_id(group)):
+                    raise ConnectionError(f"Socket gehört einem anderen Benutzer: {self.address}")
+        try:
+            self._connection = Client(self.address, family=_family(self.address))
+        except (OSError, EOFError) as e:
+            raise ConnectionError(
+                f"Anonymify-Daemon nicht erreichbar ({self.address}) - "
+                f"starte ihn mit: python -m src.daemon serve"
+            ) from e
+
+    def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        _send(self._connection, message)
+        response = _receive(self._connection)
+        if not response.get("ok"):
+            raise RuntimeError(f"Daemon-Fehler: {response.get('error')}")
+        return response
+
+    def anonymize(self, text: str, entities_to_anonymize: Optional[List[str]] = None) -> str:
+        """Anonymisiert einen Text (wie TextAnonymizer.anonymize)"""
+        return self._request({"op": "anonymize", "text": text, "entities": entities_to_anonymize})["text"]
+
+    def anonymize_batch(self, texts: List[str], entities_to_anonymize: Optional[List[str]] = None) -> List[str]:
+        """Anonymisiert viele Texte in einer Anfrage (wie TextAnonymizer.anonymize_batch)"""
+        return self._request({"op": "anonymize_batch", "texts": list(texts), "entities": entities_to_anonymize})["texts"]
+
+    def ping(self) -> bool:
+        return self._request({"op": "ping"})["ok"]
+
+    def stats(self) -> Dict[str, Any]:
+        return self._request({"op": "stats"})["stats"]
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Kommandozeile: Daemon starten oder als Client nutzen"""
+    parser = argparse.ArgumentParser(prog="python -m src.daemon", description="Anonymify-Daemon")
+    parser.add_argument("--address", help="Socket-Pfad bzw. Pipe-Name")
+    parser.add_argument("--group", help="Unix-Gruppe eines gemeinsamen Daemons (Standard: [advanced] daemon_group)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="Daemon starten")
+    anonymize_parser = commands.add_parser("anonymize", help="Dateien (oder stdin) anonymisieren")
+    anonymize_parser.add_argument("files", nargs="*", help="Textdateien (ohne = stdin)")
+    commands.add_parser("ping", help="Prüfen ob der Daemon läuft")
+    commands.add_parser("stats", help="Kennzahlen des Daemons anzeigen")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        daemon = AnonymizerDaemon(args.address, group=args.group)
+
+        # Beenden per SIGTERM (Dienst/systemd) wie per Strg+C
+        def on_terminate(signum, frame):
+            raise KeyboardInterrupt
+
+        signal.signal(signal.SIGTERM, on_terminate)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            daemon.close()
+        return 0
+
+    try:
+        client = AnonymizerClient(args.address, args.group)
+    except (ConnectionError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    with client:
+        if args.command == "ping":
+            client.ping()
+            print("Daemon läuft")
+        elif args.command == "stats":
+            print(json.dumps(client.stats(), ensure_ascii=False, indent=2))
+        elif not args.files:
+            sys.stdout.write(client.anonymize(sys.stdin.read()))
+        else:
+            for path in args.files:
+                with open(path, "r", encoding="utf-8") as f:
+                    sys.stdout.write(client.anonymize(f.read()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
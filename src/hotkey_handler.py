@@ -3,10 +3,11 @@ Globaler Hotkey Handler mit konfigurierbarer Tastenkombination
 """
 
 import keyboard
-import pyperclip
 import logging
 from typing import Callable, Optional
 from .config_loader import get_config
+from .clipboard import ClipboardBackend, ClipboardCapture
+from .job_queue import CancelToken, JobCancelled, LatestWinsWorker
 
 logger = logging.getLogger(__name__)
 
@@ -14,23 +15,32 @@ logger = logging.getLogger(__name__)
 class HotkeyHandler:
     """Verwaltet globale Hotkeys"""
 
-    def __init__(self, on_anonymize_callback: Callable, on_status_change: Optional[Callable] = None):
+    def __init__(self, on_anonymize_callback: Callable, on_status_change: Optional[Callable] = None,
+                 clipboard_backend: Optional[ClipboardBackend] = None):
         """
         Args:
             on_anonymize_callback: Funktion die aufgerufen wird wenn der Hotkey gedrückt wird
             on_status_change: Funktion die den Status ändert (z.B. für Tray Icon)
+            clipboard_backend: Zwischenablage (Standard: System-Zwischenablage)
         """
         self.config = get_config()
         self.on_anonymize_callback = on_anonymize_callback
         self.on_status_change = on_status_change
         self.hotkey = self.config.get_hotkey()
-        self.clipboard_delay = self.config.get_clipboard_delay()
+        self.clipboard = ClipboardCapture(
+            clipboard_backend,
+            timeout=self.config.get_clipboard_timeout(),
+            fallback_timeout=self.config.get_clipboard_delay(),
+        )
         self.error_reset_time = self.config.get_error_reset_time()
         self.is_running = False
+        # Die Arbeit läuft im Worker-Thread, nicht im Tastatur-Hook
+        self.worker = LatestWinsWorker(self._process_hotkey)
 
     def start(self):
         """Startet den Hotkey Listener"""
         try:
+            self.worker.start()
             logger.info(f"Registriere Hotkey: {self.hotkey}")
             keyboard.add_hotkey(self.hotkey, self._on_hotkey_pressed)
             self.is_running = True
@@ -48,6 +58,7 @@ class HotkeyHandler:
                 logger.info("Hotkey deregistriert")
         except Exception as e:
             logger.error(f"Fehler beim Deregistrieren des Hotkeys: {e}")
+        self.worker.stop()
 
     def _set_status(self, status: str):
         """Hilfsfunktion zum Setzen des Status"""
@@ -55,48 +66,59 @@ class HotkeyHandler:
             self.on_status_change(status)
 
     def _on_hotkey_pressed(self):
-        """Wird aufgerufen wenn der Hotkey gedrückt wird"""
-        logger.info(f"Hotkey {self.hotkey} gedrückt!")
+        """Wird aufgerufen wenn der Hotkey gedrückt wird (im Tastatur-Hook - nur Job anstellen)"""
+        job = self.worker.submit()
+        logger.info(f"Hotkey {self.hotkey} gedrückt! (Job {job.id})")
 
+    def _process_hotkey(self, token: CancelToken):
+        """
+        Kopieren, anonymisieren, zurückschreiben (im Worker-Thread)
+
+        Zwischen den Schritten wird geprüft, ob ein neuerer Tastendruck den
+        Job abgelöst hat - dann wird nichts mehr in die Zwischenablage geschrieben.
+        """
         try:
             # Setze Status auf 'working' (Icon wird gelb)
             self._set_status('working')
 
             # AUTOMATISCH KOPIEREN: Simuliere Strg+C um markierten Text zu kopieren
+            # und lies die Zwischenablage, sobald der neue Inhalt da ist
             logger.info("Kopiere markierten Text (Strg+C)...")
-            keyboard.send('ctrl+c')
-
-            # Kurz warten damit Strg+C fertig ist (Zeit aus Config)
-            import time
-            time.sleep(self.clipboard_delay)
-
-            # Lese Text aus Zwischenablage
-            text = pyperclip.paste()
+            content = self.clipboard.capture(lambda: keyboard.send('ctrl+c'))
+            text = content.text
+            if not content.changed:
+                logger.info(
+                    f"Zwischenablage nach {content.waited * 1000:.0f}ms unverändert - verwende bisherigen Inhalt"
+                )
 
             if not text or not text.strip():
                 logger.warning("Zwischenablage ist leer - Bitte Text markieren vor Strg+Alt+A")
                 self._set_status('ready')  # Zurück zu grün
                 return
 
-            logger.info(f"Text aus Zwischenablage gelesen ({len(text)} Zeichen)")
+            token.raise_if_cancelled()
+            logger.info(f"Text aus Zwischenablage gelesen ({len(text)} Zeichen, nach {content.waited * 1000:.0f}ms)")
 
             # Anonymisiere Text
             anonymized_text = self.on_anonymize_callback(text)
+            token.raise_if_cancelled()
 
             # Schreibe anonymisierten Text zurück in Zwischenablage
-            pyperclip.copy(anonymized_text)
+            self.clipboard.backend.copy(anonymized_text)
             logger.info("Anonymisierter Text in Zwischenablage kopiert!")
 
             # Setze Status zurück auf 'ready' (Icon wird grün)
             self._set_status('ready')
 
+        except JobCancelled:
+            raise
         except Exception as e:
             logger.error(f"Fehler beim Verarbeiten des Hotkeys: {e}")
             # Setze Status auf 'error' (Icon wird rot)
             self._set_status('error')
 
             # Bei Fehler trotzdem eine Nachricht in die Zwischenablage schreiben
-            pyperclip.copy(f"FEHLER beim Anonymisieren: {str(e)}")
+            self.clipboard.backend.copy(f"FEHLER beim Anonymisieren: {str(e)}")
 
             # Nach konfigurierter Zeit zurück zu 'ready'
             import time
@@ -0,0 +1,379 @@
+"""
+Lokaler HTTP-Dienst für die Anonymisierung (z.B. für das Dokumentenmanagement)
+
+Endpunkte:
+    POST /anonymize        {"text": "...", "entities": [...] (optional)}  → {"text": "..."}
+    POST /anonymize/batch  {"texts": [...], "entities": [...] (optional)} → {"texts": [...]}
+    GET  /stats            Latenz-Perzentile, Batch-Größen, Warteschlange
+    GET  /health           {"ok": true, "engine": "..."}
+
+Gleichzeitige Anfragen werden zu Micro-Batches zusammengefasst (max. Anzahl
+Texte / max. Wartezeit) und gebündelt an anonymize_batch übergeben - spaCy
+läuft dann einmal über nlp.pipe statt einmal pro Anfrage. Die Warteschlange
+ist begrenzt: ist sie voll, antwortet der Server sofort mit 429.
+
+Aufruf:
+    python -m src.http_server [--host 127.0.0.1] [--port 8765]
+"""
+
+import sys
+import json
+import time
+import queue
+import signal
+import logging
+import argparse
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Maximale Größe eines Request-Bodys
+MAX_BODY_BYTES = 64 * 1024 * 1024
+# Maximale Wartezeit einer Anfrage auf ihr Ergebnis
+REQUEST_TIMEOUT_SECONDS = 120
+
+
+class LatencyStats:
+    """Latenzen der letzten Anfragen (für Perzentile)"""
+
+    def __init__(self, window: int = 10000):
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._latencies.append(seconds)
+            self.count += 1
+
+    def percentiles(self) -> Dict[str, float]:
+        """p50/p90/p99/max in Millisekunden über das aktuelle Fenster"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return {}
+
+        def percentile(p):
+            return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 2)
+
+        return {
+            "p50_ms": percentile(50),
+            "p90_ms": percentile(90),
+            "p99_ms": percentile(99),
+            "max_ms": round(latencies[-1] * 1000, 2),
+        }
+
+
+class _Job:
+    """Eine HTTP-Anfrage in der Warteschlange (ein oder mehrere Texte)"""
+
+    __slots__ = ("texts", "entities", "done", "results", "error")
+
+    def __init__(self, texts: List[str], entities: Optional[List[str]]):
+        self.texts = texts
+        self.entities = entities
+        self.done = threading.Event()
+        self.results = None
+        self.error = None
+
+
+class MicroBatcher:
+    """Sammelt Anfragen aus vielen Threads und anonymisiert sie gebündelt in einem Worker-Thread"""
+
+    def __init__(self, anonymizer, max_batch_size: int = 32, max_wait_ms: float = 10, queue_size: int = 256):
+        """
+        Args:
+            anonymizer: Initialisierter TextAnonymizer
+            max_batch_size: Maximale Anzahl Texte pro Batch
+            max_wait_ms: Maximale Wartezeit auf weitere Anfragen nach der ersten
+            queue_size: Maximale Anzahl wartender Anfragen (darüber: 429)
+        """
+        self.anonymizer = anonymizer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.batches = 0
+        self.batched_texts = 0
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, texts: List[str], entities: Optional[List[str]] = None) -> _Job:
+        """
+        Stellt Texte in die Warteschlange
+
+        Raises:
+            queue.Full: Warteschlange voll (→ 429)
+        """
+        job = _Job(texts, entities)
+        self.queue.put_nowait(job)
+        return job
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+
+            # Weitere Anfragen einsammeln, bis der Batch voll oder die Wartezeit um ist
+            batch = [job]
+            size = len(job.texts)
+            stop = False
+            deadline = time.perf_counter() + self.max_wait
+            while size < self.max_batch_size:
+                try:
+                    # Bereits wartende Anfragen sofort übernehmen, sonst bis zur Deadline warten
+                    job = self.queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    try:
+                        job = self.queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if job is None:
+                    stop = True
+                    break
+                batch.append(job)
+                size += len(job.texts)
+
+            try:
+                self._process(batch)
+            except Exception as e:
+                # Ein fehlerhafter Batch darf den Batcher-Thread nie beenden
+                logger.error(f"Fehler beim Verarbeiten eines Batches: {e}", exc_info=True)
+                for job in batch:
+                    if not job.done.is_set():
+                        job.error = str(e)
+                        job.done.set()
+            if stop:
+                return
+
+    def _process(self, batch: List[_Job]):
+        """Anonymisiert einen Batch (gruppiert nach Entity-Auswahl) und verteilt die Ergebnisse"""
+        groups: Dict[Optional[tuple], List[_Job]] = {}
+        for job in batch:
+            key = tuple(job.entities) if job.entities is not None else None
+            groups.setdefault(key, []).append(job)
+
+        for key, jobs in groups.items():
+            entities = list(key) if key is not None else None
+            texts = [text for job in jobs for text in job.texts]
+            try:
+                results = self.anonymizer.anonymize_batch(texts, entities)
+            except Exception as e:
+                # Ein fehlerhafter Text soll nicht alle Clients der Gruppe treffen:
+                # jede Anfrage einzeln wiederholen, nur die fehlerhafte bekommt den Fehler
+                logger.error(f"Fehler beim Anonymisieren eines Batches, einzeln wiederholen: {e}", exc_info=True)
+                for job in jobs:
+                    try:
+                        job.results = self.anonymizer.anonymize_batch(job.texts, entities)
+                    except Exception as job_error:
+                        job.error = str(job_error)
+                    job.done.set()
+                continue
+
+            offset = 0
+            for job in jobs:
+                job.results = results[offset:offset + len(job.texts)]
+                offset += len(job.texts)
+                job.done.set()
+
+            self.batches += 1
+            self.batched_texts += len(texts)
+
+
+class AnonymizerHTTPServer(ThreadingHTTPServer):
+    """HTTP-Server (ein Thread pro Verbindung) vor einem MicroBatcher"""
+
+    daemon_threads = True
+    # Viele Clients verbinden gleichzeitig (Standard 5 → Verbindungsabbrüche)
+    request_queue_size = 128
+
+    def __init__(self, address, batcher: MicroBatcher):
+        super().__init__(address, _RequestHandler)
+        self.batcher = batcher
+        self.latency = LatencyStats()
+        self.rejected = 0
+        self.started_at = time.time()
+
+    def stats(self) -> Dict[str, Any]:
+        batcher = self.batcher
+        return {
+            "engine": batcher.anonymizer.active_engine,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "requests": self.latency.count,
+            "rejected": self.rejected,
+            "queue_depth": batcher.queue.qsize(),
+            "batches": batcher.batches,
+            "avg_batch_size": round(batcher.batched_texts / batcher.batches, 2) if batcher.batches else 0,
+            "latency": self.latency.percentiles(),
+        }
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: AnonymizerHTTPServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._send_json(200, self.server.stats())
+        elif self.path == "/health":
+            self._send_json(200, {"ok": True, "engine": self.server.batcher.anonymizer.active_engine})
+        else:
+            self._send_json(404, {"error": "Unbekannter Pfad"})
+
+    def do_POST(self):
+        start_time = time.perf_counter()
+
+        if self.path not in ("/anonymize", "/anonymize/batch"):
+            self._send_json(404, {"error": "Unbekannter Pfad"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError("Content-Length darf nicht negativ sein")
+        except ValueError as e:
+            # Body wird nicht gelesen → Verbindung schließen
+            self.close_connection = True
+            self._send_json(400, {"error": f"Ungültige Anfrage: {e}"})
+            return
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {"error": f"Anfrage zu groß (max. {MAX_BODY_BYTES // (1024 * 1024)} MB)"})
+            return
+
+        try:
+            request = json.loads(self.rfile.read(length).decode("utf-8"))
+            entities = request.get("entities")
+            if self.path == "/anonymize":
+                texts = [request["text"]]
+            else:
+                texts = request["texts"]
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise ValueError("Texte müssen Strings sein")
+            if entities is not None and not (
+                isinstance(entities, list) and all(isinstance(entity, str) for entity in entities)
+            ):
+                raise ValueError("'entities' muss eine Liste von Strings sein")
+        except (ValueError, KeyError, AttributeError, TypeError) as e:
+            self._send_json(400, {"error": f"Ungültige Anfrage: {e}"})
+            return
+
+        try:
+            job = self.server.batcher.submit(texts, entities)
+        except queue.Full:
+            # Backpressure: Client soll später erneut senden
+            self.server.rejected += 1
+            self._send_json(429, {"error": "Server ausgelastet"}, {"Retry-After": "1"})
+            return
+
+        if not job.done.wait(REQUEST_TIMEOUT_SECONDS):
+            self._send_json(503, {"error": "Zeitüberschreitung"})
+            return
+        if job.error is not None:
+            self._send_json(500, {"error": job.error})
+            return
+
+        if self.path == "/anonymize":
+            self._send_json(200, {"text": job.results[0]})
+        else:
+            self._send_json(200, {"texts": job.results})
+        self.server.latency.record(time.perf_counter() - start_time)
+
+
+def create_server(anonymizer=None, host: Optional[str] = None, port: Optional[int] = None) -> AnonymizerHTTPServer:
+    """
+    Erstellt den HTTP-Server (Einstellungen aus [advanced] http_*)
+
+    Args:
+        anonymizer: TextAnonymizer (Standard: get_anonymizer(), wird initialisiert)
+        host: Adresse (Standard: http_host, nur lokal)
+        port: Port (Standard: http_port, 0 = beliebiger freier Port)
+    """
+    try:
+        from .anonymizer import get_anonymizer
+    except ImportError:
+        from anonymizer import get_anonymizer
+
+    if anonymizer is None:
+        anonymizer = get_anonymizer()
+
+    config = anonymizer.config
+    settings = config.get_http_server_settings() if config else {}
+
+    if not anonymizer.is_initialized():
+        progressive = config.is_background_warm_up_enabled() if config else True
+        if not anonymizer.initialize(progressive=progressive):
+            raise RuntimeError("Presidio konnte nicht initialisiert werden!")
+        anonymizer.start_warm_up()
+
+    batcher = MicroBatcher(
+        anonymizer,
+        max_batch_size=settings.get("max_batch_size", 32),
+        max_wait_ms=settings.get("max_wait_ms", 10),
+        queue_size=settings.get("queue_size", 256),
+    )
+    server = AnonymizerHTTPServer(
+        (host or settings.get("host", "127.0.0.1"), port if port is not None else settings.get("port", 8765)),
+        batcher
+    )
+    batcher.start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.http_server", description="Anonymify HTTP-Dienst")
+    parser.add_argument("--host", help="Adresse (Standard: [advanced] http_host)")
+    parser.add_argument("--port", type=int, help="Port (Standard: [advanced] http_port)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    server = create_server(host=args.host, port=args.port)
+
+    def on_terminate(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, on_terminate)
+
+    host, port = server.server_address[:2]
+    logger.info(f"HTTP-Dienst bereit: http://{host}:{port}/anonymize")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.stop()
+        logger.info("HTTP-Dienst beendet")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
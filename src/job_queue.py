@@ -0,0 +1,187 @@
+"""
+Worker-Thread für Hotkey-Jobs (latest wins)
+
+Der Callback der keyboard-Bibliothek läuft im Tastatur-Hook-Thread. Dauert
+er lange (accurate-Modus), stockt die Tastatur und weitere Tastendrücke
+stauen sich. Deshalb stellt der Hook nur einen Job in eine begrenzte
+Warteschlange; ein eigener Worker-Thread arbeitet sie ab:
+
+- Latest wins: Stehen beim Abholen mehrere Jobs an, wird nur der neueste
+  ausgeführt. Ist die Warteschlange voll, fällt der älteste Job weg.
+- Abbruch: Ein neuer Tastendruck bricht den laufenden Job über sein
+  CancelToken ab - der Job prüft es zwischen seinen Schritten.
+- Pro Job wird Wartezeit und Warteschlangen-Tiefe geloggt.
+"""
+
+import time
+import queue
+import logging
+import itertools
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelled(Exception):
+    """Job wurde durch einen neueren Job abgelöst"""
+
+
+class CancelToken:
+    """Abbruch-Signal für einen laufenden Job (threadsicher)"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Wirft JobCancelled, wenn der Job abgelöst wurde (zwischen zwei Schritten aufrufen)"""
+        if self._event.is_set():
+            raise JobCancelled()
+
+
+class Job:
+    """Ein angestellter Job: laufende Nummer, Zeitpunkt, Abbruch-Signal"""
+
+    __slots__ = ("id", "submitted", "token")
+
+    def __init__(self, job_id: int):
+        self.id = job_id
+        self.submitted = time.monotonic()
+        self.token = CancelToken()
+
+
+class LatestWinsWorker:
+    """Führt Jobs nacheinander in einem eigenen Thread aus, nur der neueste zählt"""
+
+    def __init__(self, handler: Callable[[CancelToken], None], max_queue: int = 8, name: str = "hotkey-worker"):
+        """
+        Args:
+            handler: Arbeit pro Job, bekommt das CancelToken des Jobs
+            max_queue: Maximale Anzahl wartender Jobs
+            name: Name des Worker-Threads
+        """
+        self.handler = handler
+        self.name = name
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max_queue)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._current: Optional[Job] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # Kennzahlen
+        self.completed = 0
+        self.coalesced = 0
+        self.cancelled = 0
+
+    def start(self):
+        """Startet den Worker-Thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Bricht den laufenden Job ab, verwirft wartende Jobs und beendet den Thread"""
+        with self._lock:
+            if self._current is not None:
+                self._current.token.cancel()
+            self._drain()
+            self._queue.put_nowait(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self) -> Job:
+        """
+        Stellt einen neuen Job an (aus dem Hook-Thread, blockiert nie)
+
+        Ein laufender Job wird abgebrochen, ist die Warteschlange voll,
+        fällt der älteste wartende Job weg.
+        """
+        job = Job(next(self._ids))
+        with self._lock:
+            if self._current is not None:
+                self._current.token.cancel()
+            while True:
+                try:
+                    self._queue.put_nowait(job)
+                    break
+                except queue.Full:
+                    self._drop_oldest()
+        return job
+
+    def _drop_oldest(self):
+        try:
+            dropped = self._queue.get_nowait()
+        except queue.Empty:
+            return
+        if dropped is not None:
+            dropped.token.cancel()
+            self.coalesced += 1
+
+    def _drain(self):
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None:
+                job.token.cancel()
+
+    def _next_job(self) -> Optional[Job]:
+        """Wartet auf den nächsten Job und fasst anstehende Jobs zum neuesten zusammen"""
+        job = self._queue.get()
+        if job is None:
+            return None
+
+        with self._lock:
+            depth = self._queue.qsize() + 1
+            skipped = 0
+            while True:
+                try:
+                    newer = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    job.token.cancel()
+                    return None
+                job.token.cancel()
+                job = newer
+                skipped += 1
+            self.coalesced += skipped
+            self._current = job
+
+        wait = time.monotonic() - job.submitted
+        logger.info(
+            f"Job {job.id}: {wait * 1000:.0f}ms gewartet, Warteschlange {depth}"
+            + (f", {skipped} ältere übersprungen" if skipped else "")
+        )
+        return job
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            start = time.monotonic()
+            try:
+                job.token.raise_if_cancelled()
+                self.handler(job.token)
+                self.completed += 1
+                logger.info(f"Job {job.id}: fertig nach {(time.monotonic() - start) * 1000:.0f}ms")
+            except JobCancelled:
+                self.cancelled += 1
+                logger.info(f"Job {job.id}: abgebrochen nach {(time.monotonic() - start) * 1000:.0f}ms (neuer Tastendruck)")
+            except Exception as e:
+                logger.error(f"Job {job.id}: Fehler im Worker: {e}")
+            finally:
+                with self._lock:
+                    self._current = None
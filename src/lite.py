@@ -0,0 +1,245 @@
+"""
+Lite-Engine: Anonymisierung nur mit der Standardbibliothek
+
+Gleiche Patterns (src/patterns.py), gleiche Operatoren (src/operators.py) und
+gleiche Whitelist-Regeln wie TextAnonymizer im fast-Modus - aber ohne
+Presidio und ohne das regex-Paket. Der Import dauert Millisekunden statt
+einer Sekunde, gedacht für schwache Rechner, kurze Skripte und die
+Beispiele in examples/colab-tests.
+
+    from src.lite import LiteAnonymizer
+    print(LiteAnonymizer().anonymize("Herr Dr. Klaus Weber, max@firma.de"))
+
+Die Ausgabe entspricht TextAnonymizer.anonymize im fast-Modus (gleiche
+Treffer, gleiche Konflikt-Regeln, gleiche Ersetzung). Ausnahme: das türkische
+"İ"/"ı" behandeln re und regex ohne Groß-/Kleinschreibung unterschiedlich.
+Braucht Python 3.11+ (possessive Quantoren im re-Modul).
+"""
+
+import re
+import sys
+import logging
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .patterns import PATTERN_RULES, DEFAULT_ENTITIES, ENTITY_PRIORITY, MULTILINE_NAME_BREAK, PatternRule
+    from .operators import apply_operator
+    from .spans import RawMatch, Span, remove_duplicates, anonymize_spans
+    from .whitelist import WhitelistIndex
+except ImportError:
+    from patterns import PATTERN_RULES, DEFAULT_ENTITIES, ENTITY_PRIORITY, MULTILINE_NAME_BREAK, PatternRule
+    from operators import apply_operator
+    from spans import RawMatch, Span, remove_duplicates, anonymize_spans
+    from whitelist import WhitelistIndex
+
+if sys.version_info < (3, 11):
+    raise ImportError("Die Lite-Engine braucht Python 3.11+ (possessive Quantoren im re-Modul)")
+
+logger = logging.getLogger(__name__)
+
+# Gleiche Flags wie Presidio / Fused Pattern Engine
+REGEX_FLAGS = re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+_SKIP = "(*SKIP)"
+
+_MULTILINE_NAME_RE = re.compile(MULTILINE_NAME_BREAK)
+
+# Buchstaben-Symbole, die für das regex-Paket Wortzeichen sind (Ⓐ, 🄰, 🅐, 🅰, ...)
+_ALPHABETIC_SYMBOLS = ((0x24B6, 0x24E9), (0x1F130, 0x1F149), (0x1F150, 0x1F169), (0x1F170, 0x1F189))
+
+
+class _ScanTable(dict):
+    """
+    str.translate-Tabelle: gleicht \\w, \\s und \\b des re-Moduls an das regex-Paket an
+
+    Die beiden Module ordnen einige Zeichen anders ein: kombinierende Akzente
+    (z.B. das "¨" in einem zerlegten "ü"), Verbindungsstriche und Joiner sind
+    für regex Wortzeichen, für re nicht; hochgestellte Ziffern und Brüche
+    (²,½) umgekehrt; \\x1c-\\x1f sind für re Leerraum. Gescannt wird deshalb
+    eine gleich lange Kopie des Texts, in der solche Zeichen durch ein
+    gleichwertiges ersetzt sind ("ǝ" = Wortzeichen, "\\x00" = weder noch).
+    Die Ersetzung wird pro Zeichen einmal berechnet und gemerkt.
+    """
+
+    def __missing__(self, code: int):
+        char = chr(code)
+        category = unicodedata.category(char)
+        if code in (0x1C, 0x1D, 0x1E, 0x1F) or category == "No":
+            replacement = 0
+        elif (category in ("Mn", "Mc", "Me") or (category == "Pc" and char != "_") or code in (0x200C, 0x200D)
+              or any(low <= code <= high for low, high in _ALPHABETIC_SYMBOLS)):
+            replacement = ord("ǝ")
+        else:
+            replacement = code
+        self[code] = replacement
+        return replacement
+
+
+_SCAN_TABLE = _ScanTable()
+
+
+class SkipPattern:
+    """
+    Regex mit (*SKIP) für das re-Modul (das nur das regex-Paket kennt)
+
+    "KOPF(*SKIP)REST": Passt REST hinter KOPF nicht, geht die Suche erst
+    hinter KOPF weiter statt ein Zeichen später. Nachgebaut mit zwei
+    Regexen: KOPF suchen, dann das ganze Pattern an dieser Stelle probieren.
+    Gleiche Treffer wie das regex-Paket, solange KOPF atomar ist (possessiv,
+    wie in src/patterns.py).
+    """
+
+    def __init__(self, pattern: str, flags: int = REGEX_FLAGS):
+        head, rest = pattern.split(_SKIP)
+        self.head = re.compile(head, flags)
+        self.full = re.compile(head + rest, flags)
+
+    def finditer(self, text: str) -> Iterator["re.Match"]:
+        pos = 0
+        length = len(text)
+        while pos <= length:
+            head = self.head.search(text, pos)
+            if head is None:
+                return
+            match = self.full.match(text, head.start())
+            if match is not None:
+                yield match
+                pos = max(match.end(), match.start() + 1)
+            else:
+                pos = max(head.end(), head.start() + 1)
+
+
+def compile_pattern(pattern: str):
+    """Kompiliert ein Pattern aus PATTERN_RULES für das re-Modul"""
+    if _SKIP in pattern:
+        return SkipPattern(pattern)
+    return re.compile(pattern, REGEX_FLAGS)
+
+
+class LiteAnonymizer:
+    """Anonymisiert Text nur mit Regex-Patterns (wie der fast-Modus, ohne Presidio)"""
+
+    def __init__(self, whitelist: Optional[Iterable[str]] = None,
+                 person_threshold: Optional[float] = None,
+                 other_threshold: Optional[float] = None,
+                 rules: Optional[Dict[str, List[PatternRule]]] = None):
+        """
+        Args:
+            whitelist: Whitelist-Einträge, None = aus config.toml
+            person_threshold: Mindest-Score für Namen, None = aus config.toml
+            other_threshold: Mindest-Score für andere Entities, None = aus config.toml
+            rules: Pattern-Tabelle (Entity-Typ → Patterns), Standard: PATTERN_RULES
+        """
+        if whitelist is None or person_threshold is None or other_threshold is None:
+            config_whitelist, config_person, config_other = self._load_config()
+            if whitelist is None:
+                whitelist = config_whitelist
+            if person_threshold is None:
+                person_threshold = config_person
+            if other_threshold is None:
+                other_threshold = config_other
+
+        if rules is None:
+            rules = PATTERN_RULES
+
+        self.whitelist_index = WhitelistIndex(whitelist)
+        self.person_threshold = person_threshold
+        self.other_threshold = other_threshold
+
+        # (entity_type, kompiliertes Regex, score) - in Registry-Reihenfolge
+        self._patterns = [
+            (entity_type, compile_pattern(rule.regex), rule.score)
+            for entity_type, entity_rules in rules.items()
+            for rule in entity_rules
+        ]
+        self._entity_order = {entity_type: i for i, entity_type in enumerate(rules)}
+
+    @staticmethod
+    def _load_config() -> Tuple[List[str], float, float]:
+        """Whitelist und Score-Thresholds aus config.toml (Defaults wenn nicht lesbar)"""
+        try:
+            try:
+                from .config_loader import get_config
+            except ImportError:
+                from config_loader import get_config
+
+            config = get_config()
+            return config.get_whitelist(), config.get_person_score_threshold(), config.get_other_score_threshold()
+        except Exception as e:
+            logger.warning(f"Config konnte nicht geladen werden: {e}")
+            return [], 0.7, 0.6
+
+    def analyze(self, text: str, entities: Optional[Iterable[str]] = None) -> List[RawMatch]:
+        """
+        Findet PII im (bereits normalisierten) Text
+
+        Duplikate, Whitelist und Score-Thresholds sind schon berücksichtigt.
+
+        Args:
+            text: Der zu analysierende Text
+            entities: Entity-Typen die gesucht werden sollen (None = DEFAULT_ENTITIES)
+
+        Returns:
+            Liste von (score, start, end, entity_type), sortiert wie bei Presidio
+        """
+        wanted = frozenset(DEFAULT_ENTITIES if entities is None else entities)
+        scan_text = text.translate(_SCAN_TABLE)
+
+        raw = []
+        append = raw.append
+        for entity_type, compiled, score in self._patterns:
+            if entity_type not in wanted:
+                continue
+            for match in compiled.finditer(scan_text):
+                start, end = match.span()
+                # Leere Treffer überspringen (wie Presidio)
+                if start != end:
+                    append((score, start, end, entity_type))
+
+        return [
+            match for match in remove_duplicates(raw, self._entity_order)
+            if self._keep(text, match)
+        ]
+
+    def _keep(self, text: str, match: RawMatch) -> bool:
+        """Whitelist- und Score-Filter (wie TextAnonymizer)"""
+        score, start, end, entity_type = match
+        if self.whitelist_index.match(entity_type, text[start:end]) is not None:
+            return False
+        threshold = self.person_threshold if entity_type == "PERSON" else self.other_threshold
+        return score >= threshold
+
+    def anonymize(self, text: str, entities: Optional[Iterable[str]] = None) -> str:
+        """
+        Anonymisiert den Text
+
+        Args:
+            text: Der zu anonymisierende Text
+            entities: Entity-Typen die anonymisiert werden sollen (None = DEFAULT_ENTITIES)
+
+        Returns:
+            Anonymisierter Text
+        """
+        if not text or not text.strip():
+            return text
+
+        # Mehrzeilige Namen normalisieren (wie TextAnonymizer._normalize_multiline_names)
+        text = _MULTILINE_NAME_RE.sub(r'\1 ', text)
+
+        spans = [
+            Span(entity_type, start, end, score)
+            for score, start, end, entity_type in self.analyze(text, entities)
+        ]
+        return anonymize_spans(text, spans, apply_operator, ENTITY_PRIORITY)
+
+
+_default_anonymizer: Optional[LiteAnonymizer] = None
+
+
+def anonymize(text: str, entities: Optional[Iterable[str]] = None) -> str:
+    """Anonymisiert den Text mit einer gemeinsamen LiteAnonymizer-Instanz (Einstellungen aus config.toml)"""
+    global _default_anonymizer
+    if _default_anonymizer is None:
+        _default_anonymizer = LiteAnonymizer()
+    return _default_anonymizer.anonymize(text, entities)
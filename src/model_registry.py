@@ -0,0 +1,194 @@
+"""
+Registry für spaCy-Modelle
+
+- Verfügbarkeit wird über die Paket-Metadaten geprüft (ohne das Modell zu laden)
+- Jedes Modell wird genau einmal geladen und von allen Engines/Modi geteilt
+- Ladezeit und zusätzlicher Arbeitsspeicher (RSS) werden pro Modell protokolliert
+- Optional nur ausgewählte Pipeline-Komponenten laden (z.B. nur tok2vec + ner)
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelLoadInfo(NamedTuple):
+    """Messwerte zum Laden eines Modells"""
+    name: str
+    load_time: float            # Sekunden
+    rss_delta: Optional[int]    # Bytes (None = nicht messbar)
+
+
+def _current_rss() -> Optional[int]:
+    """Aktueller Arbeitsspeicher (RSS) des Prozesses in Bytes, None wenn nicht ermittelbar"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+        except Exception:
+            pass
+        return None
+
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _pipeline_names(name: str) -> Optional[List[str]]:
+    """
+    Liest die Komponenten eines Modells aus dessen config.cfg (ohne es zu laden)
+
+    Returns:
+        Komponenten-Namen in Pipeline-Reihenfolge oder None wenn nicht ermittelbar
+    """
+    import spacy
+
+    path = Path(name)
+    if not path.exists():
+        try:
+            path = spacy.util.get_package_path(name)
+        except Exception:
+            return None
+
+    config_path = path / "config.cfg"
+    if not config_path.exists():
+        # Installierte Pakete: <paket>/<name>-<version>/config.cfg
+        config_path = next(path.glob("*/config.cfg"), None)
+        if config_path is None:
+            return None
+
+    return list(spacy.util.load_config(config_path)["nlp"]["pipeline"])
+
+
+class ModelRegistry:
+    """Lädt spaCy-Modelle einmalig und teilt sie zwischen allen Nutzern"""
+
+    def __init__(self):
+        self._models: Dict[str, Any] = {}
+        self._load_info: Dict[str, ModelLoadInfo] = {}
+        # Gleichzeitige Anfragen (z.B. Hintergrund-Laden) warten auf denselben Ladevorgang
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_available(name: str) -> bool:
+        """
+        Prüft ob ein Modell installiert ist, OHNE es zu laden
+
+        Args:
+            name: Paketname (z.B. "de_core_news_lg") oder Pfad zu einem Modell-Ordner
+        """
+        try:
+            metadata.distribution(name)
+            return True
+        except metadata.PackageNotFoundError:
+            return Path(name).exists()
+
+    @staticmethod
+    def _key(name: str, components: Optional[Iterable[str]]) -> str:
+        """Registry-Schlüssel: Modellname + ausgewählte Komponenten"""
+        if not components:
+            return name
+        return f"{name}[{','.join(sorted(components))}]"
+
+    def is_loaded(self, name: str, components: Optional[Iterable[str]] = None) -> bool:
+        """Prüft ob das Modell (mit diesen Komponenten) bereits geladen ist"""
+        return self._key(name, components) in self._models
+
+    def load(self, name: str, components: Optional[Iterable[str]] = None):
+        """
+        Gibt das geladene Modell zurück (lädt es beim ersten Aufruf)
+
+        Args:
+            name: Paketname oder Pfad
+            components: Nur diese Pipeline-Komponenten laden, alle anderen werden
+                        ausgeschlossen (None/leer = alle Komponenten)
+
+        Returns:
+            spaCy Language-Objekt
+
+        Raises:
+            OSError: Modell nicht installiert
+        """
+        key = self._key(name, components)
+        with self._lock:
+            nlp = self._models.get(key)
+            if nlp is not None:
+                return nlp
+
+            import spacy
+
+            exclude = []
+            if components:
+                pipeline = _pipeline_names(name)
+                if pipeline is None:
+                    logger.warning(f"Komponenten von {name} nicht lesbar - lade alle Komponenten")
+                else:
+                    exclude = [component for component in pipeline if component not in components]
+
+            logger.info(f"Lade spaCy-Modell: {name}" + (f" (ohne {', '.join(exclude)})" if exclude else "") + "...")
+            rss_before = _current_rss()
+            start_time = time.perf_counter()
+
+            nlp = spacy.load(name, exclude=exclude)
+
+            load_time = time.perf_counter() - start_time
+            rss_after = _current_rss()
+            rss_delta = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+
+            self._models[key] = nlp
+            self._load_info[key] = ModelLoadInfo(key, load_time, rss_delta)
+
+            memory = f"+{rss_delta / (1024 * 1024):.0f} MB RSS" if rss_delta is not None else "RSS unbekannt"
+            logger.info(f"spaCy-Modell geladen: {name} [{', '.join(nlp.pipe_names)}] ({load_time:.1f}s, {memory})")
+            return nlp
+
+    def report(self) -> List[ModelLoadInfo]:
+        """Messwerte aller geladenen Modelle (Ladereihenfolge)"""
+        return list(self._load_info.values())
+
+
+# Globale Registry-Instanz
+_registry_instance = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """Gibt die globale Model-Registry zurück (Singleton)"""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = ModelRegistry()
+    return _registry_instance
@@ -0,0 +1,143 @@
+"""
+Presidio-Analyzer-Bausteine (Registry, Dummy/Satz-Filter NLP Engine, gemessene Recognizer)
+
+presidio_analyzer importiert beim Laden spaCy und dessen Abhängigkeiten
+(~1s, viele MB). Dieses Modul wird deshalb von TextAnonymizer erst importiert,
+wenn der Presidio-Pfad gebraucht wird (balanced/accurate bzw. ohne Fused
+Pattern Engine) - der fast-Modus lädt es nie.
+"""
+
+import time
+from itertools import islice
+from typing import Iterable, Iterator
+
+from presidio_analyzer import PatternRecognizer, Pattern, RecognizerRegistry
+from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine, SpacyNlpEngine
+
+try:
+    from .patterns import PATTERN_RULES
+    from .sentence_gate import name_candidate_windows
+    from .timing import current_report
+except ImportError:
+    from patterns import PATTERN_RULES
+    from sentence_gate import name_candidate_windows
+    from timing import current_report
+
+
+# Dummy NLP Engine (braucht kein spaCy!)
+class DummyNlpEngine(NlpEngine):
+    def process_text(self, text, language):
+        return NlpArtifacts([], [], [], [], None, language)
+
+    def process_batch(self, texts, language, **kwargs):
+        return [self.process_text(text, language) for text in texts]
+
+    def is_loaded(self):
+        return True
+
+    def is_loaded_from_file(self):
+        return False
+
+    def load(self):
+        pass
+
+    def get_supported_languages(self):
+        return ["de", "en"]
+
+    def get_supported_entities(self):
+        return []
+
+    def is_stopword(self, word, language):
+        return False
+
+    def is_punct(self, word, language):
+        return False
+
+
+class _ShiftedEntity:
+    """NER-Treffer aus einem Satz, mit Offsets im Gesamttext (Attribute wie spacy.tokens.Span)"""
+
+    __slots__ = ("label_", "start_char", "end_char", "text")
+
+    def __init__(self, entity, offset: int):
+        self.label_ = entity.label_
+        self.start_char = entity.start_char + offset
+        self.end_char = entity.end_char + offset
+        self.text = entity.text
+
+
+class SentenceGatedNlpEngine(SpacyNlpEngine):
+    """
+    SpacyNlpEngine, die nur Sätze mit Namens-Hinweis durch spaCy schickt
+
+    Die Sätze kommen aus sentence_gate.name_candidate_windows, die Treffer
+    werden auf Offsets im Gesamttext zurückgerechnet. Die Pattern-Recognizer
+    laufen weiter auf dem ganzen Text. Tokens und Lemmas des Gesamttexts
+    bleiben leer - gebraucht würden sie nur für Kontext-Wörter
+    (LemmaContextAwareEnhancer), die die Registry nicht nutzt.
+    """
+
+    def process_text(self, text: str, language: str) -> NlpArtifacts:
+        return next(self.process_gated([text], language))
+
+    def process_batch(self, texts, language: str, as_tuples: bool = False):
+        if as_tuples:
+            yield from super().process_batch(texts, language, as_tuples=True)
+            return
+        texts = [str(text) for text in texts]
+        yield from zip(texts, self.process_gated(texts, language))
+
+    def process_gated(self, texts: Iterable[str], language: str,
+                      batch_size: int = 50, n_process: int = 1) -> Iterator[NlpArtifacts]:
+        """
+        NER nur auf den Namens-Kandidaten, gebündelt über nlp.pipe
+
+        Returns:
+            NlpArtifacts pro Text (Entities mit Offsets im jeweiligen Text)
+        """
+        texts = list(texts)
+        windows = [name_candidate_windows(text) for text in texts]
+        pieces = (text[start:end] for text, spans in zip(texts, windows) for start, end in spans)
+        docs = self.nlp[language].pipe(pieces, batch_size=batch_size, n_process=n_process)
+
+        for spans in windows:
+            entities = []
+            scores = []
+            for (offset, _), doc in zip(spans, islice(docs, len(spans))):
+                artifacts = self._doc_to_nlp_artifact(doc, language)
+                entities.extend(_ShiftedEntity(entity, offset) for entity in artifacts.entities)
+                scores.extend(artifacts.scores)
+            yield NlpArtifacts(
+                entities=entities, tokens=[], tokens_indices=[], lemmas=[],
+                nlp_engine=self, language=language, scores=scores,
+            )
+
+
+class TimedPatternRecognizer(PatternRecognizer):
+    """PatternRecognizer, der Zeit und Treffer im aktiven TimingReport erfasst"""
+
+    def analyze(self, text, entities, nlp_artifacts=None, regex_flags=None):
+        report = current_report()
+        if report is None:
+            return super().analyze(text, entities, nlp_artifacts, regex_flags)
+
+        start_time = time.perf_counter()
+        results = super().analyze(text, entities, nlp_artifacts, regex_flags)
+        report.add_recognizer(self.supported_entities[0], time.perf_counter() - start_time, len(results or []))
+        return results
+
+
+def create_registry() -> RecognizerRegistry:
+    """Erstellt Registry mit allen erweiterten Recognizers (aus PATTERN_RULES)"""
+    registry = RecognizerRegistry()
+
+    # Ein PatternRecognizer pro Entity-Typ (siehe src/patterns.py)
+    for entity_type, rules in PATTERN_RULES.items():
+        registry.add_recognizer(TimedPatternRecognizer(
+            supported_entity=entity_type,
+            name="PatternRecognizer",
+            patterns=[Pattern(name=rule.name, regex=rule.regex, score=rule.score) for rule in rules],
+            supported_language="de"
+        ))
+
+    return registry
@@ -0,0 +1,346 @@
+"""
+Operatoren für die Anonymisierung (gemeinsame Operator-Tabelle)
+
+Die Ersetzungs-Logik als reine Funktionen (Text → Ersatztext) plus die
+Zuordnung Entity-Typ → Operator. TextAnonymizer (über spans.anonymize_spans)
+und die Lite-Engine rufen sie direkt auf; src/presidio_operators.py verpackt
+sie für Vergleiche mit Presidio. Reine Standardbibliothek, keine Abhängigkeiten.
+"""
+
+import re
+from typing import Callable, Dict, Optional, Tuple
+
+
+def first_letter(text: str) -> str:
+    """
+    Ersetzt Namen durch Titel + ersten Buchstaben vom Nachnamen + Punkt
+
+    Titel bleiben ERHALTEN für bessere Lesbarkeit:
+    "Max Mustermann" → "M."
+    "Dr. Anna Schmidt" → "Dr. S."
+    "Herr Müller" → "Herr M."
+    "Herr Dr. Klaus Meier" → "Herr Dr. M."
+    """
+    if not text or not text.strip():
+        return text
+
+    text = text.strip()
+
+    # Extrahiere Titel am Anfang (können mehrere sein)
+    # Pattern: Herr, Frau, Dr., Prof., Hr., Fr., Herrn
+    title_match = re.match(r'^((Herr|Frau|Dr\.|Prof\.|Hr\.|Fr\.|Herrn)\s+)+', text)
+
+    if title_match:
+        # Titel gefunden
+        titles = title_match.group(0).strip()  # z.B. "Herr Dr."
+        rest = text[title_match.end():].strip()  # z.B. "Klaus Meier"
+
+        # Finde letztes Wort (Nachname)
+        words = rest.split()
+        if words:
+            last_name = words[-1]  # "Meier"
+            first_letter = last_name[0].upper()
+            return f"{titles} {first_letter}."
+        else:
+            # Kein Name nach Titel? Nimm ersten Buchstaben vom Titel
+            return f"{titles[0].upper()}."
+
+    else:
+        # Kein Titel: Nimm letztes Wort (Nachname)
+        words = text.split()
+        if len(words) >= 2:
+            # "Max Mustermann" → "M." (vom Nachnamen "Mustermann")
+            last_name = words[-1]
+            return f"{last_name[0].upper()}."
+        else:
+            # Nur ein Wort
+            return f"{text[0].upper()}."
+
+
+def street_first_letter(text: str) -> str:
+    """
+    Ersetzt Straßennamen durch ersten Buchstaben + Suffix + Hausnummer
+
+    "Musterstraße 123" → "M.straße 123"
+    "Hauptstr. 45a" → "H.str. 45a"
+    "Berliner Allee 10" → "B. Allee 10"
+    """
+    if not text or not text.strip():
+        return text
+
+    text = text.strip()
+
+    # Pattern: Wortanfang + suffix (straße/str./weg/platz/allee) + Nummer
+    # z.B. "Musterstraße 123", "Hauptstr. 45"
+    match = re.match(r'^([A-ZÄÖÜ][a-zäöüß]+)(straße|str\.|weg|platz|allee)(\s+\d+[a-zA-Z]?)$', text)
+
+    if match:
+        street_name = match.group(1)  # "Muster"
+        suffix = match.group(2)       # "straße"
+        number = match.group(3)       # " 123"
+
+        first_letter = street_name[0].upper()
+        return f"{first_letter}.{suffix}{number}"
+
+    # Fallback: Nur ersten Buchstaben
+    return f"{text[0].upper()}."
+
+
+def email_mask(text: str) -> str:
+    """
+    LESBAR: Zeigt erste Buchstaben, maskiert Rest
+    "max.mueller@firma.de" → "m***@f***.de"
+    "kontakt@anwaltskanzlei-mueller.de" → "k***@a***.de"
+    """
+    if not text or '@' not in text:
+        return "***@***.***"
+
+    local, domain = text.split('@', 1)
+
+    # Lokaler Teil: Erster Buchstabe + ***
+    if len(local) >= 1:
+        local_masked = local[0] + '***'
+    else:
+        local_masked = '***'
+
+    # Domain: Erster Buchstabe + *** + TLD
+    domain_parts = domain.split('.')
+    if len(domain_parts) >= 2:
+        domain_name = domain_parts[0]
+        tld = '.'.join(domain_parts[1:])  # Alles nach erstem Punkt
+        if len(domain_name) >= 1:
+            domain_masked = domain_name[0] + '***'
+        else:
+            domain_masked = '***'
+        return f"{local_masked}@{domain_masked}.{tld}"
+
+    return f"{local_masked}@***.***"
+
+
+def phone_mask(text: str) -> str:
+    """
+    LESBAR: Zeigt erste paar Ziffern, maskiert Rest
+    "030 12345678" → "030 123***"
+    "+49 30 123456" → "+49 30 123***"
+    "0171 9876543" → "0171 987***"
+    """
+    if not text or not text.strip():
+        return "0***"
+
+    text = text.strip()
+
+    # Versuche internationale Format: +49 30 ...
+    match = re.match(r'^(\+\d{1,3})[\s\-/]?(\d{2,4})[\s\-/](.+)$', text)
+    if match:
+        country = match.group(1)  # "+49"
+        area = match.group(2)      # "30"
+        rest = match.group(3)      # Rest der Nummer
+
+        # Extrahiere nur Ziffern aus Rest
+        digits = ''.join(c for c in rest if c.isdigit())
+        if len(digits) >= 3:
+            visible = digits[:3]  # Erste 3 Ziffern zeigen
+            masked = '***'
+        else:
+            visible = digits
+            masked = '***'
+        return f"{country} {area} {visible}{masked}"
+
+    # Nationales Format: 030 ...
+    match = re.match(r'^(0\d{1,4})[\s\-/](.+)$', text)
+    if match:
+        prefix = match.group(1)  # "030"
+        rest = match.group(2)     # "12345678" oder "555-1234"
+
+        # Extrahiere nur Ziffern aus Rest
+        digits = ''.join(c for c in rest if c.isdigit())
+        if len(digits) >= 3:
+            visible = digits[:3]  # Erste 3 Ziffern zeigen
+            masked = '***'
+        else:
+            visible = digits
+            masked = '***'
+        return f"{prefix} {visible}{masked}"
+
+    # Fallback: Nur Ziffern ohne Vorwahl
+    digits = ''.join(c for c in text if c.isdigit())
+    if len(digits) >= 3:
+        return digits[:3] + '***'
+
+    return "0***"
+
+
+def iban_mask(text: str) -> str:
+    """
+    LESBAR: Zeigt Ländercode + erste 2 Ziffern
+    "DE89 3704 0044 0532 0130 00" → "DE89 37** ****"
+    "DE12345678901234567890" → "DE12 34** ****"
+    """
+    if not text or not text.strip():
+        return "DE** ****"
+
+    # Entferne Leerzeichen für Verarbeitung
+    text_no_spaces = text.replace(' ', '').strip()
+
+    # Ländercode (erste 2 Zeichen) + Prüfziffer (2 Zeichen) + erste 2 Ziffern der Bank
+    if len(text_no_spaces) >= 6:
+        country = text_no_spaces[:2].upper()  # "DE"
+        check = text_no_spaces[2:4]           # "89"
+        bank = text_no_spaces[4:6]            # "37"
+        return f"{country}{check} {bank}** ****"
+    elif len(text_no_spaces) >= 4:
+        country = text_no_spaces[:2].upper()
+        check = text_no_spaces[2:4]
+        return f"{country}{check} ** ****"
+    elif len(text_no_spaces) >= 2:
+        country = text_no_spaces[:2].upper()
+        return f"{country}** **** ****"
+
+    return "DE** ****"
+
+
+def date_mask(text: str) -> str:
+    """
+    "15. März 2024" → "XX. März 2024"
+    "15.03.2024" → "XX.03.2024"
+    """
+    if not text or not text.strip():
+        return "XX.XX.XXXX"
+
+    text = text.strip()
+
+    # Pattern: "15. März 2024"
+    match = re.match(r'^(\d{1,2})(\.\s*[A-Za-zä]+\s+\d{4})$', text)
+    if match:
+        rest = match.group(2)
+        return f"XX{rest}"
+
+    # Pattern: "15.03.2024"
+    match = re.match(r'^(\d{1,2})(\.\d{2}\.\d{4})$', text)
+    if match:
+        rest = match.group(2)
+        return f"XX{rest}"
+
+    # Pattern: "2024-03-15" (ISO)
+    match = re.match(r'^(\d{4})-(\d{2})-(\d{2})$', text)
+    if match:
+        year = match.group(1)
+        month = match.group(2)
+        return f"{year}-{month}-XX"
+
+    # Fallback
+    return "XX.XX.XXXX"
+
+
+def case_number_mask(text: str) -> str:
+    """
+    "123 C 456/2024" → "*** C ***/2024"
+    "Az.: 12 Js 345/24" → "Az.: ** Js ***/24"
+    """
+    if not text or not text.strip():
+        return "*** *** ***"
+
+    text = text.strip()
+
+    # Pattern: "123 C 456/2024" oder "12 Js 345/24"
+    # Behalte Buchstaben und Jahr
+    match = re.match(r'^(Az\.?:?\s*)?(\d+)\s+([A-Z][a-z]?)\s+(\d+)/(\d{2,4})$', text)
+
+    if match:
+        prefix = match.group(1) or ""
+        letter = match.group(3)  # "C" oder "Js"
+        year = match.group(5)    # "2024" oder "24"
+
+        return f"{prefix}*** {letter} ***/{year}"
+
+    # Fallback
+    return "*** *** ***"
+
+
+def location_first_letter(text: str) -> str:
+    """
+    LESBAR: Zeigt erste 3 Ziffern der PLZ + Stadtanfang
+
+    "12345 Musterstadt" → "123** M."
+    "80539 München" → "805** M."
+    "Berlin" → "B."
+    """
+    if not text or not text.strip():
+        return text
+
+    text = text.strip()
+
+    # Pattern: PLZ + Stadt (z.B. "12345 Musterstadt", "80539 München")
+    # Erweitert für Umlaute und mehrere Wörter
+    match = re.match(r'^(\d{5})\s+(.+)$', text)
+
+    if match:
+        plz = match.group(1)      # "80539"
+        city = match.group(2)     # "München"
+
+        # Zeige erste 3 Ziffern der PLZ, maskiere Rest
+        plz_visible = plz[:3]
+        plz_masked = '**'
+
+        # Erster Buchstabe der Stadt
+        first_letter = city[0].upper()
+        return f"{plz_visible}{plz_masked} {first_letter}."
+
+    # Kein PLZ: Nur Stadt
+    # z.B. "Berlin" → "B."
+    # Aber NICHT wenn es mit Ziffer anfängt!
+    if text and not text[0].isdigit():
+        return f"{text[0].upper()}."
+
+    return "***"
+
+
+def replace(text: str, new_value: Optional[str] = None, entity_type: str = "") -> str:
+    """Fester Ersatztext - wie Presidio's "replace" (ohne new_value: "<ENTITY_TYPE>")"""
+    if not new_value:
+        return f"<{entity_type}>"
+    return new_value
+
+
+# Operator-Name → Funktion (Namen wie bei Presidio's add_anonymizer)
+OPERATORS: Dict[str, Callable[[str], str]] = {
+    "first_letter": first_letter,
+    "street_first_letter": street_first_letter,
+    "location_first_letter": location_first_letter,
+    "email_mask": email_mask,
+    "phone_mask": phone_mask,
+    "iban_mask": iban_mask,
+    "date_mask": date_mask,
+    "case_number_mask": case_number_mask,
+}
+
+# Entity-Typ → (Operator-Name, Parameter); "DEFAULT" gilt für alle anderen
+ENTITY_OPERATORS: Dict[str, Tuple[str, Dict[str, str]]] = {
+    "DEFAULT": ("replace", {"new_value": "***"}),
+    # LESBAR: Erste Buchstaben bleiben sichtbar für Kontext
+    "PERSON": ("first_letter", {}),  # "Herr Müller" → "Herr M."
+    "STREET_ADDRESS": ("street_first_letter", {}),  # "Musterstr. 123" → "M.str. 123"
+    "LOCATION": ("location_first_letter", {}),  # "12345 Berlin" → "XXXXX B."
+    "EMAIL_ADDRESS": ("email_mask", {}),  # "max@firma.de" → "m***@f***.de"
+    "PHONE_NUMBER": ("phone_mask", {}),  # "030 12345678" → "030 123***"
+    "DATE_TIME": ("date_mask", {}),  # "15.03.2024" → "XX.03.2024"
+    "IBAN_CODE": ("iban_mask", {}),  # "DE89 3704..." → "DE89 37** ****"
+    "CASE_NUMBER": ("case_number_mask", {}),  # "123 C 456/2024" → "*** C ***/2024"
+    "CREDIT_CARD": ("replace", {"new_value": "**** **** **** ****"}),
+    "IP_ADDRESS": ("replace", {"new_value": "192.168.***.***"}),  # Behält erste 2 Oktette
+    "URL": ("replace", {"new_value": "https://***.***"}),
+    "TAX_ID": ("replace", {"new_value": "***/***/****"}),
+    "SOCIAL_SECURITY_NUMBER": ("replace", {"new_value": "****** ****"}),
+    "ID_NUMBER": ("replace", {"new_value": "***"}),
+    "ACCOUNT_NUMBER": ("replace", {"new_value": "Konto ***"}),
+    "PROPERTY_REF": ("replace", {"new_value": "GB ***"}),  # Grundbuch
+    "LAND_PARCEL": ("replace", {"new_value": "Flurstück ***"}),  # Flurstück
+}
+
+
+def apply_operator(entity_type: str, text: str) -> str:
+    """Anonymisiert den Text eines Treffers mit dem Operator seines Entity-Typs"""
+    name, params = ENTITY_OPERATORS.get(entity_type) or ENTITY_OPERATORS["DEFAULT"]
+    if name == "replace":
+        return replace(text, params.get("new_value"), entity_type)
+    return OPERATORS[name](text)
@@ -0,0 +1,240 @@
+"""
+Parallel-Modus: Anonymisierung großer Texte auf mehreren CPU-Kernen
+
+Regex-Scan und spaCy-NER sind CPU-gebunden, Threads helfen wegen des GIL nicht.
+Der Text wird deshalb an Absatz- (bzw. Satz-)Grenzen geteilt und in einem
+ProcessPoolExecutor analysiert. Jeder Worker-Prozess hält seinen eigenen,
+einmal initialisierten TextAnonymizer - mit den Einstellungen des
+Haupt-Anonymizers (Modus, Thresholds, Whitelist, ...), nicht mit denen, die
+der Worker selbst aus config.toml lesen würde. Die gefundenen Spans werden
+auf die Offsets im Gesamttext zurückgerechnet und in einem Schritt ersetzt.
+
+Wie bei anonymize_stream sieht jeder Worker sein Stück plus eine Überlappung
+([advanced] stream_overlap_chars) davor und dahinter. Behalten werden nur
+Treffer, die im eigenen Stück beginnen - Treffer über eine Stückgrenze hinweg
+(auch "Herr Dr. | Max Müller" nach einem Satzende-Fehlgriff) werden so
+vollständig und genau einmal erkannt.
+
+Aufruf:
+    python -m src.cli anonymize grosse_akte.txt -o ausgabe --parallel
+
+    with ParallelAnonymizer(workers=8) as parallel:
+        anonymized = parallel.anonymize(text)
+"""
+
+import re
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .anonymizer import TextAnonymizer
+    from .patterns import DEFAULT_ENTITIES
+    from .spans import Span
+    from .whitelist import WhitelistIndex
+except ImportError:
+    from anonymizer import TextAnonymizer
+    from patterns import DEFAULT_ENTITIES
+    from spans import Span
+    from whitelist import WhitelistIndex
+
+logger = logging.getLogger(__name__)
+
+# Absatzgrenze: Leerzeile (evtl. mit Leerzeichen)
+_PARAGRAPH_RE = re.compile(r'\n[ \t]*\n\s*')
+# Satzgrenze: Satzzeichen + Leerraum (Fallback für sehr lange Absätze)
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Anonymizer im Worker-Prozess (wird im Initializer erstellt)
+_worker_anonymizer: Optional[TextAnonymizer] = None
+
+
+# Attribute des TextAnonymizers, die die Erkennung beeinflussen (siehe _config_fingerprint)
+_DETECTION_SETTINGS = (
+    "recognition_mode", "person_threshold", "other_threshold", "use_fused_engine",
+    "spacy_components", "use_sentence_gate", "whitelist",
+)
+
+
+def _worker_settings(anonymizer: TextAnonymizer) -> Dict[str, Any]:
+    """Einstellungen des Haupt-Anonymizers, mit denen die Worker erkennen"""
+    settings = {name: getattr(anonymizer, name) for name in _DETECTION_SETTINGS}
+    settings["language"] = anonymizer.language
+    return settings
+
+
+def _init_worker(settings: Dict[str, Any]):
+    """Initializer: Erstellt pro Worker-Prozess einen TextAnonymizer mit den Einstellungen des Haupt-Prozesses"""
+    global _worker_anonymizer
+    _worker_anonymizer = TextAnonymizer(language=settings["language"])
+    for name in _DETECTION_SETTINGS:
+        setattr(_worker_anonymizer, name, settings[name])
+    _worker_anonymizer.whitelist_index = WhitelistIndex(settings["whitelist"])
+    if not _worker_anonymizer.initialize():
+        raise RuntimeError("Presidio konnte im Worker nicht initialisiert werden!")
+
+
+def _detect_chunk(args: Tuple[int, str, int, int, List[str]]) -> List[Tuple[str, int, int, float]]:
+    """
+    Analysiert ein Textstück samt Überlappung im Worker
+
+    Args:
+        args: (offset, fenster, start, end, entities) - das Fenster beginnt bei
+              `offset` im Gesamttext, das eigene Stück ist [start, end)
+
+    Returns:
+        Liste von (entity_type, start, end, score) mit Offsets im Gesamttext,
+        nur Treffer die im eigenen Stück beginnen
+    """
+    offset, window, start, end, entities = args
+    results = _worker_anonymizer._detect(window, entities)
+    return [
+        (r.entity_type, r.start + offset, r.end + offset, r.score)
+        for r in results if start <= r.start + offset < end
+    ]
+
+
+def _chunk_windows(text: str, chunks: List[Tuple[int, str]], overlap: int) -> List[Tuple[int, str, int, int]]:
+    """
+    Erweitert die Stücke um `overlap` Zeichen Kontext auf beiden Seiten
+
+    Returns:
+        Liste von (offset, fenster, start, end) - siehe _detect_chunk
+    """
+    windows = []
+    for offset, chunk in chunks:
+        end = offset + len(chunk)
+        window_start = max(0, offset - overlap)
+        window_end = min(len(text), end + overlap)
+        windows.append((window_start, text[window_start:window_end], offset, end))
+    return windows
+
+
+def _split_at(pattern, text: str, offset: int, target_size: int) -> List[Tuple[int, str]]:
+    """Teilt Text an den Grenzen von `pattern` in Stücke von ca. target_size Zeichen"""
+    chunks = []
+    chunk_start = 0
+    for match in pattern.finditer(text):
+        if match.end() - chunk_start >= target_size:
+            chunks.append((offset + chunk_start, text[chunk_start:match.end()]))
+            chunk_start = match.end()
+    if chunk_start < len(text):
+        chunks.append((offset + chunk_start, text[chunk_start:]))
+    return chunks
+
+
+def split_text(text: str, target_size: int) -> List[Tuple[int, str]]:
+    """
+    Teilt Text an Absatzgrenzen, zu lange Absätze zusätzlich an Satzgrenzen
+
+    Args:
+        text: Der (normalisierte) Text
+        target_size: Angestrebte Stückgröße in Zeichen
+
+    Returns:
+        Liste von (offset, stück) - zusammengesetzt ergibt sich wieder der Text
+    """
+    chunks = []
+    for offset, chunk in _split_at(_PARAGRAPH_RE, text, 0, target_size):
+        if len(chunk) > 2 * target_size:
+            chunks.extend(_split_at(_SENTENCE_RE, chunk, offset, target_size))
+        else:
+            chunks.append((offset, chunk))
+    return chunks
+
+
+class ParallelAnonymizer:
+    """Anonymisiert große Texte parallel in mehreren Prozessen"""
+
+    def __init__(self, anonymizer: Optional[TextAnonymizer] = None, workers: Optional[int] = None):
+        """
+        Args:
+            anonymizer: Anonymizer für Normalisierung und Ersetzung (Standard: neuer TextAnonymizer)
+            workers: Anzahl Worker-Prozesse (Standard: [advanced] parallel_workers)
+        """
+        self.anonymizer = anonymizer or TextAnonymizer(language="de")
+        config = self.anonymizer.config
+
+        self.workers = workers or (config.get_parallel_workers() if config else 1)
+        self.min_chars = config.get_parallel_min_chars() if config else 200000
+        self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Startet den Prozess-Pool beim ersten Bedarf"""
+        if self._executor is None:
+            logger.info(f"Starte {self.workers} Worker-Prozesse...")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(_worker_settings(self.anonymizer),)
+            )
+        return self._executor
+
+    def anonymize(self, text: str, entities_to_anonymize: Optional[List[str]] = None,
+                  entity_counts: Optional[Dict[str, int]] = None) -> str:
+        """
+        Anonymisiert den Text - ab parallel_min_chars parallel, sonst direkt
+
+        Args:
+            text: Der zu anonymisierende Text
+            entities_to_anonymize: Entity-Typen (None = DEFAULT_ENTITIES)
+            entity_counts: Optional - wird um die Anzahl ersetzter Entities pro Typ erhöht
+
+        Returns:
+            Anonymisierter Text
+        """
+        if len(text) < self.min_chars or self.workers < 2:
+            if entity_counts is not None:
+                # Nur der Stream-Pfad zählt die Entities
+                return ''.join(self.anonymizer.anonymize_stream([text], entities_to_anonymize, entity_counts))
+            return self.anonymizer.anonymize(text, entities_to_anonymize)
+
+        if entities_to_anonymize is None:
+            entities_to_anonymize = DEFAULT_ENTITIES
+
+        if not self.anonymizer.is_initialized():
+            if not self.anonymizer.initialize():
+                return "FEHLER: Presidio konnte nicht initialisiert werden!"
+
+        start_time = time.time()
+        text_normalized = self.anonymizer._normalize_multiline_names(text)
+
+        # Mehrere Stücke pro Worker → gleichmäßigere Auslastung
+        target_size = max(len(text_normalized) // (self.workers * 4), 10000)
+        chunks = split_text(text_normalized, target_size)
+        windows = _chunk_windows(text_normalized, chunks, self.anonymizer.stream_overlap_chars)
+
+        executor = self._get_executor()
+        results = []
+        for chunk_results in executor.map(
+            _detect_chunk,
+            [(offset, window, start, end, entities_to_anonymize) for offset, window, start, end in windows]
+        ):
+            results.extend(
+                Span(entity_type, start, end, score)
+                for entity_type, start, end, score in chunk_results
+            )
+
+        # Gleiche Reihenfolge wie bei einem einzelnen Analyse-Lauf (Score, Position, Länge)
+        results.sort(key=lambda r: (-r.score, r.start, r.start - r.end))
+        if entity_counts is not None:
+            self.anonymizer._count_entities(results, entity_counts)
+        anonymized_text = self.anonymizer._apply_operators(text_normalized, results)
+
+        elapsed = time.time() - start_time
+        logger.info(
+            f"Parallel anonymisiert: {len(text)} Zeichen, {len(chunks)} Stücke, "
+            f"{self.workers} Worker, {len(results)} Entities ({elapsed:.2f}s)"
+        )
+        return anonymized_text
+
+    def close(self):
+        """Beendet die Worker-Prozesse"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
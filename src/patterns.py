@@ -0,0 +1,257 @@
+"""
+Pattern-Definitionen für die Erkennung (gemeinsame Regel-Tabelle)
+
+Wird von der Presidio-Registry (TextAnonymizer._create_registry), der
+Fused Pattern Engine (fast-Modus) und der Lite-Engine (src/lite.py) genutzt.
+Reine Daten, keine Abhängigkeiten.
+"""
+
+from typing import Dict, List, NamedTuple
+
+
+class PatternRule(NamedTuple):
+    """Ein Regex-Pattern (Name, Regex, Score) - wie presidio_analyzer.Pattern"""
+    name: str
+    regex: str
+    score: float
+
+
+# Backtracking-sicher (kein superlinearer Aufwand bei präparierten Eingaben):
+# Ein naives "(Vorname\s+)*Nachname" probiert bei langen Wortketten ohne
+# passendes Ende jede Aufteilung durch → quadratische Laufzeit (ReDoS).
+# _name_sequence matcht exakt dieselben Spans, aber ohne Rücksprünge:
+# Wörter, die zu kurz für einen Nachnamen sind, werden possessiv (*+)
+# übersprungen, ein möglicher Nachname wird nur konsumiert, wenn dahinter
+# noch ein weiterer folgt (Lookahead) - der letzte wird der Nachname.
+_UPPER = "[A-ZÄÖÜ]"
+_LOWER = "[a-zäöüß]"
+_DOUBLE = f"(?:-{_UPPER}{_LOWER}+)?"
+
+
+def _name_sequence(first_min: int, last_min: int) -> str:
+    """
+    Regex für "(Vorname + Leerraum)* Nachname" ohne Backtracking
+
+    Args:
+        first_min: Mindestanzahl Kleinbuchstaben eines Vornamens
+        last_min: Mindestanzahl Kleinbuchstaben des Nachnamens (> first_min)
+    """
+    short = f"{_UPPER}{_LOWER}{{{first_min},{last_min - 1}}}{_DOUBLE}"
+    last = f"{_UPPER}{_LOWER}{{{last_min},}}{_DOUBLE}"
+    skip_short = f"(?:{short}\\s+)*+"
+    return f"(?:{skip_short}{last}\\s+(?={skip_short}{last}))*+{skip_short}{last}"
+
+
+# E-Mail: "\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b" - gleiche
+# Treffer, aber linear. Naiv ist "a.a.a.a...@" und "a@a.a.a.a..." quadratisch:
+# - Lokaler Teil possessiv + (*SKIP): ohne "@" dahinter kann auch kein
+#   späterer Start im selben Block passen, die Suche geht hinter ihm weiter
+# - Domain: der Punkt vor der TLD ist der LETZTE Punkt mit gültiger TLD
+#   dahinter; Punkte davor werden nur konsumiert, wenn noch so einer folgt
+# - TLD: "+" und Lookbehind (kein ".x" mit nur einem Zeichen) statt "{2,}"
+_TLD = r"[A-Z|a-z]+\b(?<!\.[A-Z|a-z])"
+_DOMAIN_PART = rf"(?:[A-Za-z0-9-]|\.(?!{_TLD}))*+"
+_EMAIL = (
+    r"\b[A-Za-z0-9._%+-]++(*SKIP)@[A-Za-z0-9.-]"
+    rf"(?:{_DOMAIN_PART}\.(?={_DOMAIN_PART}\.{_TLD}))*+{_DOMAIN_PART}\.{_TLD}"
+)
+
+
+# Normalisierung vor der Analyse: Zeilenumbruch + Einrückung nach einem
+# Nachnamen ("Herr Max Müller\n   geb. am ...") wird zu einem Leerzeichen
+MULTILINE_NAME_BREAK = r"([A-ZÄÖÜ][a-zäöüß]+(-[A-ZÄÖÜ][a-zäöüß]+)?)\n\s{2,}"
+
+
+# Alle Entity-Typen die standardmäßig anonymisiert werden
+DEFAULT_ENTITIES = [
+    # Persönliche Daten
+    "PERSON",                    # Namen (mit Pattern + spaCy)
+    "EMAIL_ADDRESS",             # E-Mails
+    "PHONE_NUMBER",              # Telefonnummern
+    "DATE_TIME",                 # Geburtsdaten, Termine
+
+    # Adressen & Orte
+    "STREET_ADDRESS",            # Straßen (Musterstraße 123)
+    "LOCATION",                  # PLZ + Städte (12345 Berlin)
+
+    # Finanz-Daten
+    "IBAN_CODE",                 # IBAN
+    "CREDIT_CARD",               # Kreditkarten
+    "ACCOUNT_NUMBER",            # Kontonummern
+
+    # Identifikation
+    "TAX_ID",                    # Steuer-ID / Steuernummer
+    "SOCIAL_SECURITY_NUMBER",    # Sozialversicherungsnummer
+    "ID_NUMBER",                 # Ausweis-/Personalausweisnummer
+
+    # Juristische Daten
+    "CASE_NUMBER",               # Aktenzeichen (123 C 456/2024)
+    "PROPERTY_REF",              # Grundbuchnummern
+    "LAND_PARCEL",               # Flurstücknummern
+
+    # Internet
+    "IP_ADDRESS",                # IP-Adressen
+    "URL",                       # URLs/Webseiten
+]
+
+
+# Vorrang bei überlappenden Treffern verschiedener Typen mit gleichem Score
+# und gleicher Länge (siehe spans.resolve_conflicts): spezifische Formate
+# vor allgemeinen Ziffernfolgen - eine IBAN ist auch eine "Telefonnummer".
+# Entity-Typ → Rang (0 = höchster Vorrang)
+ENTITY_PRIORITY: Dict[str, int] = {entity_type: rank for rank, entity_type in enumerate([
+    "IBAN_CODE",
+    "CREDIT_CARD",
+    "SOCIAL_SECURITY_NUMBER",
+    "TAX_ID",
+    "EMAIL_ADDRESS",
+    "URL",
+    "IP_ADDRESS",
+    "CASE_NUMBER",
+    "PROPERTY_REF",
+    "LAND_PARCEL",
+    "ACCOUNT_NUMBER",
+    "ID_NUMBER",
+    "STREET_ADDRESS",
+    "LOCATION",
+    "PERSON",
+    "DATE_TIME",
+    "PHONE_NUMBER",
+])}
+
+
+# Ein Eintrag pro Recognizer (Reihenfolge = Reihenfolge in der Registry)
+PATTERN_RULES: Dict[str, List[PatternRule]] = {
+    # E-Mail
+    "EMAIL_ADDRESS": [
+        # Wie "\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", aber linear
+        PatternRule("email", _EMAIL, 0.9),
+    ],
+
+    # Telefon (deutsche Formate)
+    # WICHTIG: Muss auch "030 555-1234" matchen (mit Bindestrich in der Nummer)
+    # Trenner possessiv (?+): ein Trenner ist nie eine Ziffer, ihn auszulassen
+    # kann also nie zu einem Treffer führen. Die letzte Ziffernfolge ebenso (++
+    # am Ende gibt nichts mehr zurück). Übrig bleibt nur die Aufteilung der
+    # Ziffern ohne Trenner - höchstens eine Handvoll Versuche pro Startposition.
+    "PHONE_NUMBER": [
+        # Mobilfunk: 0171 1234567 oder 0171-123-4567
+        PatternRule("phone_mobile", r"0\d{3,4}[\s\-/]?+\d{3,4}[\s\-/]?+\d{3,4}+", 0.8),
+        # International: +49 30 123456 oder +49-30-123456
+        PatternRule("phone_intl", r"\+49[\s\-/]?+\d{2,4}[\s\-/]?+\d{3,9}+", 0.8),
+        # Festnetz: 030 12345678 oder 030 555-1234 (mit Bindestrich!)
+        PatternRule("phone_landline", r"0\d{2,5}[\s\-/]?+(\d{3,4}[\s\-/]?+)?\d{4,8}+", 0.7),
+    ],
+
+    # Namen (deutsche Vor- und Nachnamen)
+    # SEHR RESTRIKTIV: Nur mit Titeln, mindestens 2+3 Zeichen!
+    "PERSON": [
+        # Mit Anrede + akadem. Titeln (sehr sicher) - ALLE KOMBINATIONEN!
+        # z.B. "Herr Prof. Dr. Klaus-Dieter Schneider", "Frau Dr. med. Anna-Maria Müller-Hoffmann"
+        # Vornamen: min 2 Zeichen ([A-ZÄÖÜ][a-zäöüß]{1,}  =  mind. 2 Zeichen gesamt)
+        # Nachname: min 3 Zeichen ([A-ZÄÖÜ][a-zäöüß]{2,} = mind. 3 Zeichen gesamt)
+        PatternRule(
+            "name_with_title_complex",
+            r"\b(Herr|Frau|Hr\.|Fr\.|Herrn)\s+(Prof\.\s+)?(Dr\.\s+)?(med\.\s+)?(Prof\.\s+)?(Dr\.\s+)?" + _name_sequence(1, 2),
+            0.95
+        ),
+        # Mit akademischem Titel (ohne Anrede) - MINDESTENS Dr. oder Prof. MUSS dabei sein!
+        # z.B. "Dr. Heinrich Weber", "Prof. Dr. Müller"
+        # WICHTIG: (Prof\.|Dr\.|med\.) ist NICHT optional → mindestens einer MUSS da sein!
+        PatternRule(
+            "name_with_dr",
+            r"\b(Prof\.\s+|Dr\.\s+|Prof\.\s+Dr\.\s+|Dr\.\s+med\.\s+)" + _name_sequence(1, 2),
+            0.9
+        ),
+        # Nach Komma mit Titel
+        # z.B. "namens meiner Mandantin, Frau Dr. Anna-Maria Weber"
+        PatternRule(
+            "name_after_comma_title",
+            r",\s+(Herr|Frau|Hr\.|Fr\.|Herrn)\s+(Dr\.\s+)?(med\.\s+)?" + _name_sequence(2, 3),
+            0.95
+        ),
+    ],
+
+    # Straßenadressen
+    "STREET_ADDRESS": [
+        PatternRule("street_strasse", r"\b[A-ZÄÖÜ][a-zäöüß]+straße\s+\d+[a-zA-Z]?", 0.85),
+        PatternRule("street_str", r"\b[A-ZÄÖÜ][a-zäöüß]+str\.\s+\d+[a-zA-Z]?", 0.85),
+        PatternRule("street_weg", r"\b[A-ZÄÖÜ][a-zäöüß]+weg\s+\d+[a-zA-Z]?", 0.85),
+        PatternRule("street_platz", r"\b[A-ZÄÖÜ][a-zäöüß]+platz\s+\d+[a-zA-Z]?", 0.85),
+        PatternRule("street_allee", r"\b[A-ZÄÖÜ][a-zäöüß]+allee\s+\d+[a-zA-Z]?", 0.85),
+    ],
+
+    # PLZ + Stadt
+    "LOCATION": [
+        PatternRule("plz_stadt", r"\b\d{5}\s+[A-ZÄÖÜ][a-zäöüß]+(?:\s+[a-zäöüß]+)?\b", 0.8),
+    ],
+
+    # Aktenzeichen
+    "CASE_NUMBER": [
+        PatternRule("aktenzeichen", r"\b\d+\s+[A-Z]{1,3}\s+\d+/\d{2,4}\b", 0.9),
+        PatternRule("aktenzeichen_az", r"\bAz\.?:?\s*\d+\s+[A-Z]{1,3}\s+\d+/\d{2,4}\b", 0.95),
+    ],
+
+    # IBAN
+    "IBAN_CODE": [
+        PatternRule("iban_de", r"\bDE\d{2}[\s]?\d{4}[\s]?\d{4}[\s]?\d{4}[\s]?\d{4}[\s]?\d{2}\b", 0.95),
+    ],
+
+    # Kontonummer
+    "ACCOUNT_NUMBER": [
+        PatternRule("account_number", r"\bKonto[-\s]?Nr\.?:?\s*\d{6,10}\b", 0.9),
+        PatternRule("account_number_simple", r"\bKontonummer:?\s*\d{6,10}\b", 0.9),
+    ],
+
+    # Steuer-ID
+    "TAX_ID": [
+        PatternRule("steuer_id", r"\b\d{11}\b", 0.6),
+        PatternRule("steuer_id_labeled", r"\b(Steuer-ID|Steueridentifikationsnummer|St\.-Nr\.|Steuernummer|Steuer-Nr\.):?\s*\d{2,3}/\d{3}/\d{4,5}\b", 0.95),
+    ],
+
+    # Grundbuchnummern (Notariat)
+    "PROPERTY_REF": [
+        PatternRule("grundbuch_blatt", r"\b(Grundbuch|GB)[\s\-]?(von\s+)?[A-ZÄÖÜ][a-zäöüß\-]+,?\s+(Blatt\s+)?\d{4,6}(/\d{2,4}[\-]\d{2,4})?\b", 0.9),
+        PatternRule("grundbuch_short", r"\bGB\s+\d{4,6}/\d{2,4}[\-]\d{2,4}\b", 0.9),
+    ],
+
+    # Flurstück-Nummern (Kataster)
+    "LAND_PARCEL": [
+        PatternRule("flurstueck", r"\b(Flurstück|Flur)\s+\d{1,4}(/\d{2,4})?\b", 0.85),
+        PatternRule("gemarkung", r"\b(Gemarkung|Gmkg\.)\s+[A-ZÄÖÜ][a-zäöüß\-]+,\s+Flur\s+\d{1,4}\b", 0.9),
+    ],
+
+    # Sozialversicherungsnummer
+    "SOCIAL_SECURITY_NUMBER": [
+        PatternRule("sozialversicherungsnummer", r"\b\d{2}\s?\d{6}\s?[A-Z]\s?\d{3}\b", 0.8),
+    ],
+
+    # Personalausweisnummer
+    "ID_NUMBER": [
+        PatternRule("perso_nummer", r"\b[A-Z]\d{9}\b", 0.7),
+        PatternRule("perso_labeled", r"\b(Personalausweis|Ausweis-Nr\.|PA):?\s*[A-Z0-9]{9,10}\b", 0.9),
+    ],
+
+    # Datum
+    "DATE_TIME": [
+        PatternRule("date_de_dot", r"\b\d{1,2}\.\d{1,2}\.\d{4}\b", 0.7),
+        PatternRule("date_de_slash", r"\b\d{1,2}/\d{1,2}/\d{4}\b", 0.7),
+        PatternRule("date_iso", r"\b\d{4}-\d{2}-\d{2}\b", 0.7),
+    ],
+
+    # Kreditkarte
+    "CREDIT_CARD": [
+        PatternRule("credit_card", r"\b\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}\b", 0.8),
+    ],
+
+    # IP-Adresse
+    "IP_ADDRESS": [
+        PatternRule("ip_address", r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", 0.8),
+    ],
+
+    # URL
+    "URL": [
+        PatternRule("url_http", r"https?://[^\s]+", 0.9),
+        PatternRule("url_www", r"www\.[^\s]+", 0.8),
+    ],
+}
@@ -0,0 +1,97 @@
+"""
+Presidio-Operatoren um die Funktionen aus src/operators.py
+
+Die App ersetzt Treffer selbst (spans.anonymize_spans) und braucht
+presidio_anonymizer nicht. Diese Klassen gibt es nur noch für den Vergleich
+mit Presidio's AnonymizerEngine (test_span_writer.py,
+benchmarks/bench_span_writer.py):
+
+    engine = AnonymizerEngine()
+    for operator in PRESIDIO_OPERATORS:
+        engine.add_anonymizer(operator)
+"""
+
+from typing import Dict
+
+from presidio_anonymizer.operators import Operator, OperatorType
+
+try:
+    from .operators import OPERATORS
+except ImportError:
+    from operators import OPERATORS
+
+
+class _SharedOperator(Operator):
+    """Presidio-Operator um eine Funktion aus src/operators.py (siehe OPERATORS)"""
+
+    name = ""
+
+    def operate(self, text: str, params: Dict = None) -> str:
+        return OPERATORS[self.name](text)
+
+    def validate(self, params: Dict = None) -> None:
+        """Validierung (nicht benötigt)"""
+        pass
+
+    def operator_name(self) -> str:
+        """Name des Operators"""
+        return self.name
+
+    def operator_type(self) -> OperatorType:
+        """Typ des Operators"""
+        return OperatorType.Anonymize
+
+
+# Custom Operator: Ersetzt Namen durch ersten Buchstaben + Punkt
+class FirstLetterOperator(_SharedOperator):
+    """Anonymisiert Namen zu 'X.' (erster Buchstabe + Punkt)"""
+    name = "first_letter"
+
+
+# Custom Operator: Ersetzt Straßennamen durch ersten Buchstaben + Suffix
+class StreetFirstLetterOperator(_SharedOperator):
+    """Anonymisiert Straßen zu 'X.straße 123'"""
+    name = "street_first_letter"
+
+
+# Custom Operator: Maskiert E-Mail (behält Domain-Typ)
+class EmailMaskOperator(_SharedOperator):
+    """Maskiert E-Mail aber behält erste Buchstaben für Lesbarkeit"""
+    name = "email_mask"
+
+
+# Custom Operator: Maskiert Telefon (behält Vorwahl)
+class PhoneMaskOperator(_SharedOperator):
+    """Maskiert Telefon aber behält Vorwahl"""
+    name = "phone_mask"
+
+
+# Custom Operator: Maskiert IBAN (behält Ländercode)
+class IbanMaskOperator(_SharedOperator):
+    """Maskiert IBAN aber behält Ländercode und erste Ziffern"""
+    name = "iban_mask"
+
+
+# Custom Operator: Maskiert Datum (behält Monat/Jahr)
+class DateMaskOperator(_SharedOperator):
+    """Maskiert Datum aber behält Monat/Jahr"""
+    name = "date_mask"
+
+
+# Custom Operator: Maskiert Aktenzeichen (behält Jahr)
+class CaseNumberMaskOperator(_SharedOperator):
+    """Maskiert Aktenzeichen aber behält Jahr"""
+    name = "case_number_mask"
+
+
+# Custom Operator: Ersetzt Ortsnamen durch ersten Buchstaben
+class LocationFirstLetterOperator(_SharedOperator):
+    """Anonymisiert Orte lesbar mit ersten Ziffern der PLZ"""
+    name = "location_first_letter"
+
+
+# Alle Operatoren (Klassen, nicht Instanzen - für add_anonymizer)
+PRESIDIO_OPERATORS = (
+    FirstLetterOperator, StreetFirstLetterOperator, LocationFirstLetterOperator, EmailMaskOperator,
+    PhoneMaskOperator, IbanMaskOperator, DateMaskOperator, CaseNumberMaskOperator,
+)
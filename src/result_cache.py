@@ -0,0 +1,122 @@
+"""
+LRU-Ergebnis-Cache für anonymisierte Texte
+
+Wird derselbe Text mehrfach anonymisiert (Hotkey zweimal gedrückt, gleicher
+Absatz in mehreren Prompts), liefert der Cache das Ergebnis sofort.
+
+- Schlüssel: BLAKE2b-Digest aus Text + effektiver Konfiguration + Entity-Liste
+  (der Klartext wird NICHT als Schlüssel gespeichert)
+- Verdrängung nach Anzahl Einträge UND Gesamtgröße in Bytes
+- Ändert sich die Konfiguration, wird der Cache automatisch geleert
+- Thread-sicher (Hotkey-Worker, Warm-up-Thread und Daemon-Verbindungen)
+"""
+
+import sys
+import threading
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Begrenzter LRU-Cache: Digest → Ergebnis (anonymisierter Text oder Analyse-Treffer)"""
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Args:
+            max_entries: Maximale Anzahl Einträge (0 = Cache deaktiviert)
+            max_bytes: Maximale Gesamtgröße der gespeicherten Ergebnisse in Bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.total_bytes = 0
+        self.fingerprint = None
+        # Digest → (Ergebnis, Größe in Bytes)
+        self._entries: "OrderedDict[bytes, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(text: str, fingerprint: str, entities: Iterable[str]) -> bytes:
+        """Erstellt den Cache-Schlüssel (Digest, kein Klartext)"""
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(fingerprint.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(','.join(entities).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        return digest.digest()
+
+    def validate(self, fingerprint: str):
+        """Leert den Cache, wenn sich die effektive Konfiguration geändert hat"""
+        with self._lock:
+            if fingerprint != self.fingerprint:
+                if self._entries:
+                    logger.info(f"Konfiguration geändert - Ergebnis-Cache geleert ({len(self._entries)} Einträge)")
+                self._entries.clear()
+                self.total_bytes = 0
+                self.fingerprint = fingerprint
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Gibt das gecachte Ergebnis zurück (oder None) und zählt Treffer/Fehlversuche"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: bytes, value: Any, size: Optional[int] = None):
+        """
+        Speichert ein Ergebnis und verdrängt die ältesten Einträge bei Bedarf
+
+        Args:
+            size: Größe in Bytes (Standard: sys.getsizeof(value), passt für Strings)
+        """
+        if not self.enabled:
+            return
+
+        if size is None:
+            size = sys.getsizeof(value)
+        if size > self.max_bytes:
+            # Einzelnes Ergebnis größer als der ganze Cache → nicht cachen
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self.total_bytes -= old_entry[1]
+
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+    def clear(self):
+        """Entfernt alle Einträge (Zähler bleiben erhalten)"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> str:
+        """Kurze Statistik für das Log"""
+        return (
+            f"Treffer: {self.hits}, Fehlversuche: {self.misses}, "
+            f"{len(self._entries)} Einträge, {self.total_bytes / 1024:.0f} KB"
+        )
@@ -0,0 +1,147 @@
+"""
+Satz-Filter vor der NER: spaCy nur auf Sätze mit Namens-Hinweisen
+
+In Verträgen und Schriftsätzen enthalten die meisten Sätze keinen Namen.
+Ein billiger Vorlauf teilt den Text in Sätze und behält nur die, in denen
+ein Name stehen könnte - nur diese gehen durch spaCy (siehe
+nlp_engines.SentenceGatedNlpEngine). Reine Standardbibliothek.
+
+Im Deutschen werden alle Substantive groß geschrieben, ein großgeschriebenes
+Wort mitten im Satz ist deshalb allein kein Hinweis. Ein Satz wird behalten bei:
+- Anrede, Titel oder Rolle (Herr, Frau, Dr., Prof., Notar, geb., ...)
+- zwei großgeschriebenen Wörtern hintereinander ("Max Müller", "Anna Schmidt"),
+  außer hinter einem Artikel/Funktionswort ("Der Käufer", "im Grundbuch")
+  und außer wenn das zweite wie ein Substantiv endet ("Lastenfreie Auflassung")
+
+Ein einzelner Nachname ohne Anrede ("... wird Schmidt ...") fällt durch -
+benchmarks/bench_sentence_gate.py zeigt den Recall gegen NER auf dem ganzen Text.
+"""
+
+import re
+from typing import List, Tuple
+
+# Satzende: Punkt/Ausrufe-/Fragezeichen vor Leerraum, oder Leerzeile
+_END_RE = re.compile(r'[.!?]+(?=\s)|\n[ \t]*\n')
+_WORD_BEFORE_RE = re.compile(r'(\S+)$')
+_NEXT_CHAR_RE = re.compile(r'\S')
+_WORD_RE = re.compile(r'[^\W\d_][\w\-]*\.?')
+_CAPITALIZED_RE = re.compile(r'[A-ZÄÖÜ][a-zäöüß]+(?:-[A-ZÄÖÜ][a-zäöüß]+)*')
+
+# Abkürzungen, hinter deren Punkt kein Satz endet
+ABBREVIATIONS = frozenset({
+    "dr", "prof", "hr", "fr", "med", "jur", "dipl", "ing", "geb", "verh", "gesch", "verw",
+    "nr", "str", "abs", "art", "az", "tel", "fax", "ca", "bzw", "vgl", "ggf", "inkl", "zzgl",
+    "evtl", "usw", "etc", "gem", "lt", "bzgl", "sog", "st", "mr", "mrs", "ra", "rain",
+})
+
+# Anrede, Titel, Rollen und Angaben, die in der Nähe eines Namens stehen
+NAME_CUES = frozenset({
+    "herr", "herrn", "frau", "hr.", "fr.", "dr.", "prof.", "notar", "notarin", "rechtsanwalt",
+    "rechtsanwältin", "ra", "rain", "geb.", "geborene", "geborener", "verh.", "vertreten",
+    "mandant", "mandantin", "eheleute", "ehemann", "ehefrau",
+})
+
+# Wörter, hinter denen ein großgeschriebenes Wort meist ein Substantiv ist
+FUNCTION_WORDS = frozenset({
+    "der", "die", "das", "den", "dem", "des", "ein", "eine", "einen", "einem", "einer", "eines",
+    "kein", "keine", "keinen", "keinem", "keiner", "dieser", "diese", "dieses", "diesem", "diesen",
+    "jeder", "jede", "jedes", "jedem", "jeden", "alle", "allen", "aller", "sein", "seine", "seinem",
+    "seinen", "seiner", "ihr", "ihre", "ihrem", "ihren", "ihrer", "unser", "unsere", "unserem",
+    "unseren", "unserer", "im", "am", "zum", "zur", "vom", "beim", "ins", "ans", "welche", "welcher",
+})
+
+# Typische Substantiv-Endungen (als zweites Wort eines Paars kein Nachname)
+_NOUN_ENDINGS = (
+    "ung", "ungen", "heit", "keit", "schaft", "tion", "ität", "nis", "nisse", "tum", "ment",
+    "vertrag", "recht", "gesetz", "buch", "amt", "gericht", "preis", "zahlung", "antrag",
+)
+
+
+def split_sentences(text: str) -> List[Tuple[int, int]]:
+    """
+    Teilt Text in Sätze (ohne Leerraum am Rand)
+
+    Ein Punkt beendet keinen Satz hinter Abkürzungen (Dr., geb., Nr., ...),
+    einzelnen Buchstaben (Initialen "M."), Zahlen ("1. Herr", "3. März"),
+    Wörtern mit Punkt darin ("z.B.") oder wenn danach klein oder mit einer
+    Ziffer weitergeht ("Hauptstr. 5", "Abs. 2").
+
+    Returns:
+        Liste von (start, end) im Text
+    """
+    sentences = []
+    start = 0
+    for match in _END_RE.finditer(text):
+        if match.group().startswith("."):
+            before = _WORD_BEFORE_RE.search(text, max(0, match.start() - 40), match.start())
+            word = before.group(1).lstrip("([\"'„") if before else ""
+            following = _NEXT_CHAR_RE.search(text, match.end())
+            if (not word or len(word) == 1 or word.isdigit() or "." in word
+                    or word.lower() in ABBREVIATIONS
+                    or (following and (following.group().islower() or following.group().isdigit()))):
+                continue
+        _append_stripped(text, start, match.end(), sentences)
+        start = match.end()
+    _append_stripped(text, start, len(text), sentences)
+    return sentences
+
+
+def _append_stripped(text: str, start: int, end: int, sentences: List[Tuple[int, int]]):
+    sentence = text[start:end]
+    stripped = sentence.strip()
+    if stripped:
+        start += len(sentence) - len(sentence.lstrip())
+        sentences.append((start, start + len(stripped)))
+
+
+def has_name_cue(sentence: str) -> bool:
+    """Prüft ob im Satz ein Name stehen könnte (siehe Modul-Docstring)"""
+    previous = None
+    previous_capitalized = False
+    position = 0
+    for match in _WORD_RE.finditer(sentence):
+        word = match.group()
+        lower = word.lower()
+        if lower in NAME_CUES or lower.rstrip(".") in NAME_CUES:
+            return True
+
+        # Keine Paare über Zeilenumbrüche oder Satzzeichen hinweg (Listen, Adressblöcke)
+        gap = sentence[position:match.start()]
+        if gap.strip() or "\n" in gap:
+            previous_capitalized = False
+        position = match.end()
+
+        # Abkürzungen ("Nr.", "Str.") zählen nicht als Teil eines Namens
+        capitalized = (_CAPITALIZED_RE.fullmatch(word.rstrip(".")) is not None
+                       and lower.rstrip(".") not in ABBREVIATIONS)
+        # Zwei großgeschriebene Wörter hintereinander (nicht "Der Käufer")
+        if (capitalized and previous_capitalized and previous not in FUNCTION_WORDS
+                and not lower.rstrip(".").endswith(_NOUN_ENDINGS)):
+            return True
+
+        previous = lower.rstrip(".")
+        previous_capitalized = capitalized
+    return False
+
+
+def name_candidate_windows(text: str) -> List[Tuple[int, int]]:
+    """
+    Bereiche des Texts, die durch die NER laufen sollen
+
+    Sätze mit Namens-Hinweis; direkt aufeinanderfolgende werden zu einem
+    Bereich verbunden (weniger, längere Stücke für spaCy).
+
+    Returns:
+        Liste von (start, end) im Text, aufsteigend
+    """
+    windows: List[Tuple[int, int]] = []
+    last_kept = -2
+    for i, (start, end) in enumerate(split_sentences(text)):
+        if not has_name_cue(text[start:end]):
+            continue
+        if last_kept == i - 1:
+            windows[-1] = (windows[-1][0], end)
+        else:
+            windows.append((start, end))
+        last_kept = i
+    return windows
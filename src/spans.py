@@ -0,0 +1,306 @@
+"""
+Treffer-Spans: Duplikate, Konflikte und Ersetzung im Text
+
+Reine Standardbibliothek - gemeinsam genutzt von der Fused Pattern Engine
+(remove_duplicates), TextAnonymizer._apply_operators und der Lite-Engine
+(anonymize_spans). Ersetzt Presidio's AnonymizerEngine.anonymize: Konflikte
+per Sweep-Line mit festen Vorrang-Regeln statt paarweise (O(n²)), der Text in
+einem Durchlauf statt einer Kopie pro Treffer.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Roh-Treffer: (score, start, end, entity_type)
+RawMatch = Tuple[float, int, int, str]
+
+# Entity-Typ für Reste verdrängter Treffer: ohne eigenen Operator → "***"
+# (ENTITY_OPERATORS["DEFAULT"], siehe _select)
+REMAINDER_TYPE = "DEFAULT"
+
+# Zwischen zwei Treffern desselben Typs nur Leerzeichen → werden ein Treffer
+_SPACES_RE = re.compile(r'^( )+$')
+
+
+def remove_duplicates(raw: Iterable[RawMatch], entity_order: Optional[Dict[str, int]] = None) -> List[RawMatch]:
+    """
+    Entfernt Duplikate mit derselben Semantik wie EntityRecognizer.remove_duplicates
+
+    Ein Treffer fällt weg, wenn ein Treffer DESSELBEN Entity-Typs mit höherer
+    Priorität (Score, dann Position, dann Länge) ihn vollständig enthält.
+
+    Presidio vergleicht dafür jeden Treffer mit allen behaltenen (O(n²)).
+    Hier wird pro Entity-Typ eine "Treppe" der behaltenen Spans gepflegt
+    (Starts aufsteigend, Enden streng aufsteigend): die Containment-Prüfung
+    ist dann ein bisect → O(n log n).
+
+    Args:
+        raw: Treffer als (score, start, end, entity_type)
+        entity_order: Reihenfolge der Entity-Typen bei sonst gleichen Treffern
+
+    Returns:
+        Behaltene Treffer, sortiert wie bei Presidio
+    """
+    if entity_order is None:
+        entity_order = {}
+    ordered = sorted(
+        set(raw),
+        key=lambda r: (-r[0], r[1], r[1] - r[2], entity_order.get(r[3], 0))
+    )
+
+    kept = []
+    stairs: Dict[str, Tuple[List[int], List[int]]] = {}
+
+    for match in ordered:
+        score, start, end, entity_type = match
+        if score == 0:
+            continue
+
+        starts, ends = stairs.setdefault(entity_type, ([], []))
+        i = bisect_right(starts, start)
+
+        # Größtes Ende aller behaltenen Spans mit start' <= start
+        if i and ends[i - 1] >= end:
+            continue
+
+        # Einfügen und Spans entfernen, die der neue Span jetzt enthält
+        j = i
+        while j < len(starts) and ends[j] <= end:
+            j += 1
+        starts[i:j] = [start]
+        ends[i:j] = [end]
+
+        kept.append(match)
+
+    return kept
+
+
+class Span:
+    """Veränderbarer Treffer (wie presidio_anonymizer's RecognizerResult)"""
+
+    __slots__ = ("entity_type", "start", "end", "score")
+
+    def __init__(self, entity_type: str, start: int, end: int, score: float):
+        self.entity_type = entity_type
+        self.start = start
+        self.end = end
+        self.score = score
+
+    def __eq__(self, other):
+        return (
+            self.start == other.start and self.end == other.end
+            and self.entity_type == other.entity_type and self.score == other.score
+        )
+
+    def __repr__(self) -> str:
+        return f"Span({self.entity_type!r}, {self.start}, {self.end}, {self.score})"
+
+
+def _merge_same_type(spans: Iterable[Span]) -> List[Span]:
+    """
+    Verbindet überlappende Treffer DESSELBEN Typs zu einem umfassenden Span
+
+    Ein Durchlauf über die nach Start sortierten Spans: pro Entity-Typ bleibt
+    der zuletzt begonnene Span offen und wird erweitert, solange der nächste
+    vor seinem Ende beginnt (höchster Score gewinnt). Ergebnis nach Start sortiert.
+    """
+    merged = []
+    open_spans: Dict[str, Span] = {}
+    for span in sorted(spans, key=lambda s: (s.start, s.end)):
+        current = open_spans.get(span.entity_type)
+        if current is not None and span.start < current.end:
+            current.end = max(current.end, span.end)
+            current.score = max(current.score, span.score)
+        else:
+            open_spans[span.entity_type] = span
+            merged.append(span)
+    return merged
+
+
+def _select(text: str, cluster: List[Span], priority: Callable[[Span], tuple]) -> List[Span]:
+    """
+    Verteilt eine Gruppe überlappender Spans überlappungsfrei
+
+    Nach Priorität wird jeder Span übernommen, der keinen schon übernommenen
+    überlappt; die anderen verlieren ganz. Was von ihnen außerhalb der
+    übernommenen Spans übrig bleibt (ohne Leerraum am Rand), wird ein
+    REMAINDER_TYPE-Span und nur mit "***" ersetzt - so bleibt kein Teil eines
+    Treffers im Klartext, und kein Operator läuft auf einem Bruchstück
+    ("Königsstraße 88" ohne "Königsstraße" → "8.").
+
+    Die Gruppe deckt ihren Bereich lückenlos ab, die Reste sind also genau
+    die Lücken zwischen den übernommenen Spans. Belegt-Test und Belegen laufen
+    über einen Fenwick-Baum auf den Abschnitten zwischen den sortierten
+    Span-Grenzen (kein Verschieben von Listen-Elementen): O(k log k) pro Gruppe.
+    """
+    bounds = sorted({p for span in cluster for p in (span.start, span.end)})
+    index = {p: i for i, p in enumerate(bounds)}
+    tree = [0] * len(bounds)
+
+    def occupied(i: int) -> int:
+        """Anzahl belegter Abschnitte vor Abschnitt i"""
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    chosen: List[Span] = []
+    for span in sorted(cluster, key=priority):
+        first, last = index[span.start], index[span.end]
+        if occupied(last) != occupied(first):
+            continue
+        # Übernommene Spans sind disjunkt: jeder Abschnitt wird höchstens einmal belegt
+        for i in range(first + 1, last + 1):
+            while i < len(tree):
+                tree[i] += 1
+                i += i & -i
+        chosen.append(span)
+    chosen.sort(key=lambda s: s.start)
+
+    resolved: List[Span] = []
+    score = max(span.score for span in cluster)
+    position = bounds[0]
+    for span in chosen + [None]:
+        gap_end = bounds[-1] if span is None else span.start
+        piece = text[position:gap_end]
+        stripped = piece.strip()
+        if stripped:
+            gap_start = position + len(piece) - len(piece.lstrip())
+            resolved.append(Span(REMAINDER_TYPE, gap_start, gap_start + len(stripped), score))
+        if span is not None:
+            resolved.append(span)
+            position = span.end
+    return resolved
+
+
+def resolve_conflicts(text: str, spans: Iterable[Span], entity_priority: Optional[Dict[str, int]] = None) -> List[Span]:
+    """
+    Löst Überschneidungen auf - Sortieren + Sweep-Line, O(n log n)
+
+    1. Überschneiden sich Treffer DESSELBEN Typs, werden sie zu einem
+       umfassenden Span verbunden (höchster Score), wie bei Presidio.
+    2. Überschneiden sich Treffer VERSCHIEDENER Typen, gehört der gemeinsame
+       Bereich dem Treffer mit Vorrang, der andere fällt weg. Sein Rest
+       außerhalb wird nur mit "***" ersetzt (REMAINDER_TYPE), nicht mit
+       seinem Operator. Vorrang hat der Reihe nach:
+         - der höhere Score
+         - der längere Span
+         - der Entity-Typ weiter vorne in entity_priority (unbekannte zuletzt)
+         - der frühere Start, dann der Typ-Name (damit eindeutig)
+
+    Ein Sweep über die nach Start sortierten Spans teilt sie in Gruppen, die
+    sich über Ketten überlappen; nur innerhalb einer Gruppe wird nach
+    Priorität verteilt (siehe _select). Sortieren O(n log n), jede Gruppe
+    O(k log k) - zusammen O(n log n). Berühren zählt nicht als
+    Überlappung, leere Spans fallen weg.
+
+    Presidio vergleicht stattdessen alle Paare (O(n²)) und lässt teilweise
+    Überschneidungen verschiedener Typen stehen - dann überschreibt der
+    hintere Ersatztext den vorderen teilweise.
+
+    Args:
+        text: Original-Text (für Leerraum an den Rändern von Rest-Spans)
+        spans: Treffer (werden dabei verändert)
+        entity_priority: Entity-Typ → Rang (0 = höchster Vorrang)
+
+    Returns:
+        Überlappungsfreie Spans, nach Start sortiert
+    """
+    if entity_priority is None:
+        entity_priority = {}
+    last_rank = len(entity_priority)
+
+    def priority(span: Span) -> tuple:
+        return (
+            -span.score, span.start - span.end,
+            entity_priority.get(span.entity_type, last_rank), span.start, span.entity_type,
+        )
+
+    resolved: List[Span] = []
+    previous_end = -1
+
+    def flush(cluster: List[Span], cluster_end: int):
+        nonlocal previous_end
+        selected = cluster if len(cluster) == 1 else _select(text, cluster, priority)
+        # Reste zweier sich berührender Gruppen werden ein einziges "***"
+        first = selected[0]
+        if (cluster[0].start == previous_end and first.entity_type == REMAINDER_TYPE
+                and resolved[-1].entity_type == REMAINDER_TYPE):
+            resolved[-1].end = first.end
+            selected = selected[1:]
+        resolved.extend(selected)
+        previous_end = cluster_end
+
+    cluster: List[Span] = []
+    cluster_end = 0
+    for span in _merge_same_type(s for s in spans if s.start < s.end):
+        if cluster and span.start >= cluster_end:
+            flush(cluster, cluster_end)
+            cluster = []
+        cluster.append(span)
+        cluster_end = max(cluster_end, span.end)
+    if cluster:
+        flush(cluster, cluster_end)
+    return resolved
+
+
+def merge_whitespace(text: str, spans: List[Span]) -> List[Span]:
+    """Verbindet aufeinanderfolgende Treffer desselben Typs, zwischen denen nur Leerzeichen stehen (wie Presidio)"""
+    merged = []
+    previous = None
+    for span in spans:
+        if previous is not None and previous.entity_type == span.entity_type:
+            if _SPACES_RE.search(text[previous.end:span.start]):
+                merged.pop()
+                span.start = previous.start
+        merged.append(span)
+        previous = span
+    return merged
+
+
+def splice(text: str, spans: Iterable[Span], operate: Callable[[str, str], str]) -> str:
+    """
+    Ersetzt die Spans im Text in einem Durchlauf (ein ''.join statt Kopie pro Treffer)
+
+    Presidio baut den Text pro Treffer neu zusammen (text[:start] + ersatz +
+    text[end:]) - bei tausenden Treffern quadratisch viel Kopieren. Hier wird
+    einmal sortiert und jedes Original-Stück genau einmal kopiert.
+
+    Gleiche Reihenfolge und Überlappungs-Regel wie Presidio's TextReplaceBuilder:
+    Spans werden von hinten nach vorne bearbeitet (Start, dann Ende absteigend),
+    der Operator bekommt immer den vollen Original-Text des Spans, ersetzt wird
+    aber nur bis zum Start des zuvor bearbeiteten Spans.
+
+    Args:
+        text: Original-Text
+        spans: Aufgelöste Treffer (siehe resolve_conflicts, merge_whitespace)
+        operate: (entity_type, text des Treffers) → Ersatztext
+    """
+    pieces = []
+    limit = len(text)
+    for span in sorted(spans, key=lambda s: (s.start, s.end), reverse=True):
+        pieces.append(text[min(span.end, limit):limit])
+        pieces.append(operate(span.entity_type, text[span.start:span.end]))
+        limit = span.start
+    pieces.append(text[:limit])
+    pieces.reverse()
+    return ''.join(pieces)
+
+
+def anonymize_spans(text: str, spans: Iterable[Span], operate: Callable[[str, str], str],
+                    entity_priority: Optional[Dict[str, int]] = None) -> str:
+    """
+    Ersetzt die Treffer im Text (statt AnonymizerEngine.anonymize)
+
+    Konflikte auflösen, Treffer mit Leerzeichen dazwischen verbinden, dann
+    in einem Durchlauf ersetzen. Die Spans werden dabei verändert.
+
+    Args:
+        text: Original-Text
+        spans: Treffer
+        operate: (entity_type, text des Treffers) → Ersatztext
+        entity_priority: Entity-Typ → Rang bei Überlappungen (siehe resolve_conflicts)
+    """
+    return splice(text, merge_whitespace(text, resolve_conflicts(text, spans, entity_priority)), operate)
@@ -0,0 +1,146 @@
+"""
+Zeitmessung pro Stufe und pro Recognizer/Pattern
+
+Ein TimingReport sammelt Wall-Time (time.perf_counter) und Trefferzahlen:
+
+- Stufen: normalize, nlp, analyze, whitelist, score_filter, operators
+  ("nlp" ist nicht in "analyze" enthalten, die Recognizer schon)
+- Recognizer: im fast-Modus pro Pattern ("PERSON/Titel + Name"), mit
+  Presidio pro PatternRecognizer (Entity-Typ)
+
+Der Report wird für die Dauer eines Aufrufs über eine ContextVar aktiviert
+(threadsicher, der Hintergrund-Warm-up misst nicht mit). Ohne aktiven Report
+kosten die Messpunkte nur einen ContextVar-Lookup.
+
+Beispiel:
+    report = TimingReport()
+    for text in texte:
+        anonymizer.anonymize(text, timing=report)   # summiert über alle Aufrufe
+    print(report.format())
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_active_report: ContextVar[Optional["TimingReport"]] = ContextVar("anonymify_timing", default=None)
+
+
+class TimingEntry:
+    """Summierte Messwerte einer Stufe bzw. eines Recognizers"""
+
+    __slots__ = ("seconds", "calls", "hits")
+
+    def __init__(self, seconds: float = 0.0, calls: int = 0, hits: int = 0):
+        self.seconds = seconds
+        self.calls = calls
+        self.hits = hits
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ms": round(self.seconds * 1000, 3), "calls": self.calls, "hits": self.hits}
+
+
+class TimingReport:
+    """Zeiten pro Stufe und Recognizer, über beliebig viele Aufrufe summierbar"""
+
+    def __init__(self):
+        self.stages: Dict[str, TimingEntry] = {}
+        self.recognizers: Dict[str, TimingEntry] = {}
+        self.calls = 0
+        self.chars = 0
+        self.total_seconds = 0.0
+
+    def add_stage(self, name: str, seconds: float):
+        entry = self.stages.get(name)
+        if entry is None:
+            entry = self.stages[name] = TimingEntry()
+        entry.seconds += seconds
+        entry.calls += 1
+
+    def add_recognizer(self, name: str, seconds: float, hits: int):
+        entry = self.recognizers.get(name)
+        if entry is None:
+            entry = self.recognizers[name] = TimingEntry()
+        entry.seconds += seconds
+        entry.calls += 1
+        entry.hits += hits
+
+    def merge(self, other: "TimingReport") -> "TimingReport":
+        """Addiert einen anderen Report (z.B. aus Worker-Prozessen) zu diesem"""
+        for target, source in ((self.stages, other.stages), (self.recognizers, other.recognizers)):
+            for name, entry in source.items():
+                mine = target.get(name)
+                if mine is None:
+                    mine = target[name] = TimingEntry()
+                mine.seconds += entry.seconds
+                mine.calls += entry.calls
+                mine.hits += entry.hits
+        self.calls += other.calls
+        self.chars += other.chars
+        self.total_seconds += other.total_seconds
+        return self
+
+    def __iadd__(self, other: "TimingReport") -> "TimingReport":
+        return self.merge(other)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Strukturierte Form (z.B. für JSON), Recognizer nach Zeit absteigend"""
+        return {
+            "calls": self.calls,
+            "chars": self.chars,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "stages": {name: entry.to_dict() for name, entry in self.stages.items()},
+            "recognizers": {
+                name: entry.to_dict()
+                for name, entry in sorted(self.recognizers.items(), key=lambda item: -item[1].seconds)
+            },
+        }
+
+    def format(self, top: int = 10) -> str:
+        """Lesbare Tabelle: alle Stufen und die `top` langsamsten Recognizer"""
+        total = self.total_seconds or sum(entry.seconds for entry in self.stages.values()) or 1e-12
+        lines = [f"{self.calls} Aufrufe, {self.chars} Zeichen, gesamt {self.total_seconds * 1000:.1f}ms", "", "Stufen:"]
+        for name, entry in self.stages.items():
+            lines.append(
+                f"  {name:<34} {entry.seconds * 1000:>10.1f}ms {entry.seconds / total:>6.1%} {entry.calls:>8}x"
+            )
+        if self.recognizers:
+            lines += ["", f"Recognizer (Top {top}):"]
+            for name, entry in sorted(self.recognizers.items(), key=lambda item: -item[1].seconds)[:top]:
+                lines.append(
+                    f"  {name:<34} {entry.seconds * 1000:>10.1f}ms {entry.seconds / total:>6.1%} {entry.hits:>8} Treffer"
+                )
+        return "\n".join(lines)
+
+
+def current_report() -> Optional[TimingReport]:
+    """Der aktuell aktive Report (None = es wird nicht gemessen)"""
+    return _active_report.get()
+
+
+@contextmanager
+def activate(report: Optional[TimingReport]) -> Iterator[Optional[TimingReport]]:
+    """Aktiviert `report` für den Block (None = bestehende Aktivierung bleibt)"""
+    if report is None:
+        yield _active_report.get()
+        return
+    token = _active_report.set(report)
+    try:
+        yield report
+    finally:
+        _active_report.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Misst den Block als Stufe `name` im aktiven Report"""
+    report = _active_report.get()
+    if report is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        report.add_stage(name, time.perf_counter() - start)
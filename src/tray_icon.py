@@ -4,41 +4,81 @@ System Tray Icon für die Anonymisierungs-App mit Status-Farben
 
 import pystray
 from pystray import MenuItem as item
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageFont
 import logging
-from typing import Callable
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
 from .config_loader import get_config
 
 logger = logging.getLogger(__name__)
 
+ICON_SIZE = 64
+
+# Fertig gezeichnete Icons pro (Status, Farbe) - ein Statuswechsel tauscht
+# nur die Referenz, es wird nichts neu gezeichnet
+_ICON_CACHE: Dict[Tuple[str, str], Image.Image] = {}
+
+
+@lru_cache(maxsize=None)
+def _load_font(size: int):
+    """Lädt die Schrift für das "A" einmal (None = nicht vorhanden)"""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except (OSError, ImportError):
+        # ImportError: Pillow ohne FreeType
+        logger.debug("arial.ttf nicht gefunden - zeichne das A aus Balken")
+        return None
+
 
 class TrayIcon:
     """System Tray Icon Manager mit Farbwechsel"""
 
-    def __init__(self, on_quit_callback: Callable):
+    def __init__(self, on_quit_callback: Callable, engine_name: Optional[str] = None):
         """
         Args:
             on_quit_callback: Funktion die beim Beenden aufgerufen wird
+            engine_name: Aktive Erkennungs-Engine (z.B. "Patterns" oder "spaCy (de_core_news_lg)")
         """
         self.config = get_config()
         self.on_quit_callback = on_quit_callback
         self.icon = None
         self.current_status = 'ready'
+        self.engine_name = engine_name
         self.icon_colors = self.config.get_icon_colors()
         self.hotkey = self.config.get_hotkey()
 
+        # Alle Status-Icons einmal vorab zeichnen
+        for status in self.icon_colors:
+            self.create_icon_image(status)
+
+        # Statuswechsel werden im eigenen Thread ans Icon übergeben, damit
+        # der Hotkey-Worker nie auf das Neuzeichnen im Tray wartet
+        self._pending_status = self.current_status
+        self._status_changed = threading.Event()
+        self._status_thread: Optional[threading.Thread] = None
+        self._stopped = False
+
     def create_icon_image(self, status='ready') -> Image.Image:
         """
-        Erstellt ein Icon-Bild mit Statusfarbe (64x64)
+        Gibt das Icon-Bild mit Statusfarbe zurück (64x64, gecacht pro Status + Farbe)
 
         Args:
             status: 'ready' (grün), 'working' (gelb), 'error' (rot)
         """
-        width = 64
-        height = 64
-
         # Farben aus Config laden
         color = self.icon_colors.get(status, self.icon_colors['ready'])
+        key = (status, color)
+        image = _ICON_CACHE.get(key)
+        if image is None:
+            image = _ICON_CACHE[key] = self._draw_icon_image(color)
+        return image
+
+    @staticmethod
+    def _draw_icon_image(color: str) -> Image.Image:
+        """Zeichnet ein Icon-Bild in der angegebenen Farbe"""
+        width = ICON_SIZE
+        height = ICON_SIZE
 
         # Erstelle Bild
         image = Image.new('RGB', (width, height), color=color)
@@ -49,12 +89,10 @@ class TrayIcon:
         dc.ellipse([margin, margin, width - margin, height - margin], outline='white', width=4)
 
         # "A" für Anonymisierung - größerer Text
-        try:
-            from PIL import ImageFont
-            # Versuche eine größere Schrift zu verwenden
-            font = ImageFont.truetype("arial.ttf", 32)
+        font = _load_font(32)
+        if font is not None:
             dc.text((width // 2 - 12, height // 2 - 20), "A", fill='white', font=font)
-        except:
+        else:
             # Fallback ohne Font - zeichne größeres A
             dc.rectangle([20, 15, 25, 45], fill='white')  # Linker Balken
             dc.rectangle([39, 15, 44, 45], fill='white')  # Rechter Balken
@@ -65,32 +103,66 @@ class TrayIcon:
 
     def set_status(self, status: str):
         """
-        Ändert den Status und aktualisiert das Icon
+        Ändert den Status - blockiert nicht, das Icon wird im Status-Thread getauscht
 
         Args:
             status: 'ready', 'working', oder 'error'
         """
-        if self.icon and status != self.current_status:
-            self.current_status = status
-            new_icon = self.create_icon_image(status)
-            self.icon.icon = new_icon
-
-            # Update Title
-            titles = {
-                'ready': 'Anonymify - Bereit',
-                'working': 'Anonymify - Anonymisiert...',
-                'error': 'Anonymify - Fehler'
-            }
-            self.icon.title = titles.get(status, 'Anonymify')
+        self._pending_status = status
+        self._status_changed.set()
+
+    def _status_loop(self):
+        """Übernimmt den jeweils neuesten Status ins Icon (Zwischenstände fallen weg)"""
+        while True:
+            self._status_changed.wait()
+            self._status_changed.clear()
+            if self._stopped:
+                return
+            status = self._pending_status
+            if self.icon and status != self.current_status:
+                self._apply_status(status)
+
+    def _apply_status(self, status: str):
+        """Tauscht Icon-Bild (aus dem Cache) und Tooltip"""
+        self.current_status = status
+        self.icon.icon = self.create_icon_image(status)
+
+        # Update Title
+        self.icon.title = self._get_title(status)
+
+        logger.info(f"Icon-Status geändert zu: {status}")
+
+    def set_engine(self, engine_name: str):
+        """
+        Zeigt die aktive Erkennungs-Engine an (z.B. nach dem Laden von spaCy)
 
-            logger.info(f"Icon-Status geändert zu: {status}")
+        Args:
+            engine_name: Name der Engine
+        """
+        self.engine_name = engine_name
+        if self.icon:
+            self.icon.title = self._get_title(self.current_status)
+            self.icon.update_menu()
+        logger.info(f"Tray Icon: Engine ist jetzt {engine_name}")
+
+    def _get_title(self, status: str) -> str:
+        """Tooltip-Text für Status + aktive Engine"""
+        titles = {
+            'ready': 'Anonymify - Bereit',
+            'working': 'Anonymify - Anonymisiert...',
+            'error': 'Anonymify - Fehler'
+        }
+        title = titles.get(status, 'Anonymify')
+        if self.engine_name:
+            title += f" ({self.engine_name})"
+        return title
 
     def start(self):
         """Startet das Tray Icon"""
         try:
             logger.info("Erstelle System Tray Icon...")
 
-            # Erstelle Icon Bild (startet mit grün = bereit)
+            # Icon Bild aus dem Cache (startet mit grün = bereit)
             icon_image = self.create_icon_image('ready')
 
             # Erstelle Menü (mit dynamischem Hotkey aus Config)
@@ -112,6 +184,11 @@ class TrayIcon:
                     lambda: None,
                     enabled=False
                 ),
+                item(
+                    lambda _: f'Engine: {self.engine_name or "-"}',
+                    lambda: None,
+                    enabled=False
+                ),
                 pystray.Menu.SEPARATOR,
                 item(
                     'Beenden',
@@ -123,10 +200,16 @@ class TrayIcon:
             self.icon = pystray.Icon(
                 name="TextAnonymizer",
                 icon=icon_image,
-                title="Anonymify - Bereit",
+                title=self._get_title('ready'),
                 menu=menu
             )
 
+            self._stopped = False
+            self._status_thread = threading.Thread(target=self._status_loop, name="tray-status", daemon=True)
+            self._status_thread.start()
+            # Status, der vor dem Start gesetzt wurde, übernehmen
+            self._status_changed.set()
+
             logger.info("Starte System Tray Icon...")
             # Blockiert bis icon.stop() aufgerufen wird
             self.icon.run()
@@ -137,6 +220,8 @@ class TrayIcon:
 
     def stop(self):
         """Stoppt das Tray Icon"""
+        self._stopped = True
+        self._status_changed.set()
         if self.icon:
             logger.info("Stoppe System Tray Icon...")
             self.icon.stop()
@@ -0,0 +1,201 @@
+"""
+Vorkompilierter Whitelist-Index
+
+Baut die Whitelist (Config.get_whitelist) einmal beim Start in einen Index um:
+- frozenset aller Einträge (exakter Treffer)
+- frozenset der Einzelwörter (Wort-Treffer)
+- Aho-Corasick-Automat für Mehrwort-Phrasen wie "Deutsche Bank"
+
+Die Prüfung eines Treffers ist damit linear in der Länge des Treffers,
+unabhängig von der Größe der Whitelist.
+"""
+
+import re
+import sys
+import time
+import hashlib
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+
+# Entity-Typen die IMMER anonymisiert werden (keine Whitelist-Filterung)
+ALWAYS_ANONYMIZE = frozenset({
+    "EMAIL_ADDRESS", "PHONE_NUMBER", "IBAN_CODE", "CREDIT_CARD",
+    "IP_ADDRESS", "URL", "TAX_ID", "SOCIAL_SECURITY_NUMBER",
+    "ID_NUMBER", "ACCOUNT_NUMBER", "DATE_TIME",
+    "PROPERTY_REF", "LAND_PARCEL"  # Grundbuch + Flurstück
+})
+
+# Nur hier reicht ein ganzes Wort (oder eine ganze Phrase) aus der Whitelist im Treffer
+WORD_MATCH_ENTITIES = frozenset({"PERSON", "LOCATION", "STREET_ADDRESS"})
+
+
+def _is_word_char(char: str) -> bool:
+    """Entspricht \\w (Buchstabe, Ziffer oder Unterstrich)"""
+    return char.isalnum() or char == '_'
+
+
+class PhraseAutomaton:
+    """Aho-Corasick-Automat über Zeichen, findet Phrasen nur als ganze Wörter"""
+
+    def __init__(self, phrases: Iterable[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[str, ...]] = [()]
+
+        count = 0
+        for phrase in phrases:
+            if phrase:
+                self._add(phrase)
+                count += 1
+        self.phrase_count = count
+        self._build_fail_links()
+
+    def _add(self, phrase: str):
+        state = 0
+        for char in phrase:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+            state = next_state
+        if phrase not in self.output[state]:
+            self.output[state] = self.output[state] + (phrase,)
+
+    def _build_fail_links(self):
+        """Breitensuche: Fail-Links setzen und Ausgaben der Fail-Zustände übernehmen"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def find(self, text: str) -> Optional[str]:
+        """
+        Sucht die erste Phrase, die als ganze Wörter im Text vorkommt
+
+        Args:
+            text: Text in Kleinbuchstaben
+
+        Returns:
+            Gefundene Phrase oder None
+        """
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        text_len = len(text)
+        state = 0
+
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for phrase in output[state]:
+                start = i - len(phrase) + 1
+                # Wortgrenzen prüfen (nur wo die Phrase selbst mit einem Wortzeichen beginnt/endet)
+                if _is_word_char(phrase[0]) and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if _is_word_char(phrase[-1]) and i + 1 < text_len and _is_word_char(text[i + 1]):
+                    continue
+                return phrase
+
+        return None
+
+
+class WhitelistIndex:
+    """Whitelist als vorkompilierter Index (Einträge in Kleinbuchstaben)"""
+
+    def __init__(self, terms: Iterable[str]):
+        """
+        Args:
+            terms: Whitelist-Einträge (z.B. aus Config.get_whitelist)
+        """
+        start_time = time.perf_counter()
+
+        terms = [term.strip().lower() for term in terms if term and term.strip()]
+        self.terms = frozenset(terms)
+        self.words = frozenset(term for term in self.terms if _WORD_RE.fullmatch(term))
+        self.phrases = PhraseAutomaton(term for term in self.terms if term not in self.words)
+
+        # Digest des Inhalts (z.B. für Cache-Schlüssel, ohne Klartext)
+        self.digest = hashlib.blake2b('\n'.join(sorted(self.terms)).encode('utf-8'), digest_size=16).hexdigest()
+
+        self.build_time = time.perf_counter() - start_time
+        self.memory_size = self._estimate_memory()
+
+        logger.info(
+            f"Whitelist-Index: {len(self.words)} Wörter, {self.phrases.phrase_count} Phrasen "
+            f"(Aufbau: {self.build_time * 1000:.1f}ms, ~{self.memory_size / 1024:.0f} KB)"
+        )
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def contains_term(self, text: str) -> bool:
+        """Prüft ob der Text (komplett) auf der Whitelist steht"""
+        return text.lower() in self.terms
+
+    def find_word(self, text: str) -> Optional[str]:
+        """
+        Sucht ein GANZES Wort oder eine GANZE Phrase der Whitelist im Text
+
+        z.B. "Bundestag" matched, aber "im" matched NICHT in "Maximilian"
+
+        Returns:
+            Gefundener Whitelist-Eintrag oder None
+        """
+        lowered = text.lower()
+
+        if self.words:
+            for word in _WORD_RE.findall(lowered):
+                if word in self.words:
+                    return word
+
+        if self.phrases.phrase_count:
+            return self.phrases.find(lowered)
+
+        return None
+
+    def match(self, entity_type: str, text: str) -> Optional[str]:
+        """
+        Prüft ob ein erkannter Treffer wegen der Whitelist NICHT anonymisiert wird
+
+        E-Mail, Telefon, IBAN, etc. (ALWAYS_ANONYMIZE) nie; sonst wenn der
+        Treffer komplett auf der Whitelist steht, bei PERSON, LOCATION und
+        STREET_ADDRESS auch wenn er ein ganzes Wort der Whitelist enthält.
+
+        Returns:
+            Gefundener Whitelist-Eintrag oder None
+        """
+        if entity_type in ALWAYS_ANONYMIZE:
+            return None
+        if self.contains_term(text):
+            return text.lower()
+        if entity_type in WORD_MATCH_ENTITIES:
+            return self.find_word(text)
+        return None
+
+    def _estimate_memory(self) -> int:
+        """Schätzt den Speicherbedarf des Index in Bytes"""
+        size = sys.getsizeof(self.terms) + sys.getsizeof(self.words)
+        size += sum(sys.getsizeof(term) for term in self.terms)
+
+        automaton = self.phrases
+        size += sys.getsizeof(automaton.goto) + sys.getsizeof(automaton.fail) + sys.getsizeof(automaton.output)
+        size += sum(sys.getsizeof(edges) for edges in automaton.goto)
+        size += sum(sys.getsizeof(out) for out in automaton.output)
+        return size
@@ -0,0 +1,149 @@
+"""
+Test: Kommandozeile für Ordner (Kodierung, Zeilenenden, Struktur, Entity-Zählung)
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+from src import cli
+from src.anonymizer import TextAnonymizer
+
+logging.basicConfig(level=logging.WARNING)
+
+TEXT = "Sehr geehrter Herr Dr. Klaus Weber,\n\nbitte rufen Sie 030 555-1234 an (max@firma.de).\nGrüße aus München\n"
+
+_anonymizer = None
+
+
+def expected(text):
+    global _anonymizer
+    if _anonymizer is None:
+        _anonymizer = TextAnonymizer(language="de")
+        _anonymizer.initialize()
+    return _anonymizer.anonymize(text)
+
+
+def make_archive():
+    root = tempfile.mkdtemp()
+    archive = os.path.join(root, "akte")
+    os.makedirs(os.path.join(archive, "2024", "mails"))
+    with open(os.path.join(archive, "brief.txt"), "w", encoding="utf-8", newline="\n") as f:
+        f.write(TEXT)
+    with open(os.path.join(archive, "2024", "notiz.md"), "wb") as f:
+        f.write(TEXT.replace("\n", "\r\n").encode("cp1252"))
+    with open(os.path.join(archive, "2024", "mails", "mail.eml"), "wb") as f:
+        f.write(TEXT.encode("utf-8-sig"))
+    with open(os.path.join(archive, "2024", "scan.pdf"), "wb") as f:
+        f.write(b"%PDF-1.4")
+    return archive, os.path.join(root, "ausgabe")
+
+
+def test_detect_encoding():
+    assert cli.detect_encoding("Grüße\r\n".encode("utf-8")) == ("utf-8", "\r\n")
+    assert cli.detect_encoding("Grüße\n".encode("cp1252")) == ("cp1252", "\n")
+    assert cli.detect_encoding("Grüße".encode("utf-8-sig")) == ("utf-8-sig", None)
+    assert cli.detect_encoding("Grüße\n".encode("utf-16")) == ("utf-16", "\n")
+    # Am Probenende abgeschnittenes UTF-8-Zeichen
+    assert cli.detect_encoding("Grüße".encode("utf-8")[:3])[0] == "utf-8"
+
+
+def test_directory_is_anonymized_with_encodings():
+    archive, output = make_archive()
+    assert cli.main(["anonymize", archive, "-o", output, "--workers", "1"]) == 0
+
+    files = sorted(os.path.relpath(os.path.join(root, name), output)
+                   for root, _, names in os.walk(output) for name in names)
+    assert files == [os.path.join("2024", "mails", "mail.eml"), os.path.join("2024", "notiz.md"), "brief.txt"]
+
+    anonymized = expected(TEXT)
+    assert anonymized != TEXT
+    with open(os.path.join(output, "brief.txt"), "rb") as f:
+        assert f.read() == anonymized.encode("utf-8")
+    with open(os.path.join(output, "2024", "notiz.md"), "rb") as f:
+        assert f.read() == anonymized.replace("\n", "\r\n").encode("cp1252")
+    with open(os.path.join(output, "2024", "mails", "mail.eml"), "rb") as f:
+        assert f.read() == anonymized.encode("utf-8-sig")
+
+
+def test_parallel_workers_and_entity_counts():
+    archive, output = make_archive()
+    results = cli.anonymize_paths([archive], output, workers=2)
+    assert len(results) == 3
+    assert all(result.error is None for result in results)
+    for result in results:
+        assert result.entity_counts.get("EMAIL_ADDRESS") == 1
+        assert result.entity_counts.get("PHONE_NUMBER") == 1
+    # Keine temporären Dateien zurückgelassen
+    assert not [name for _, _, names in os.walk(output) for name in names if name.endswith(".tmp")]
+
+
+def test_parallel_splits_large_file():
+    archive, output = make_archive()
+    big = os.path.join(archive, "ocr.txt")
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_notarschreiben.txt"), encoding="utf-8") as f:
+        text = f.read() * 40
+    # Über parallel_min_chars → wird auf die Worker verteilt
+    assert len(text) > 200000
+    with open(big, "w", encoding="utf-8", newline="\r\n") as f:
+        f.write(text)
+
+    results = cli.anonymize_paths([archive], output, workers=1)
+    parallel_output = output + "_parallel"
+    assert cli.main(["anonymize", archive, "-o", parallel_output, "--workers", "2", "--parallel"]) == 0
+    with open(os.path.join(parallel_output, "ocr.txt"), "rb") as f:
+        assert f.read() == expected(text).replace("\n", "\r\n").encode("utf-8")
+    parallel_results = cli.anonymize_paths([archive], parallel_output, workers=2, parallel=True)
+    assert [r.entity_counts for r in results] == [r.entity_counts for r in parallel_results]
+
+
+def test_read_mapped_windows():
+    # Multibyte-Zeichen und \r\n über den Fenstergrenzen (ALLOCATIONGRANULARITY)
+    text = ("Grüße aus Köln – Straße\r\n" * 5000)
+    for encoding in ("utf-8", "utf-8-sig", "utf-16", "cp1252"):
+        path = os.path.join(tempfile.mkdtemp(), "gross.txt")
+        with open(path, "w", encoding=encoding, newline="") as f:
+            f.write(text)
+        pieces = list(cli.read_mapped(path, encoding, window_bytes=1))
+        assert len(pieces) > 1
+        assert "".join(pieces) == text.replace("\r\n", "\n")
+
+
+def test_mmap_output_matches_stream():
+    archive, output = make_archive()
+    big = os.path.join(archive, "ocr.txt")
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_notarschreiben.txt"), encoding="utf-8") as f:
+        text = f.read() * 30
+    with open(big, "w", encoding="utf-8", newline="\r\n") as f:
+        f.write(text)
+
+    results = cli.anonymize_paths([archive], output, workers=1)
+    mmap_output = output + "_mmap"
+    mmap_results = cli.anonymize_paths([archive], mmap_output, workers=1, use_mmap=True)
+    assert [r.entity_counts for r in results] == [r.entity_counts for r in mmap_results]
+    for result, mmap_result in zip(results, mmap_results):
+        with open(result.target, "rb") as f, open(mmap_result.target, "rb") as g:
+            assert f.read() == g.read()
+
+
+def main():
+    tests = [
+        test_detect_encoding, test_directory_is_anonymized_with_encodings, test_parallel_workers_and_entity_counts,
+        test_parallel_splits_large_file, test_read_mapped_windows, test_mmap_output_matches_stream,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Test: Zwischenablage wird nach Strg+C gelesen, sobald neuer Inhalt da ist
+(Fake-Zwischenablage statt System-Clipboard, läuft auch unter Linux)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import tempfile
+import threading
+from src.clipboard import ClipboardBackend, ClipboardCapture
+from src.config_loader import Config
+
+
+class FakeClipboard(ClipboardBackend):
+    """Zwischenablage im Speicher; "Strg+C" landet erst nach `delay` Sekunden"""
+
+    def __init__(self, text="alt", with_sequence=False):
+        self.text = text
+        self.sequence = 1 if with_sequence else None
+        self.paste_errors = 0
+        self.lock = threading.Lock()
+
+    def paste(self):
+        with self.lock:
+            if self.paste_errors:
+                self.paste_errors -= 1
+                raise RuntimeError("Zwischenablage belegt")
+            return self.text
+
+    def copy(self, text):
+        with self.lock:
+            self.text = text
+            if self.sequence is not None:
+                self.sequence += 1
+
+    def sequence_number(self):
+        return self.sequence
+
+    def copy_later(self, text, delay):
+        timer = threading.Timer(delay, self.copy, args=(text,))
+        timer.start()
+        return timer
+
+
+def test_returns_as_soon_as_content_changes():
+    clipboard = FakeClipboard()
+    capture = ClipboardCapture(clipboard, timeout=2.0)
+    content = capture.capture(lambda: clipboard.copy_later("Herr Dr. Klaus Weber", 0.03))
+    assert content.changed and content.text == "Herr Dr. Klaus Weber"
+    assert 0.03 <= content.waited < 0.2, content.waited
+
+
+def test_deadline_returns_previous_content():
+    # z.B. derselbe Text nochmal kopiert - Digest bleibt gleich
+    clipboard = FakeClipboard("Herr Dr. Klaus Weber")
+    capture = ClipboardCapture(clipboard, timeout=0.1)
+    content = capture.capture(lambda: clipboard.copy("Herr Dr. Klaus Weber"))
+    assert not content.changed and content.text == "Herr Dr. Klaus Weber"
+    assert 0.1 <= content.waited < 0.3, content.waited
+
+
+def test_sequence_number_detects_same_text():
+    clipboard = FakeClipboard("Herr Dr. Klaus Weber", with_sequence=True)
+    capture = ClipboardCapture(clipboard, timeout=2.0)
+    content = capture.capture(lambda: clipboard.copy_later("Herr Dr. Klaus Weber", 0.02))
+    assert content.changed and content.waited < 0.2, content
+
+
+def test_busy_and_empty_clipboard_keeps_waiting():
+    clipboard = FakeClipboard()
+    capture = ClipboardCapture(clipboard, timeout=2.0)
+
+    def send_copy():
+        clipboard.copy("")                      # Quell-Programm leert zuerst ...
+        clipboard.paste_errors = 2              # ... und hält die Zwischenablage offen
+        clipboard.copy_later("Neuer Text", 0.05)
+
+    content = capture.capture(send_copy)
+    assert content.changed and content.text == "Neuer Text", content
+
+
+def test_fallback_timeout_without_sequence_number():
+    # Linux/macOS: derselbe Text erneut kopiert → nicht länger als die frühere feste Wartezeit
+    clipboard = FakeClipboard("Herr Dr. Klaus Weber")
+    capture = ClipboardCapture(clipboard, timeout=2.0, fallback_timeout=0.1)
+    content = capture.capture(lambda: clipboard.copy("Herr Dr. Klaus Weber"))
+    assert not content.changed and content.waited < 0.3, content
+
+    # Mit Sequenznummer gilt weiter die volle Wartezeit (langsame Programme)
+    clipboard = FakeClipboard(with_sequence=True)
+    capture = ClipboardCapture(clipboard, timeout=2.0, fallback_timeout=0.1)
+    content = capture.capture(lambda: clipboard.copy_later("Neuer Text", 0.2))
+    assert content.changed and content.text == "Neuer Text", content
+
+
+def test_old_config_key_is_used():
+    def load(advanced):
+        path = os.path.join(tempfile.mkdtemp(), "config.toml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[advanced]\n" + advanced)
+        return Config(path)
+
+    # config.toml von vor der Umbenennung: clipboard_delay_ms bleibt wirksam
+    assert load("clipboard_delay_ms = 350\n").get_clipboard_timeout() == 0.35
+    assert load("clipboard_delay_ms = 350\n").get_clipboard_delay() == 0.35
+    assert load("clipboard_timeout_ms = 800\nclipboard_delay_ms = 350\n").get_clipboard_timeout() == 0.8
+    assert load("").get_clipboard_timeout() == 1.0
+
+
+def main():
+    tests = [
+        test_returns_as_soon_as_content_changes,
+        test_deadline_returns_previous_content,
+        test_sequence_number_detects_same_text,
+        test_busy_and_empty_clipboard_keeps_waiting,
+        test_fallback_timeout_without_sequence_number,
+        test_old_config_key_is_used,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+Test: Daemon + Client über lokalen Socket (bzw. Named Pipe unter Windows)
+"""
+
+import os
+import sys
+import uuid
+import logging
+import tempfile
+import threading
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.anonymizer import TextAnonymizer
+from src.daemon import AnonymizerClient, AnonymizerDaemon, default_address, _is_allowed_peer
+
+logging.basicConfig(level=logging.WARNING)
+
+TEXT = "Sehr geehrter Herr Dr. Klaus Weber, bitte rufen Sie 030 555-1234 an (max@firma.de)."
+
+
+def make_address():
+    name = f"anonymify-test-{uuid.uuid4().hex[:8]}"
+    if sys.platform == "win32":
+        return rf"\\.\pipe\{name}"
+    return os.path.join(tempfile.mkdtemp(), f"{name}.sock")
+
+
+def start_daemon():
+    anonymizer = TextAnonymizer(language="de")
+    daemon = AnonymizerDaemon(make_address(), anonymizer=anonymizer)
+    daemon.start()
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+    return daemon
+
+
+def test_anonymize_over_socket():
+    daemon = start_daemon()
+    try:
+        with AnonymizerClient(daemon.address) as client:
+            assert client.ping()
+            assert client.anonymize(TEXT) == daemon.anonymizer.anonymize(TEXT)
+            assert client.anonymize(TEXT, ["EMAIL_ADDRESS"]) == daemon.anonymizer.anonymize(TEXT, ["EMAIL_ADDRESS"])
+            assert client.anonymize_batch([TEXT, "", "Kein PII"]) == daemon.anonymizer.anonymize_batch([TEXT, "", "Kein PII"])
+
+            stats = client.stats()
+            assert stats["requests"] == 3
+            assert stats["engine"] == "Patterns"
+    finally:
+        daemon.close()
+
+
+def test_many_clients_share_one_daemon():
+    daemon = start_daemon()
+    expected = daemon.anonymizer.anonymize(TEXT)
+    results = []
+
+    def worker():
+        with AnonymizerClient(daemon.address) as client:
+            for _ in range(5):
+                results.append(client.anonymize(TEXT))
+
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [expected] * 20
+        assert daemon.connections == 4
+    finally:
+        daemon.close()
+
+
+def test_errors():
+    daemon = start_daemon()
+    try:
+        with AnonymizerClient(daemon.address) as client:
+            try:
+                client._request({"op": "gibtsnicht"})
+            except RuntimeError as e:
+                assert "Unbekannte Operation" in str(e)
+            else:
+                raise AssertionError("RuntimeError erwartet")
+            # Verbindung bleibt nach einem Fehler nutzbar
+            assert client.ping()
+    finally:
+        daemon.close()
+
+    try:
+        AnonymizerClient(make_address())
+    except ConnectionError:
+        pass
+    else:
+        raise AssertionError("ConnectionError erwartet")
+
+
+def test_invalid_fields():
+    daemon = AnonymizerDaemon(make_address(), anonymizer=TextAnonymizer(language="de"))
+    for request in (
+        {"op": "anonymize", "text": "a", "entities": [["PERSON"]]},
+        {"op": "anonymize", "text": "a", "entities": 5},
+        {"op": "anonymize_batch", "texts": ["a", 5]},
+        {"op": "anonymize_batch", "texts": ["a", None]},
+        ["anonymize"],
+    ):
+        response = daemon.handle_request(request)
+        assert response["ok"] is False, request
+    assert daemon.requests == 0
+
+
+def test_private_socket():
+    if sys.platform == "win32":
+        return
+
+    # Standard-Adresse ohne $XDG_RUNTIME_DIR: eigenes 0700-Verzeichnis im Temp-Ordner
+    runtime_dir = os.environ.pop("XDG_RUNTIME_DIR", None)
+    previous_tempdir, tempfile.tempdir = tempfile.tempdir, tempfile.mkdtemp()
+    try:
+        address = default_address()
+        directory = os.path.dirname(address)
+        assert directory == os.path.join(tempfile.tempdir, f"anonymify-{os.getuid()}")
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+
+        # Für andere zugängliches Verzeichnis wird nicht benutzt
+        os.chmod(directory, 0o777)
+        try:
+            default_address()
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("RuntimeError erwartet")
+    finally:
+        tempfile.tempdir = previous_tempdir
+        if runtime_dir is not None:
+            os.environ["XDG_RUNTIME_DIR"] = runtime_dir
+
+    daemon = start_daemon()
+    try:
+        assert os.stat(daemon.address).st_mode & 0o777 == 0o600
+    finally:
+        daemon.close()
+
+
+def test_shared_socket_for_group():
+    if sys.platform == "win32":
+        return
+    import grp
+
+    group = grp.getgrgid(os.getgid()).gr_name
+    previous_tempdir, tempfile.tempdir = tempfile.tempdir, tempfile.mkdtemp()
+    try:
+        daemon = AnonymizerDaemon(anonymizer=TextAnonymizer(language="de"), group=group)
+        daemon.start()
+        threading.Thread(target=daemon.serve_forever, daemon=True).start()
+        try:
+            # Gemeinsames Verzeichnis der Gruppe (0750), Socket für die Gruppe (0660)
+            assert daemon.address == default_address(group)
+            directory = os.stat(os.path.dirname(daemon.address))
+            assert directory.st_mode & 0o777 == 0o750 and directory.st_gid == os.getgid()
+            socket_info = os.stat(daemon.address)
+            assert socket_info.st_mode & 0o777 == 0o660 and socket_info.st_gid == os.getgid()
+
+            with AnonymizerClient(group=group) as client:
+                assert client.anonymize(TEXT) == daemon.anonymizer.anonymize(TEXT)
+
+            # Socket eines anderen Benutzers als dem Besitzer des Verzeichnisses → abgelehnt
+            if os.getuid() == 0:
+                os.chown(daemon.address, 65534, -1)
+                try:
+                    AnonymizerClient(group=group)
+                except ConnectionError as e:
+                    assert "anderen Benutzer" in str(e)
+                else:
+                    raise AssertionError("ConnectionError erwartet")
+        finally:
+            daemon.close()
+    finally:
+        tempfile.tempdir = previous_tempdir
+
+    # Peer-Prüfung (SO_PEERCRED): eigener Benutzer, Gruppe, sonst niemand
+    other_uid, other_gid = os.getuid() + 12345, os.getgid() + 12345
+    assert _is_allowed_peer(os.getuid(), other_gid, None)
+    assert not _is_allowed_peer(other_uid, os.getgid(), None)
+    assert _is_allowed_peer(other_uid, os.getgid(), os.getgid())
+    assert not _is_allowed_peer(other_uid, other_gid, os.getgid())
+
+
+def main():
+    tests = [
+        test_anonymize_over_socket, test_many_clients_share_one_daemon, test_errors, test_invalid_fields,
+        test_private_socket, test_shared_socket_for_group,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
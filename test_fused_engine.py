@@ -0,0 +1,78 @@
+"""
+Test: Fused Pattern Engine liefert dieselben Treffer wie die Presidio-Registry
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+from src.anonymizer import TextAnonymizer, DummyNlpEngine
+from src.pattern_engine import FusedPatternEngine
+from src.patterns import DEFAULT_ENTITIES
+from presidio_analyzer import AnalyzerEngine
+
+logging.basicConfig(level=logging.WARNING)
+
+SAMPLES = [
+    "Kontaktiere mich unter max.mueller@firma.de für Details.",
+    "Ruf mich an: 030 12345678 oder 0171 9876543, international +49 30 123456",
+    "Die Klage wurde eingereicht von Herrn Klaus Müller, der als Zeuge auftrat.",
+    "namens meiner Mandantin, Frau Dr. Anna-Maria Weber, und Prof. Dr. Heinrich Weber",
+    "Überweise auf DE89 3704 0044 0532 0130 00 bis Freitag, Konto-Nr. 12345678.",
+    "Am 15.03.2024 oder am 2024-03-15, Az.: 12 Js 345/24 und 123 C 456/2024",
+    "Wir treffen uns in der Hauptstraße 42, 80539 München, Grundbuch von Schwabing, Blatt 15678",
+    "Steuer-Nr.: 143/567/89012, Steuer-ID 12345678901, Karte 4111 1111 1111 1111",
+    "Server 192.168.1.1, https://example.com/pfad und www.kanzlei.de",
+]
+
+
+def _keys(results):
+    return sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+
+
+def _engines():
+    anonymizer = TextAnonymizer()
+    presidio = AnalyzerEngine(
+        registry=anonymizer._create_registry(),
+        nlp_engine=DummyNlpEngine(),
+        supported_languages=["en"]
+    )
+    return presidio, FusedPatternEngine()
+
+
+def test_same_results_as_presidio():
+    presidio, fused = _engines()
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_notarschreiben.txt'),
+              'r', encoding='utf-8') as f:
+        texts = SAMPLES + [f.read()]
+
+    for text in texts:
+        expected = presidio.analyze(text=text, language="de", entities=DEFAULT_ENTITIES)
+        assert _keys(fused.analyze(text, DEFAULT_ENTITIES)) == _keys(expected), text[:60]
+
+
+def test_entity_selection():
+    presidio, fused = _engines()
+    text = SAMPLES[4] + " " + SAMPLES[5]
+    for entities in (["IBAN_CODE"], ["DATE_TIME", "CASE_NUMBER"], ["PERSON"]):
+        expected = presidio.analyze(text=text, language="de", entities=entities)
+        assert _keys(fused.analyze(text, entities)) == _keys(expected), entities
+
+
+def main():
+    tests = [test_same_results_as_presidio, test_entity_selection]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
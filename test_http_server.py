@@ -0,0 +1,197 @@
+"""
+Test: HTTP-Dienst mit Micro-Batching
+"""
+
+import os
+import sys
+import json
+import logging
+import threading
+import http.client
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.anonymizer import TextAnonymizer
+from src.http_server import MicroBatcher, _Job, create_server
+
+logging.basicConfig(level=logging.WARNING)
+
+TEXT = "Sehr geehrter Herr Dr. Klaus Weber, bitte rufen Sie 030 555-1234 an (max@firma.de)."
+
+_anonymizer = None
+
+
+def get_test_anonymizer():
+    global _anonymizer
+    if _anonymizer is None:
+        _anonymizer = TextAnonymizer(language="de")
+        _anonymizer.initialize()
+    return _anonymizer
+
+
+def start_server():
+    server = create_server(get_test_anonymizer(), host="127.0.0.1", port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def stop_server(server):
+    server.shutdown()
+    server.server_close()
+    server.batcher.stop()
+
+
+def request(server, method, path, body=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+    data = body if isinstance(body, bytes) or body is None else json.dumps(body).encode("utf-8")
+    connection.request(method, path, data, {"Content-Type": "application/json"})
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read().decode("utf-8")), response.getheader("Retry-After")
+    connection.close()
+    return result
+
+
+def test_anonymize_endpoints():
+    server = start_server()
+    anonymizer = server.batcher.anonymizer
+    try:
+        status, body, _ = request(server, "POST", "/anonymize", {"text": TEXT})
+        assert status == 200
+        assert body["text"] == anonymizer.anonymize(TEXT)
+
+        status, body, _ = request(server, "POST", "/anonymize", {"text": TEXT, "entities": ["EMAIL_ADDRESS"]})
+        assert body["text"] == anonymizer.anonymize(TEXT, ["EMAIL_ADDRESS"])
+
+        texts = [TEXT, "", "Kein PII"]
+        status, body, _ = request(server, "POST", "/anonymize/batch", {"texts": texts})
+        assert status == 200
+        assert body["texts"] == anonymizer.anonymize_batch(texts)
+
+        status, body, _ = request(server, "GET", "/stats")
+        assert status == 200
+        assert body["requests"] == 3
+        assert set(body["latency"]) == {"p50_ms", "p90_ms", "p99_ms", "max_ms"}
+    finally:
+        stop_server(server)
+
+
+def test_concurrent_requests_are_batched():
+    server = start_server()
+    expected = server.batcher.anonymizer.anonymize(TEXT)
+    results = []
+
+    def worker():
+        for _ in range(5):
+            results.append(request(server, "POST", "/anonymize", {"text": TEXT})[1]["text"])
+
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [expected] * 40
+        assert server.batcher.batched_texts == 40
+        assert server.batcher.batches <= 40
+    finally:
+        stop_server(server)
+
+
+def raw_post(server, content_length):
+    """POST mit beliebigem Content-Length-Header (auch ungültig)"""
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    connection.putrequest("POST", "/anonymize")
+    connection.putheader("Content-Length", content_length)
+    connection.endheaders()
+    response = connection.getresponse()
+    status = response.status
+    connection.close()
+    return status
+
+
+class _BrokenTextAnonymizer:
+    """Scheitert an jedem Batch, der den Text "KAPUTT" enthält"""
+
+    def __init__(self, anonymizer):
+        self.anonymizer = anonymizer
+
+    def anonymize_batch(self, texts, entities=None):
+        if "KAPUTT" in texts:
+            raise ValueError("kaputter Text")
+        return self.anonymizer.anonymize_batch(texts, entities)
+
+
+def test_bad_content_length():
+    server = start_server()
+    try:
+        # Nicht-numerisch oder negativ → 400 (statt Absturz bzw. rfile.read(-1) bis zum Timeout)
+        assert raw_post(server, "abc") == 400
+        assert raw_post(server, "-1") == 400
+        status, _, _ = request(server, "POST", "/anonymize", {"text": TEXT})
+        assert status == 200
+    finally:
+        stop_server(server)
+
+
+def test_bad_text_fails_only_its_request():
+    anonymizer = get_test_anonymizer()
+    batcher = MicroBatcher(_BrokenTextAnonymizer(anonymizer))
+    jobs = [_Job([TEXT], None), _Job(["KAPUTT"], None), _Job([TEXT, "Kein PII"], None)]
+    batcher._process(jobs)
+    assert all(job.done.is_set() for job in jobs)
+    assert jobs[0].error is None and jobs[0].results == [anonymizer.anonymize(TEXT)]
+    assert jobs[1].error == "kaputter Text" and jobs[1].results is None
+    assert jobs[2].error is None and jobs[2].results == anonymizer.anonymize_batch([TEXT, "Kein PII"])
+
+
+def test_errors_and_backpressure():
+    server = start_server()
+    try:
+        status, body, _ = request(server, "POST", "/anonymize", b"{kein json")
+        assert status == 400
+        status, _, _ = request(server, "POST", "/anonymize/batch", {"texts": [1, 2]})
+        assert status == 400
+        status, _, _ = request(server, "GET", "/gibtsnicht")
+        assert status == 404
+        for entities in ([["PERSON"]], 5, "PERSON"):
+            status, _, _ = request(server, "POST", "/anonymize", {"text": TEXT, "entities": entities})
+            assert status == 400, entities
+
+        # Ein fehlerhafter Batch beendet den Batcher-Thread nicht
+        job = server.batcher.submit([TEXT], [["PERSON"]])
+        assert job.done.wait(10) and job.error
+        assert server.batcher._thread.is_alive()
+        status, _, _ = request(server, "POST", "/anonymize", {"text": TEXT})
+        assert status == 200
+
+        # Worker anhalten und Warteschlange füllen → 429 statt unbegrenztem Stau
+        server.batcher.stop()
+        while not server.batcher.queue.full():
+            server.batcher.queue.put_nowait(None)
+        status, _, retry_after = request(server, "POST", "/anonymize", {"text": TEXT})
+        assert status == 429
+        assert retry_after == "1"
+        assert server.stats()["rejected"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    tests = [
+        test_anonymize_endpoints, test_concurrent_requests_are_batched, test_bad_content_length,
+        test_bad_text_fails_only_its_request, test_errors_and_backpressure,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
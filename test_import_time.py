@@ -0,0 +1,79 @@
+"""
+Test: fast-Modus importiert weder spaCy noch Presidio (python -X importtime)
+
+Startet einen frischen Interpreter, der im fast-Modus initialisiert und einen
+Text anonymisiert, und wertet die Ausgabe von -X importtime aus.
+"""
+
+import os
+import sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Diese Pakete gehören nur zum balanced/accurate-Modus
+FORBIDDEN = ("spacy", "thinc", "presidio_analyzer", "presidio_anonymizer", "torch", "transformers")
+
+# Import von src.anonymizer (kumulativ) - mit presidio_analyzer waren es ~1s
+MAX_IMPORT_SECONDS = 0.5
+
+FAST_MODE_SCRIPT = """
+import logging
+logging.disable(logging.CRITICAL)
+from src.anonymizer import TextAnonymizer
+anonymizer = TextAnonymizer()
+anonymizer.recognition_mode = 'fast'
+anonymizer.use_fused_engine = True
+assert anonymizer.initialize()
+print(anonymizer.anonymize("Herr Dr. Klaus Weber, Tel. 030 555-1234, max@firma.de"))
+"""
+
+
+def _import_times(script):
+    """Führt script mit -X importtime aus: {Modul: kumulative Sekunden}, stdout"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=ROOT, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative_us) / 1e6
+    return modules, result.stdout
+
+
+def test_fast_mode_does_not_import_spacy():
+    modules, stdout = _import_times(FAST_MODE_SCRIPT)
+    assert "Herr Dr. W." in stdout, stdout
+
+    loaded = sorted(name for name in modules if name.split(".")[0] in FORBIDDEN)
+    assert not loaded, f"im fast-Modus importiert: {', '.join(loaded[:10])}"
+
+
+def test_anonymizer_import_time():
+    modules, _ = _import_times("import src.anonymizer")
+    seconds = modules["src.anonymizer"]
+    assert seconds < MAX_IMPORT_SECONDS, f"import src.anonymizer dauert {seconds:.2f}s"
+
+
+def main():
+    tests = [test_fast_mode_does_not_import_spacy, test_anonymizer_import_time]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Test: Inkrementelle Anonymisierung (Absatz-Cache)
+
+Ergebnis muss identisch zur vollständigen Analyse sein, auch bei Treffern
+über eine Leerzeile hinweg (z.B. "80539 München\n\nTel").
+"""
+
+import os
+import sys
+import random
+import logging
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.anonymizer import TextAnonymizer
+
+logging.basicConfig(level=logging.WARNING)
+
+_anonymizer = None
+
+
+def get_anonymizer():
+    global _anonymizer
+    if _anonymizer is None:
+        _anonymizer = TextAnonymizer(language="de")
+        _anonymizer.initialize()
+    return _anonymizer
+
+
+def anonymize_full(anonymizer, text):
+    """Vollständige Analyse ohne Absatz- und Ergebnis-Cache"""
+    anonymizer.use_incremental = False
+    anonymizer.result_cache.clear()
+    try:
+        return anonymizer.anonymize(text)
+    finally:
+        anonymizer.use_incremental = True
+        anonymizer.result_cache.clear()
+
+
+def test_same_result_as_full_analysis():
+    anonymizer = get_anonymizer()
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_notarschreiben.txt")
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+
+    assert anonymizer.anonymize(text) == anonymize_full(anonymizer, text)
+
+    edited = text.replace("850 qm", "851 qm", 1)
+    assert anonymizer.anonymize(edited) == anonymize_full(anonymizer, edited)
+
+
+def test_only_changed_paragraphs_analyzed():
+    anonymizer = get_anonymizer()
+    paragraphs = [f"Absatz {i}: Herr Max Mustermann{i:03d}, Tel. 030 555-{i:04d}" for i in range(20)]
+    text = "\n\n".join(paragraphs)
+    anonymizer.anonymize(text)
+
+    misses = anonymizer.paragraph_cache.misses
+    paragraphs[10] = "Absatz 10: Frau Dr. Anna Weber, anna.weber@example.de"
+    edited = "\n\n".join(paragraphs)
+    result = anonymizer.anonymize(edited)
+
+    # Geänderter Absatz + Vorgänger (Kontext über die Leerzeile)
+    assert anonymizer.paragraph_cache.misses - misses == 2
+    assert result == anonymize_full(anonymizer, edited)
+
+
+def test_match_across_blank_line():
+    anonymizer = get_anonymizer()
+    text = "Notariat Dr. Weber\nMaximilianstraße 10\n80539 München\n\nTel: 089 1234567\n\nMit freundlichen Grüßen"
+    assert anonymizer.anonymize(text) == anonymize_full(anonymizer, text)
+
+
+def test_paragraph_no_longer_crossed_into():
+    # Im ersten Text reicht "Max\n\nFrau" in Absatz 2 und verdeckt dessen eigene Treffer;
+    # dieses reduzierte Ergebnis darf nach Änderung von Absatz 1 nicht wiederverwendet werden
+    anonymizer = get_anonymizer()
+    anonymizer.paragraph_cache.clear()
+    anonymizer.result_cache.clear()
+    first = "Herr Max\n\nFrau Anna Schmidt kam.\n\nWeiteres folgt hier."
+    second = "Sehr geehrte Damen.\n\nFrau Anna Schmidt kam.\n\nWeiteres folgt hier."
+    assert anonymizer.anonymize(first) == anonymize_full(anonymizer, first)
+    result = anonymizer.anonymize(second)
+    assert "Schmidt" not in result
+    assert result == anonymize_full(anonymizer, second)
+
+
+def test_random_texts_match_full_analysis():
+    anonymizer = get_anonymizer()
+    fragments = [
+        "Dr.", "Prof.", "Herr", "Frau", "Max", "Müller", "Musterstraße", "Berlin", "12", "80539", "München",
+        "max@firma.de", "Tel.", "089 1234567", "DE89 3704 0044 0532 0130 00", "15.03.2024", "geb.", "und",
+        "der", "Vertrag", "\n", "\n\n", " \n\n ",
+    ]
+    # Treffer über die Leerzeile: der nächste Absatz darf nicht neu ab seinem Anfang zählen
+    texts = ["Dr. Musterstraße Berlin Musterstraße \n\n Prof. max@firma.de"]
+    for seed in range(200):
+        rng = random.Random(seed)
+        texts.append(" ".join(rng.choice(fragments) for _ in range(rng.randint(5, 40))))
+
+    for text in texts:
+        anonymizer.paragraph_cache.clear()
+        anonymizer.result_cache.clear()
+        assert anonymizer.anonymize(text) == anonymize_full(anonymizer, text), repr(text)
+
+        # Zweiter Lauf mit einem geänderten Absatz: übrige Absätze aus dem Cache
+        paragraphs = text.split("\n\n")
+        paragraphs[-1] += " Herr Max Müller"
+        edited = "\n\n".join(paragraphs)
+        assert anonymizer.anonymize(edited) == anonymize_full(anonymizer, edited), repr(edited)
+
+        # Dritter Lauf mit geändertem ersten Absatz: reicht kein Treffer mehr hinein
+        paragraphs[0] = "Sehr geehrte Damen."
+        edited = "\n\n".join(paragraphs)
+        assert anonymizer.anonymize(edited) == anonymize_full(anonymizer, edited), repr(edited)
+
+
+def main():
+    tests = [
+        test_same_result_as_full_analysis, test_only_changed_paragraphs_analyzed, test_match_across_blank_line,
+        test_paragraph_no_longer_crossed_into, test_random_texts_match_full_analysis,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
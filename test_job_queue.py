@@ -0,0 +1,165 @@
+"""
+Test: Hotkey-Jobs laufen im Worker-Thread, neuester Tastendruck gewinnt
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import time
+import logging
+import threading
+from src.job_queue import LatestWinsWorker
+
+
+class SlowJob:
+    """Handler mit zwei Schritten; der erste blockiert, bis er freigegeben wird"""
+
+    def __init__(self):
+        self.started = []
+        self.finished = []
+        self.release = threading.Event()
+        self.running = threading.Event()
+
+    def __call__(self, token):
+        self.started.append(token)
+        self.running.set()
+        self.release.wait(5)
+        token.raise_if_cancelled()
+        self.finished.append(token)
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_submit_does_not_block():
+    job = SlowJob()
+    worker = LatestWinsWorker(job)
+    worker.start()
+    try:
+        start = time.monotonic()
+        worker.submit()
+        assert job.running.wait(5)
+        for _ in range(5):
+            worker.submit()
+        assert time.monotonic() - start < 0.5
+    finally:
+        job.release.set()
+        worker.stop()
+
+
+def test_latest_wins_and_cancellation():
+    job = SlowJob()
+    worker = LatestWinsWorker(job)
+    worker.start()
+    try:
+        first = worker.submit()
+        assert job.running.wait(5)
+        # Drei Tastendrücke während Job 1 läuft → nur der letzte wird ausgeführt
+        worker.submit()
+        worker.submit()
+        last = worker.submit()
+        assert first.token.cancelled
+        job.release.set()
+
+        assert _wait_until(lambda: worker.completed == 1)
+        assert job.started == [first.token, last.token]
+        assert job.finished == [last.token]
+        assert worker.cancelled == 1
+        assert worker.coalesced == 2
+    finally:
+        job.release.set()
+        worker.stop()
+
+
+def test_bounded_queue_drops_oldest():
+    job = SlowJob()
+    worker = LatestWinsWorker(job, max_queue=2)
+    worker.start()
+    try:
+        worker.submit()
+        assert job.running.wait(5)
+        jobs = [worker.submit() for _ in range(10)]
+        assert worker._queue.qsize() == 2
+        assert all(j.token.cancelled for j in jobs[:8])
+        job.release.set()
+        assert _wait_until(lambda: worker.completed == 1)
+        assert job.finished == [jobs[-1].token]
+    finally:
+        job.release.set()
+        worker.stop()
+
+
+def test_logs_wait_and_depth():
+    records = []
+
+    class Collect(logging.Handler):
+        def emit(self, record):
+            records.append(record.getMessage())
+
+    handler = Collect()
+    logger = logging.getLogger("src.job_queue")
+    logger.addHandler(handler)
+    old_level = logger.level
+    logger.setLevel(logging.INFO)
+
+    done = threading.Event()
+    worker = LatestWinsWorker(lambda token: done.set())
+    worker.start()
+    try:
+        worker.submit()
+        assert done.wait(5)
+        assert _wait_until(lambda: any("fertig" in r for r in records))
+        assert any("gewartet, Warteschlange 1" in r for r in records), records
+    finally:
+        worker.stop()
+        logger.removeHandler(handler)
+        logger.setLevel(old_level)
+
+
+def test_errors_do_not_stop_worker():
+    calls = []
+
+    def handler(token):
+        calls.append(token)
+        if len(calls) == 1:
+            raise RuntimeError("kaputt")
+
+    worker = LatestWinsWorker(handler)
+    worker.start()
+    try:
+        worker.submit()
+        assert _wait_until(lambda: len(calls) == 1)
+        worker.submit()
+        assert _wait_until(lambda: worker.completed == 1)
+        assert worker.cancelled == 0
+    finally:
+        worker.stop()
+
+
+def main():
+    tests = [
+        test_submit_does_not_block,
+        test_latest_wins_and_cancellation,
+        test_bounded_queue_drops_oldest,
+        test_logs_wait_and_depth,
+        test_errors_do_not_stop_worker,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Test: Lite-Engine (nur Standardbibliothek) - gleiche Ausgabe wie der fast-Modus
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import random
+import logging
+import subprocess
+from src.lite import LiteAnonymizer
+from src.anonymizer import TextAnonymizer
+from src.pattern_engine import FusedPatternEngine
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Bausteine für Zufallstexte (inkl. Zeichen, die re und regex unterschiedlich einordnen)
+TOKENS = [
+    "Herr", "Frau", "Dr.", "Prof.", "Max", "Müller", "Anna-Lena", "Schmidt", "a.b@c.de", "x@y.z",
+    "ß", "ẞ", "Straße", "Hauptstr.", "12", "12345", "Berlin", "030", "555-1234", "+49", "DE89",
+    "3704", "0044", "0532", "0130", "00", "15.03.2024", "2024-03-15", "Az.:", "C", "456/2024",
+    "\n   ", "\n\n", " ", "  ", ",", ".", "@", "www.x.de", "https://a.b/c", "192.168.1.1", "GB",
+    "Flurstück", "Gemarkung", "K", "Konto", "1234567890", "Steuer-ID", "12/345/67890",
+    "DE123456789", "Ä", "ö", "Müller", "²", "½", "\x1c", "‿", "Ⓐ", "ſ", "K",
+]
+
+# Lädt die Lite-Engine in einem Interpreter, in dem Presidio und regex fehlen
+WITHOUT_PRESIDIO_SCRIPT = """
+import sys
+BLOCKED = ("presidio_analyzer", "presidio_anonymizer", "regex", "spacy")
+
+class Block:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in BLOCKED:
+            raise ImportError(f"{name} nicht installiert")
+
+sys.meta_path.insert(0, Block())
+from src.lite import LiteAnonymizer
+print(LiteAnonymizer(whitelist=[]).anonymize("Herr Dr. Klaus Weber, Tel. 030 555-1234, max@firma.de"))
+"""
+
+
+def _random_texts(count, seed=1):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(TOKENS) for _ in range(rng.randint(1, 40))) for _ in range(count)]
+
+
+def _fast_anonymizer():
+    anonymizer = TextAnonymizer()
+    anonymizer.recognition_mode = 'fast'
+    anonymizer.use_fused_engine = True
+    assert anonymizer.initialize()
+    return anonymizer
+
+
+def test_same_output_as_fast_mode():
+    logging.disable(logging.CRITICAL)
+    try:
+        anonymizer = _fast_anonymizer()
+        lite = LiteAnonymizer(
+            whitelist=anonymizer.whitelist,
+            person_threshold=anonymizer.person_threshold,
+            other_threshold=anonymizer.other_threshold,
+        )
+        with open(os.path.join(ROOT, "test_notarschreiben.txt"), encoding="utf-8") as f:
+            document = f.read()
+        assert lite.anonymize(document) == anonymizer.anonymize(document)
+
+        # Zufallstexte einzeln (ohne Absatz-Cache, der Treffer über mehrere Absätze nicht kennt)
+        anonymizer.use_incremental = False
+        for text in _random_texts(500):
+            assert lite.anonymize(text) == anonymizer.anonymize(text), repr(text)
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def test_same_matches_as_fused_engine():
+    engine = FusedPatternEngine()
+    lite = LiteAnonymizer(whitelist=[], person_threshold=0.0, other_threshold=0.0)
+    entities = engine.get_supported_entities()
+    for text in _random_texts(500, seed=2):
+        assert lite.analyze(text, entities) == engine.scan(text, entities), repr(text)
+
+
+def test_runs_without_presidio():
+    result = subprocess.run(
+        [sys.executable, "-c", WITHOUT_PRESIDIO_SCRIPT],
+        cwd=ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert "Herr Dr. W." in result.stdout, result.stdout
+    assert "m***@f***.de" in result.stdout, result.stdout
+
+
+def main():
+    tests = [test_same_output_as_fast_mode, test_same_matches_as_fused_engine, test_runs_without_presidio]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Test: Model-Registry (Verfügbarkeit ohne Laden, jedes Modell genau einmal)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import spacy
+
+from src.model_registry import ModelRegistry
+
+
+def make_model_dir():
+    """Leeres deutsches Modell auf der Platte (statt de_core_news_sm/lg)"""
+    path = os.path.join(tempfile.mkdtemp(), "blank_de")
+    spacy.blank("de").to_disk(path)
+    return path
+
+
+def test_availability_without_loading():
+    registry = ModelRegistry()
+    assert registry.is_available("spacy")  # installiertes Paket
+    assert not registry.is_available("de_core_news_gibtsnicht")
+    path = make_model_dir()
+    assert registry.is_available(path)
+    assert not registry.is_loaded(path)
+
+
+def test_model_loaded_once():
+    registry = ModelRegistry()
+    path = make_model_dir()
+
+    loaded = []
+    threads = [threading.Thread(target=lambda: loaded.append(registry.load(path))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(nlp is loaded[0] for nlp in loaded)
+    assert registry.is_loaded(path)
+
+    report = registry.report()
+    assert len(report) == 1
+    assert report[0].name == path and report[0].load_time >= 0
+
+
+def test_only_selected_components_loaded():
+    path = os.path.join(tempfile.mkdtemp(), "tagger_ner_de")
+    nlp = spacy.blank("de")
+    nlp.add_pipe("tagger").add_label("NN")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("ner").add_label("PER")
+    nlp.initialize()
+    nlp.to_disk(path)
+
+    registry = ModelRegistry()
+    trimmed = registry.load(path, components=["tok2vec", "ner"])
+    assert trimmed.pipe_names == ["ner"]
+    assert registry.load(path).pipe_names == ["tagger", "sentencizer", "ner"]
+    assert registry.load(path, components=["ner", "tok2vec"]) is trimmed
+    assert len(registry.report()) == 2
+
+
+def test_missing_model_raises():
+    registry = ModelRegistry()
+    try:
+        registry.load("de_core_news_gibtsnicht")
+    except OSError:
+        pass
+    else:
+        raise AssertionError("OSError erwartet")
+    assert registry.report() == []
+
+
+def main():
+    tests = [
+        test_availability_without_loading, test_model_loaded_once,
+        test_only_selected_components_loaded, test_missing_model_raises
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Test: Parallel-Modus liefert dasselbe Ergebnis wie ein einzelner Prozess
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+from src.anonymizer import TextAnonymizer
+from src.parallel import ParallelAnonymizer, split_text, _chunk_windows
+from src.whitelist import WhitelistIndex
+
+logging.basicConfig(level=logging.WARNING)
+
+FILLER = "Der Käufer zahlt den Kaufpreis fristgerecht auf das Notaranderkonto. "
+NAME = "Es erschien Herr Dr. Maximilian Mustermann. "
+
+
+def _anonymizer():
+    anonymizer = TextAnonymizer()
+    anonymizer.use_incremental = False
+    anonymizer.initialize()
+    return anonymizer
+
+
+def _long_paragraph():
+    """Ein Absatz ohne Leerzeile: wird an Satzgrenzen (auch hinter "Dr.") geteilt"""
+    return FILLER * 900 + NAME * 300
+
+
+def test_chunks_cover_text():
+    text = _long_paragraph()
+    # Stückgröße wie in ParallelAnonymizer.anonymize mit 2 Workern
+    chunks = split_text(text, max(len(text) // (2 * 4), 10000))
+    assert len(chunks) > 2
+    assert ''.join(chunk for _, chunk in chunks) == text
+
+    # Mindestens eine Grenze liegt hinter "Dr." - genau der Fall, der früher Namen verlor
+    assert any(text[:offset].endswith("Dr. ") for offset, _ in chunks)
+
+    for offset, window, start, end in _chunk_windows(text, chunks, 1024):
+        assert text[offset:offset + len(window)] == window
+        # Eigenes Stück plus bis zu 1024 Zeichen Kontext davor und dahinter
+        assert start - offset == min(start, 1024)
+        assert offset + len(window) == min(len(text), end + 1024)
+
+
+def test_parallel_matches_single_process():
+    text = _long_paragraph()
+    anonymizer = _anonymizer()
+    expected = anonymizer.anonymize(text)
+    assert "Mustermann" not in expected
+
+    with ParallelAnonymizer(anonymizer, workers=2) as parallel:
+        parallel.min_chars = 0
+        assert parallel.anonymize(text) == expected
+
+
+def test_paragraphs_and_short_text():
+    anonymizer = _anonymizer()
+    text = ("Max Müller, Tel. 0171 1234567, max.mueller@firma.de.\n\n" + FILLER * 200 + "\n\n") * 10
+    with ParallelAnonymizer(anonymizer, workers=2) as parallel:
+        parallel.min_chars = 0
+        assert parallel.anonymize(text) == anonymizer.anonymize(text)
+        # Unter parallel_min_chars direkt im Prozess
+        parallel.min_chars = 10 ** 9
+        assert parallel.anonymize(NAME) == anonymizer.anonymize(NAME)
+
+
+def test_workers_use_parent_settings():
+    # Im Prozess geänderte Einstellungen gelten auch in den Workern (nicht config.toml)
+    anonymizer = _anonymizer()
+    anonymizer.whitelist = ["Maximilian Mustermann"]
+    anonymizer.whitelist_index = WhitelistIndex(anonymizer.whitelist)
+    text = _long_paragraph()
+    expected = anonymizer.anonymize(text)
+    assert "Mustermann" in expected
+
+    with ParallelAnonymizer(anonymizer, workers=2) as parallel:
+        parallel.min_chars = 0
+        assert parallel.anonymize(text) == expected
+
+
+def main():
+    tests = [
+        test_chunks_cover_text, test_parallel_matches_single_process, test_paragraphs_and_short_text,
+        test_workers_use_parent_settings,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Test: Alle Patterns laufen auch bei präparierten Eingaben linear (kein ReDoS)
+und die backtracking-sicheren Umschreibungen finden dieselben Treffer
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import time
+import random
+
+import regex
+from src.patterns import PATTERN_RULES
+from src.pattern_engine import REGEX_FLAGS
+
+# Ursprüngliche (naive) Fassungen der umgeschriebenen Patterns
+ORIGINAL = {
+    "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+    "name_with_title_complex": r"\b(Herr|Frau|Hr\.|Fr\.|Herrn)\s+(Prof\.\s+)?(Dr\.\s+)?(med\.\s+)?(Prof\.\s+)?(Dr\.\s+)?([A-ZÄÖÜ][a-zäöüß]{1,}(-[A-ZÄÖÜ][a-zäöüß]+)?\s+)*[A-ZÄÖÜ][a-zäöüß]{2,}(-[A-ZÄÖÜ][a-zäöüß]+)?",
+    "name_with_dr": r"\b(Prof\.\s+|Dr\.\s+|Prof\.\s+Dr\.\s+|Dr\.\s+med\.\s+)([A-ZÄÖÜ][a-zäöüß]{1,}(-[A-ZÄÖÜ][a-zäöüß]+)?\s+)*[A-ZÄÖÜ][a-zäöüß]{2,}(-[A-ZÄÖÜ][a-zäöüß]+)?",
+    "name_after_comma_title": r",\s+(Herr|Frau|Hr\.|Fr\.|Herrn)\s+(Dr\.\s+)?(med\.\s+)?([A-ZÄÖÜ][a-zäöüß]{2,}(-[A-ZÄÖÜ][a-zäöüß]+)?\s+)*[A-ZÄÖÜ][a-zäöüß]{3,}(-[A-ZÄÖÜ][a-zäöüß]+)?",
+    "phone_mobile": r"0\d{3,4}[\s\-/]?\d{3,4}[\s\-/]?\d{3,4}",
+    "phone_intl": r"\+49[\s\-/]?\d{2,4}[\s\-/]?\d{3,9}",
+    "phone_landline": r"0\d{2,5}[\s\-/]?(\d{3,4}[\s\-/]?)?\d{4,8}",
+}
+
+# Auslöser + kurzer Baustein, tausendfach wiederholt (provoziert Backtracking)
+ADVERSARIAL = [
+    ("", "a."), ("a@", "a."), ("a@", "1."), ("", "a-@"), ("Herr ", "Ab "), ("Dr. ", "Ab "),
+    (", Herr ", "Abc "), ("Herr ", "Abc Ab "), ("", "1 "), ("", "01 "), ("", "1/"), ("", "1."),
+    ("", "1-"), ("Az. ", "1 "), ("Grundbuch von ", "Ab "), ("https://", "a."), ("", "Ab\n"),
+    # Telefon: Ziffernfolgen mit Trennern an jeder Stelle
+    ("", "0 "), ("", "01-"), ("", "0171/"), ("", "012 "), ("", "0-1 "), ("+49 ", "12 "), ("", "+49-1"),
+]
+
+TOKENS = [
+    "Herr", "Frau", "Hr.", "Herrn", "Dr.", "Prof.", "med.", "Ab", "Abc", "Abcd", "ab", "ABC",
+    "Ab-Cd", "Abcd-Ef", "Müller", "Ö", "ß", "Xy-", "Weber1", "12345", ",", "-", "@", "a.",
+    ".de", ".d", "|", "max.mueller@firma.de", "x@y", "1.", "_",
+    "0", "0171", "030", "+49", "555", "1234", "12345678", "123456789", "/",
+]
+SEPARATORS = [" ", "  ", "\n", "\t", "", ",", ", ", ".", "-", "/"]
+
+
+def _worst_case(compiled, size):
+    worst = 0.0
+    for trigger, fragment in ADVERSARIAL:
+        text = trigger + fragment * (size // len(fragment)) + "!"
+        start = time.perf_counter()
+        for _ in compiled.finditer(text):
+            pass
+        worst = max(worst, time.perf_counter() - start)
+    return worst
+
+
+def _spans(compiled, text):
+    return [match.span() for match in compiled.finditer(text)]
+
+
+def test_linear_worst_case():
+    """Achtfache Eingabelänge → höchstens ~achtfache Zeit (quadratisch wäre 64x)"""
+    slow = []
+    for rules in PATTERN_RULES.values():
+        for rule in rules:
+            compiled = regex.compile(rule.regex, flags=REGEX_FLAGS)
+            small = _worst_case(compiled, 4000)
+            large = _worst_case(compiled, 32000)
+            # Unter 20ms ist auch ein schlechter Faktor nur Messrauschen
+            if large > 0.02 and large > 24 * max(small, 1e-4):
+                slow.append(f"{rule.name} ({small * 1000:.1f}ms → {large * 1000:.1f}ms)")
+    assert not slow, "superlinear: " + ", ".join(slow)
+
+
+def test_same_matches_as_original():
+    """Umgeschriebene Patterns liefern dieselben Spans wie die ursprünglichen"""
+    current = {rule.name: rule.regex for rules in PATTERN_RULES.values() for rule in rules}
+    pairs = {
+        name: (regex.compile(original, flags=REGEX_FLAGS), regex.compile(current[name], flags=REGEX_FLAGS))
+        for name, original in ORIGINAL.items()
+    }
+
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_notarschreiben.txt'),
+              'r', encoding='utf-8') as f:
+        texts = [f.read()]
+    rng = random.Random(42)
+    for _ in range(5000):
+        texts.append("".join(
+            rng.choice(TOKENS) + rng.choice(SEPARATORS) for _ in range(rng.randint(1, 12))
+        ))
+
+    for name, (original, rewritten) in pairs.items():
+        for text in texts:
+            assert _spans(original, text) == _spans(rewritten, text), f"{name}: {text!r}"
+
+
+def main():
+    tests = [test_linear_worst_case, test_same_matches_as_original]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
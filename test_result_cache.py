@@ -0,0 +1,99 @@
+"""
+Test: Ergebnis-Cache (LRU nach Anzahl + Bytes, Invalidierung bei Konfig-Änderung)
+"""
+
+import os
+import sys
+import threading
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.result_cache import ResultCache
+
+
+def test_hit_and_miss():
+    cache = ResultCache(max_entries=4)
+    cache.validate("fast|0.7")
+    key = ResultCache.make_key("Herr Max Müller", "fast|0.7", ["PERSON"])
+    assert cache.get(key) is None
+    cache.put(key, "<PERSON>")
+    assert cache.get(key) == "<PERSON>"
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Andere Entity-Auswahl → anderer Schlüssel
+    assert ResultCache.make_key("Herr Max Müller", "fast|0.7", ["EMAIL_ADDRESS"]) != key
+
+
+def test_eviction():
+    cache = ResultCache(max_entries=2)
+    for i in range(3):
+        cache.put(ResultCache.make_key(f"Text {i}", "", []), f"Ergebnis {i}")
+    assert len(cache) == 2
+    assert cache.get(ResultCache.make_key("Text 0", "", [])) is None
+
+    cache = ResultCache(max_entries=100, max_bytes=2000)
+    for i in range(10):
+        cache.put(ResultCache.make_key(f"Text {i}", "", []), "x" * 500)
+    assert cache.total_bytes <= 2000
+    assert len(cache) < 10
+
+
+def test_invalidation():
+    cache = ResultCache()
+    cache.validate("fast|0.7")
+    cache.put(ResultCache.make_key("Text", "fast|0.7", []), "Ergebnis")
+    cache.validate("fast|0.7")
+    assert len(cache) == 1
+    cache.validate("balanced|0.7")
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+
+def test_disabled():
+    cache = ResultCache(max_entries=0)
+    assert not cache.enabled
+    cache.put(b"key", "Ergebnis")
+    assert len(cache) == 0
+
+
+def test_concurrent_access():
+    # Hotkey-Worker, Warm-up und Daemon-Verbindungen greifen gleichzeitig zu
+    cache = ResultCache(max_entries=8)
+    keys = [ResultCache.make_key(f"Text {i}", "", []) for i in range(32)]
+    errors = []
+
+    def worker(seed):
+        try:
+            for i in range(2000):
+                key = keys[(seed * 7 + i) % len(keys)]
+                if cache.get(key) is None:
+                    cache.put(key, f"Ergebnis {i}")
+                if i % 500 == 0:
+                    cache.validate(f"fast|{i}")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, errors
+    assert len(cache) <= 8
+    assert cache.total_bytes == sum(size for _, size in cache._entries.values())
+
+
+def main():
+    tests = [test_hit_and_miss, test_eviction, test_invalidation, test_disabled, test_concurrent_access]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Test: Satz-Filter vor der NER (nur Sätze mit Namens-Hinweis gehen durch spaCy)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import spacy
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
+
+from src.nlp_engines import SentenceGatedNlpEngine
+from src.sentence_gate import split_sentences, has_name_cue, name_candidate_windows
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Namen/Orte, die ein Entity-Ruler statt eines trainierten Modells findet
+RULER_PATTERNS = [
+    {"label": "PER", "pattern": name}
+    for name in ["Heinrich Weber", "Maximilian Josef Müller-Hoffmann", "Klaus-Dieter Schneider",
+                 "Martin Becker", "Stefan Meier", "Julia Hoffmann", "Sabine Krüger"]
+] + [{"label": "LOC", "pattern": "München"}]
+
+
+def _ruler_nlp():
+    nlp = spacy.blank("de")
+    nlp.add_pipe("entity_ruler", config={"phrase_matcher_attr": "ORTH"}).add_patterns(RULER_PATTERNS)
+    return nlp
+
+
+def _engine(engine_class):
+    engine = engine_class(models=[{"lang_code": "de", "model_name": "blank_de"}])
+    engine.nlp = {"de": _ruler_nlp()}
+    return engine
+
+
+def _entities(artifacts):
+    return [(e.start_char, e.end_char, e.label_, e.text) for e in artifacts.entities]
+
+
+def test_split_sentences():
+    text = "Herr Dr. Max Müller wohnt in der Hauptstr. 5 in Berlin. Der Käufer zahlt am 3. März.\n\nZeugen: keine"
+    sentences = [text[start:end] for start, end in split_sentences(text)]
+    assert sentences == [
+        "Herr Dr. Max Müller wohnt in der Hauptstr. 5 in Berlin.",
+        "Der Käufer zahlt am 3. März.",
+        "Zeugen: keine",
+    ], sentences
+
+
+def test_name_cues():
+    assert has_name_cue("Es erschien Frau Schmidt.")
+    assert has_name_cue("Vertreten durch Rechtsanwalt Becker.")
+    assert has_name_cue("Anna Schmidt unterschreibt den Vertrag.")
+    assert has_name_cue("Der Vertrag wird mit Max Müller geschlossen.")
+    assert not has_name_cue("Der Kaufpreis ist zahlbar wie folgt:")
+    assert not has_name_cue("Die Verkäufer verkaufen an den Käufer das Grundstück.")
+    assert not has_name_cue("Lastenfreie Auflassung ist im Grundbuch eingetragen.")
+    assert not has_name_cue("Urkundenrolle Nr. 4567/2024")
+
+
+def test_offsets_mapped_back():
+    with open(os.path.join(ROOT, "test_notarschreiben.txt"), encoding="utf-8") as f:
+        text = f.read()
+
+    full = _entities(_engine(SpacyNlpEngine).process_text(text, "de"))
+    gated = _entities(_engine(SentenceGatedNlpEngine).process_text(text, "de"))
+    windows = name_candidate_windows(text)
+
+    # Gleiche Treffer wie auf dem ganzen Text, soweit sie in einem gefilterten Satz liegen
+    assert gated == [e for e in full if any(start <= e[0] and e[1] <= end for start, end in windows)]
+    assert all(text[start:end] == entity for start, end, _, entity in gated)
+    # Jeder Name aus dem Ruler steht in einem Satz mit Namens-Hinweis
+    assert {e for e in full if e[2] == "PERSON"} <= set(gated)
+    # Weniger Text für spaCy
+    assert sum(end - start for start, end in windows) < 0.7 * len(text)
+
+
+def test_batch_matches_single():
+    engine = _engine(SentenceGatedNlpEngine)
+    texts = ["Kein Name hier.", "Es erschien Herr Heinrich Weber aus München.", "", "Frau Julia Hoffmann. Ende."]
+    batch = [_entities(artifacts) for artifacts in engine.process_gated(texts, "de", batch_size=2)]
+    assert batch == [_entities(engine.process_text(text, "de")) for text in texts]
+    assert batch[0] == [] and batch[2] == []
+    assert [e[3] for e in batch[1]] == ["Heinrich Weber", "München"]
+    assert [text for text, _ in engine.process_batch(texts, "de")] == texts
+
+
+def main():
+    tests = [test_split_sentences, test_name_cues, test_offsets_mapped_back, test_batch_matches_single]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
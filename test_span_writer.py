@@ -0,0 +1,205 @@
+"""
+Test: Span-Writer - Konflikt-Regeln (Sweep-Line) und Ersetzung in einem Durchlauf
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import re
+import copy
+import random
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities import OperatorConfig, RecognizerResult
+from src.operators import ENTITY_OPERATORS, apply_operator
+from src.presidio_operators import PRESIDIO_OPERATORS
+from src.patterns import ENTITY_PRIORITY
+from src.spans import REMAINDER_TYPE, Span, anonymize_spans, resolve_conflicts
+
+ENTITY_TYPES = list(ENTITY_OPERATORS)[1:] + ["UNBEKANNT"]
+
+# Wörter, an denen die Operatoren unterschiedliche Zweige nehmen
+WORDS = [
+    "Herr", "Dr.", "Max", "Müller", "Hauptstraße", "12", "12345", "Berlin", "max@firma.de",
+    "030", "555-1234", "+49", "DE89", "3704", "15.03.2024", "2024-03-15", "123", "C", "456/2024",
+    "Az.:", "a", "", " ", "  ", "\n", ",", ".",
+]
+
+
+def _presidio_engine():
+    engine = AnonymizerEngine()
+    for operator in PRESIDIO_OPERATORS:
+        engine.add_anonymizer(operator)
+    return engine
+
+
+def _presidio(engine, text, results):
+    operators = {entity_type: OperatorConfig(name, dict(params)) for entity_type, (name, params) in ENTITY_OPERATORS.items()}
+    return engine.anonymize(text=text, analyzer_results=copy.deepcopy(results), operators=operators).text
+
+
+def _writer(text, results):
+    spans = [Span(r.entity_type, r.start, r.end, r.score) for r in results]
+    return anonymize_spans(text, spans, apply_operator, ENTITY_PRIORITY)
+
+
+def _reference(text, results):
+    """Die dokumentierten Regeln naiv (alle Paare) - Vergleich für die Sweep-Line"""
+    spans = [[r.entity_type, r.start, r.end, r.score] for r in results if r.start < r.end]
+
+    # Gleicher Typ + Überlappung → ein umfassender Span, bis nichts mehr passt
+    merged = True
+    while merged:
+        merged = False
+        for a in spans:
+            for b in spans:
+                if a is not b and a[0] == b[0] and a[1] < b[2] and b[1] < a[2]:
+                    a[1], a[2], a[3] = min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+                    spans.remove(b)
+                    merged = True
+                    break
+            if merged:
+                break
+
+    # Verschiedene Typen: nach Score, Länge, Entity-Priorität; wer einen schon
+    # gewählten Treffer überlappt, fällt weg - seine übrigen Zeichen werden "***"
+    owner = [None] * len(text)
+    chosen = []
+    for span in sorted(spans, key=lambda s: (-s[3], s[1] - s[2], ENTITY_PRIORITY.get(s[0], len(ENTITY_PRIORITY)), s[1], s[0])):
+        if all(owner[i] is None for i in range(span[1], span[2])):
+            owner[span[1]:span[2]] = [span] * (span[2] - span[1])
+            chosen.append(span)
+    covered = [any(s[1] <= i < s[2] for s in spans) for i in range(len(text))]
+    i = 0
+    while i < len(text):
+        if covered[i] and owner[i] is None:
+            j = i
+            while j < len(text) and covered[j] and owner[j] is None:
+                j += 1
+            piece = text[i:j]
+            if piece.strip():
+                start = i + len(piece) - len(piece.lstrip())
+                chosen.append([REMAINDER_TYPE, start, start + len(piece.strip()), 0])
+            i = j
+        else:
+            i += 1
+
+    # Gleicher Typ, nur Leerzeichen dazwischen → verbinden
+    joined = []
+    for span in sorted(chosen, key=lambda s: s[1]):
+        if joined and joined[-1][0] == span[0] and re.fullmatch(r' +', text[joined[-1][2]:span[1]]):
+            joined[-1][2] = span[2]
+        else:
+            joined.append(span)
+
+    for entity_type, start, end, _ in reversed(joined):
+        text = text[:start] + apply_operator(entity_type, text[start:end]) + text[end:]
+    return text
+
+
+def _random_case(rng):
+    text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 30)))
+    results = []
+    for _ in range(rng.randint(0, 15)):
+        start = rng.randint(0, len(text))
+        end = rng.randint(start, min(len(text), start + 30))
+        results.append(RecognizerResult(
+            entity_type=rng.choice(ENTITY_TYPES[:4] if rng.random() < 0.5 else ENTITY_TYPES),
+            start=start, end=end, score=rng.choice([0.5, 0.7, 0.85, 0.9, 1.0]),
+        ))
+    return text, results
+
+
+def test_matches_reference_on_random_overlaps():
+    rng = random.Random(7)
+    for _ in range(3000):
+        text, results = _random_case(rng)
+        assert _writer(text, results) == _reference(text, results), (text, results)
+
+
+def test_priority_rules():
+    text = "IBAN DE89 3704 0044 0532 0130 00 am 15.03.2024"
+    iban = (5, 32)
+    # Gleicher Score und gleiche Länge → IBAN vor Telefon (ENTITY_PRIORITY)
+    results = [RecognizerResult("PHONE_NUMBER", *iban, 0.9), RecognizerResult("IBAN_CODE", *iban, 0.9)]
+    assert _writer(text, results) == "IBAN DE89 37** **** am 15.03.2024"
+    # Höherer Score schlägt den längeren Span - dessen Rest außerhalb wird nur "***"
+    results = [RecognizerResult("IBAN_CODE", 5, 46, 0.6), RecognizerResult("DATE_TIME", 36, 46, 0.9)]
+    assert _writer(text, results) == "IBAN *** XX.03.2024"
+    # Gleicher Score → der längere Span gewinnt, der kürzere wird nicht zusätzlich ersetzt
+    results = [RecognizerResult("DATE_TIME", 36, 46, 0.9), RecognizerResult("PHONE_NUMBER", 33, 46, 0.9)]
+    assert _writer(text, results) == "IBAN DE89 3704 0044 0532 0130 00 150***"
+
+
+def test_loser_remainder_is_masked():
+    # Der Rest eines verdrängten Treffers läuft nicht durch dessen Operator ("88" → "8.")
+    text = "Notar Dr. Heinrich Weber\nKönigsstraße 88"
+    results = [RecognizerResult("PERSON", 10, 37, 0.85), RecognizerResult("STREET_ADDRESS", 25, 40, 0.6)]
+    assert _writer(text, results) == "Notar Dr. K. ***"
+    # Ein überlappter Treffer in der Mitte: beide Reste um den Gewinner werden "***"
+    text = "Tel 0171 1234567 89"
+    results = [RecognizerResult("PHONE_NUMBER", 4, 19, 0.6), RecognizerResult("DATE_TIME", 9, 16, 0.9)]
+    assert _writer(text, results) == "Tel *** " + apply_operator("DATE_TIME", "1234567") + " ***"
+
+
+def test_merges_same_type_separated_by_spaces():
+    text = "Herr Max   Müller und Frau Anna Schmidt"
+    results = [
+        RecognizerResult("PERSON", 0, 8, 0.85),
+        RecognizerResult("PERSON", 11, 17, 0.85),
+        RecognizerResult("PERSON", 22, 39, 0.9),
+    ]
+    assert _writer(text, results) == _presidio(_presidio_engine(), text, results) == "Herr M. und Frau S."
+
+
+def test_many_hits():
+    # Tausende Treffer: gleiche Ausgabe, jedes Original-Stück nur einmal kopiert
+    text = " ".join(f"Tel. 030 {1000000 + i}" for i in range(2000))
+    results = []
+    pos = 0
+    for i in range(2000):
+        start = text.index("030", pos)
+        end = start + len(f"030 {1000000 + i}")
+        results.append(RecognizerResult("PHONE_NUMBER", start, end, 0.7))
+        pos = end
+    assert _writer(text, results) == _presidio(_presidio_engine(), text, results)
+
+
+def test_dense_overlaps():
+    # Viele sich überlappende Ziffern-Treffer verschiedener Typen (Sweep statt O(n²))
+    rng = random.Random(3)
+    text = " ".join(str(rng.randint(0, 99999)) for _ in range(3000))
+    results = []
+    for _ in range(6000):
+        start = rng.randrange(len(text) - 20)
+        results.append(RecognizerResult(rng.choice(ENTITY_TYPES[:8]), start, start + rng.randint(3, 20), rng.choice([0.6, 0.7, 0.8, 0.9])))
+    spans = [Span(r.entity_type, r.start, r.end, r.score) for r in results]
+    resolved = resolve_conflicts(text, spans, ENTITY_PRIORITY)
+    assert all(a.end <= b.start for a, b in zip(resolved, resolved[1:]))
+    # Jedes Zeichen eines Treffers (außer Leerraum) bleibt abgedeckt
+    covered = set()
+    for span in resolved:
+        covered.update(range(span.start, span.end))
+    assert all(i in covered or text[i] == " " for r in results for i in range(r.start, r.end))
+
+
+def main():
+    tests = [
+        test_matches_reference_on_random_overlaps, test_priority_rules, test_loser_remainder_is_masked,
+        test_merges_same_type_separated_by_spaces,
+        test_many_hits, test_dense_overlaps,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Test: anonymize_stream ersetzt dasselbe wie anonymize (kein Treffer geht an einer Schnittstelle verloren), mit begrenztem Speicher
+"""
+
+import io
+import os
+import sys
+import random
+import tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+from src.anonymizer import TextAnonymizer
+
+logging.basicConfig(level=logging.WARNING)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_text():
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _anonymizer(window, overlap):
+    anonymizer = TextAnonymizer()
+    anonymizer.initialize()
+    anonymizer.stream_window_chars = window
+    anonymizer.stream_overlap_chars = overlap
+    return anonymizer
+
+
+def test_stream_matches_full_text():
+    text = _load_text() * 4
+    anonymizer = _anonymizer(window=500, overlap=300)
+    expected = anonymizer.anonymize(text)
+
+    # Datei-Objekt, kleine Stücke (Entities über Stück-Grenzen) und ganzer String
+    assert ''.join(anonymizer.anonymize_stream(io.StringIO(text))) == expected
+    pieces = [text[i:i + 37] for i in range(0, len(text), 37)]
+    assert ''.join(anonymizer.anonymize_stream(pieces)) == expected
+    assert ''.join(anonymizer.anonymize_stream(text)) == expected
+
+
+def test_stream_memory_is_bounded():
+    base = _load_text()
+    anonymizer = _anonymizer(window=8192, overlap=1024)
+
+    def generate(copies):
+        for _ in range(copies):
+            yield base
+
+    peaks = []
+    for copies in (20, 200):
+        tracemalloc.start()
+        for _ in anonymizer.anonymize_stream(generate(copies)):
+            pass
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    # 10x mehr Eingabe darf den Spitzenverbrauch nicht vervielfachen
+    assert peaks[1] < peaks[0] * 2, peaks
+
+
+def test_single_huge_piece():
+    # Ein einziges riesiges Stück (z.B. sys.stdin.read()) wird trotzdem fensterweise verarbeitet
+    base = _load_text()
+    anonymizer = _anonymizer(window=8192, overlap=1024)
+    text = base * 60
+    assert ''.join(anonymizer.anonymize_stream([text])) == anonymizer.anonymize(text)
+
+    calls = []
+    detect = anonymizer._detect
+    anonymizer._detect = lambda text, entities, *args: calls.append(len(text)) or detect(text, entities, *args)
+    for _ in anonymizer.anonymize_stream([text]):
+        pass
+    assert max(calls) < 2 * 8192 + 1024, max(calls)
+
+
+def test_multiline_names_across_pieces():
+    # Zeilenumbruch + Einrückung hinter einem Namen, an jeder möglichen Stück-Grenze
+    block = "Es erschien Herr Max Müller\n      geb. am 01.02.1970, wohnhaft in Berlin.\n"
+    text = block * 40
+    anonymizer = _anonymizer(window=200, overlap=120)
+    expected = anonymizer.anonymize(text)
+    for size in (1, 3, 7, 29, 31, 64):
+        pieces = [text[i:i + size] for i in range(0, len(text), size)]
+        assert ''.join(anonymizer.anonymize_stream(pieces)) == expected, size
+
+
+def test_space_separated_hits_at_cut():
+    # Gleicher Typ, nur Leerzeichen dazwischen: wie bei anonymize() ein Treffer,
+    # auch wenn die Schnittstelle genau dazwischen fallen würde
+    iban = "DE89 3704 0044 0532 0130 00"
+    line = f"Konten {iban} {iban} bitte prüfen. "
+    text = line * 30
+    anonymizer = _anonymizer(window=len(line), overlap=200)
+    expected = anonymizer.anonymize(text)
+    assert expected.count("DE89 37** ****") == 30
+    # Jede mögliche Lage der Schnittstelle innerhalb einer Zeile
+    for window in range(len(line), 2 * len(line)):
+        anonymizer.stream_window_chars = window
+        assert ''.join(anonymizer.anonymize_stream(text)) == expected, window
+
+
+def _masked(text, spans):
+    """Zeichen, die ein Treffer abdeckt (ohne Leerraum)"""
+    return {i for r in spans for i in range(r.start, r.end) if not text[i].isspace()}
+
+
+def test_no_hit_lost_random_windows():
+    # Zufällige Texte und Fenstergrößen: jedes Zeichen, das anonymize() ersetzt,
+    # ersetzt auch der Stream (Fenster zusammengesetzt = normalisierter Gesamttext)
+    fragments = [
+        "Dr.", "Prof.", "Herr", "Frau", "Max", "Müller", "Anna", "Schmidt", "Musterstraße", "Hauptstr. 5",
+        "Berlin", "80539", "München", "max@firma.de", "Tel.", "089 1234567", "030", "555-1234",
+        "DE89 3704 0044 0532 0130 00", "15.03.2024", "geb.", "und", "der", "Vertrag", "\n", "\n\n",
+    ]
+    anonymizer = _anonymizer(window=1000, overlap=1024)
+    anonymizer.use_incremental = False
+    apply_operators = anonymizer._apply_operators
+    windows = []
+    anonymizer._apply_operators = lambda text, results: windows.append((text, list(results))) or apply_operators(text, results)
+
+    for seed in range(100):
+        rng = random.Random(seed)
+        text = " ".join(rng.choice(fragments) for _ in range(rng.randint(200, 1000)))
+        anonymizer.stream_window_chars = rng.randint(300, 2000)
+
+        windows.clear()
+        anonymizer.anonymize(text)
+        full_text, full_spans = windows[0]
+        expected = _masked(full_text, full_spans)
+
+        windows.clear()
+        for _ in anonymizer.anonymize_stream(text):
+            pass
+        masked = set()
+        offset = 0
+        for window_text, spans in windows:
+            masked.update(offset + i for i in _masked(window_text, spans))
+            offset += len(window_text)
+        assert ''.join(window_text for window_text, _ in windows) == full_text, seed
+        assert expected <= masked, (seed, sorted(expected - masked)[:10])
+
+
+def main():
+    tests = [
+        test_stream_matches_full_text, test_stream_memory_is_bounded, test_single_huge_piece,
+        test_multiline_names_across_pieces, test_space_separated_hits_at_cut, test_no_hit_lost_random_windows,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Test: Zeitmessung pro Stufe und Recognizer (TimingReport)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+from src.anonymizer import TextAnonymizer
+from src.timing import TimingReport, stage
+
+logging.basicConfig(level=logging.WARNING)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STAGES = {"normalize", "analyze", "whitelist", "score_filter", "operators"}
+
+
+def _load_text():
+    with open(os.path.join(ROOT, 'test_notarschreiben.txt'), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _anonymizer(use_fused_engine=True):
+    anonymizer = TextAnonymizer()
+    anonymizer.use_fused_engine = use_fused_engine
+    anonymizer.result_cache.max_entries = 0
+    anonymizer.use_incremental = False
+    anonymizer.initialize()
+    return anonymizer
+
+
+def test_report_has_stages_and_patterns():
+    anonymizer = _anonymizer()
+    text = _load_text()
+
+    anonymized, report = anonymizer.anonymize_with_timing(text)
+    assert anonymized == anonymizer.anonymize(text)
+    assert STAGES <= set(report.stages)
+    assert report.calls == 1 and report.chars == len(text)
+    assert sum(entry.seconds for entry in report.stages.values()) <= report.total_seconds
+
+    # fast-Modus: ein Eintrag pro Pattern, Treffer = Roh-Treffer der Fused Engine
+    text_normalized = anonymizer._normalize_multiline_names(text)
+    patterns = anonymizer.pattern_engine._select_patterns(None)
+    assert len(report.recognizers) == len(patterns)
+    assert "PERSON/name_with_dr" in report.recognizers
+    assert sum(entry.hits for entry in report.recognizers.values()) >= len(anonymizer._analyze(text_normalized, None))
+
+
+def test_presidio_path_per_recognizer():
+    # fast-Modus ohne Fused Engine: Presidio-Pfad
+    anonymizer = _anonymizer(use_fused_engine=False)
+    text = _load_text()
+
+    anonymized, report = anonymizer.anonymize_with_timing(text)
+    assert anonymized == anonymizer.anonymize(text)
+    assert "nlp" in report.stages
+    assert report.recognizers["EMAIL_ADDRESS"].hits > 0
+
+
+def test_report_aggregates_across_calls():
+    anonymizer = _anonymizer()
+    text = _load_text()
+
+    report = TimingReport()
+    anonymizer.anonymize(text, timing=report)
+    anonymizer.anonymize(text, timing=report)
+    assert report.calls == 2
+    assert report.stages["operators"].calls == 2
+
+    single = anonymizer.anonymize_with_timing(text)[1]
+    merged = TimingReport()
+    merged += single
+    merged += single
+    assert merged.calls == 2
+    assert merged.recognizers["PERSON/name_with_dr"].hits == 2 * single.recognizers["PERSON/name_with_dr"].hits
+    assert set(merged.to_dict()) == {"calls", "chars", "total_ms", "stages", "recognizers"}
+
+
+def test_no_report_no_measurement():
+    # Ohne aktiven Report ist stage() ein No-op
+    with stage("analyze"):
+        pass
+    report = TimingReport()
+    assert report.stages == {} and report.format()
+
+
+def main():
+    tests = [
+        test_report_has_stages_and_patterns, test_presidio_path_per_recognizer,
+        test_report_aggregates_across_calls, test_no_report_no_measurement,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Test: Progressiver Start (Patterns sofort, NLP-Engine im Hintergrund)
+"""
+
+import os
+import sys
+import time
+import logging
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine
+
+from src.anonymizer import TextAnonymizer, DummyNlpEngine
+
+logging.basicConfig(level=logging.WARNING)
+
+TEXT = "Sehr geehrter Herr Dr. Klaus Weber, bitte rufen Sie 030 555-1234 an (max@firma.de)."
+
+
+class LoadedNlpEngine(NlpEngine):
+    """Steht für ein geladenes spaCy-Modell (liefert leere NLP-Artefakte)"""
+
+    def process_text(self, text, language):
+        return NlpArtifacts([], [], [], [], None, language)
+
+    def process_batch(self, texts, language, **kwargs):
+        return [self.process_text(text, language) for text in texts]
+
+    def is_loaded(self):
+        return True
+
+    def load(self):
+        pass
+
+    def get_supported_languages(self):
+        return ["de", "en"]
+
+    def get_supported_entities(self):
+        return []
+
+    def is_stopword(self, word, language):
+        return False
+
+    def is_punct(self, word, language):
+        return False
+
+
+def make_anonymizer(load_seconds=0.2):
+    anonymizer = TextAnonymizer(language="de")
+    anonymizer.recognition_mode = 'balanced'
+
+    def create_nlp_engine():
+        # Simuliert die Ladezeit des Modells
+        time.sleep(load_seconds)
+        return LoadedNlpEngine()
+
+    anonymizer._create_nlp_engine = create_nlp_engine
+    return anonymizer
+
+
+def test_patterns_available_immediately():
+    anonymizer = make_anonymizer(load_seconds=5)
+    start = time.time()
+    assert anonymizer.initialize(progressive=True)
+    assert time.time() - start < 5
+    assert anonymizer.active_engine == "Patterns"
+    assert anonymizer.pattern_engine is not None
+    assert "030 555-1234" not in anonymizer.anonymize(TEXT)
+
+
+def test_engine_swapped_after_warm_up():
+    anonymizer = make_anonymizer()
+    assert anonymizer.initialize(progressive=True)
+    before = anonymizer.anonymize(TEXT)
+
+    changes = []
+    thread = anonymizer.start_warm_up(on_engine_change=changes.append)
+    assert thread is not None
+    thread.join(timeout=10)
+
+    assert changes == [anonymizer.active_engine]
+    assert anonymizer.pattern_engine is None
+    assert not isinstance(anonymizer.analyzer.nlp_engine, DummyNlpEngine)
+    assert anonymizer.anonymize(TEXT) == before
+
+
+def test_no_warm_up_in_fast_mode():
+    anonymizer = TextAnonymizer(language="de")
+    anonymizer.recognition_mode = 'fast'
+    assert anonymizer.initialize(progressive=True)
+    assert anonymizer.start_warm_up() is None
+
+
+def main():
+    tests = [test_patterns_available_immediately, test_engine_swapped_after_warm_up, test_no_warm_up_in_fast_mode]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()
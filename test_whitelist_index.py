@@ -0,0 +1,57 @@
+"""
+Test: Whitelist-Index (Wörter + Aho-Corasick für Phrasen)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.whitelist import WhitelistIndex
+
+
+def test_exact_and_word_matches():
+    index = WhitelistIndex(["Bundestag", "Deutsche Bank", "im", "AOK"])
+    assert index.contains_term("deutsche bank")
+    assert index.contains_term("AOK")
+    assert index.find_word("Herr Bundestag Müller") == "bundestag"
+    # Nur ganze Wörter: "im" steckt in "Maximilian", darf aber nicht matchen
+    assert index.find_word("Herr Maximilian Müller") is None
+
+
+def test_phrase_matches():
+    index = WhitelistIndex(["Deutsche Bank", "Deutsche Bahn", "Landgericht München I", "bank"])
+    assert index.find_word("Frau Deutsche Bank Filiale") in ("deutsche bank", "bank")
+    index = WhitelistIndex(["Deutsche Bank", "Deutsche Bahn", "Landgericht München I"])
+    assert index.find_word("Herr Dr. Deutsche Bahn") == "deutsche bahn"
+    assert index.find_word("vor dem Landgericht München I") == "landgericht münchen i"
+    # Phrase nur an Wortgrenzen
+    assert index.find_word("Deutsche Bankhaus") is None
+    assert index.find_word("Landgericht München II") is None
+
+
+def test_large_whitelist():
+    terms = [f"Organisation {i}" for i in range(5000)] + [f"Begriff{i}" for i in range(5000)]
+    index = WhitelistIndex(terms)
+    assert len(index) == 10000
+    assert index.find_word("Herr Begriff4711 Meier") == "begriff4711"
+    assert index.find_word("bei Organisation 4999 GmbH") == "organisation 4999"
+    assert index.find_word("Herr Max Mustermann") is None
+    assert index.build_time >= 0 and index.memory_size > 0
+
+
+def main():
+    tests = [test_exact_and_word_matches, test_phrase_matches, test_large_whitelist]
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASS: {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAIL: {test.__name__} ({e})")
+
+    print(f"\n{passed}/{len(tests)} Tests bestanden")
+
+
+if __name__ == '__main__':
+    main()